@@ -0,0 +1 @@
+"""Benchmarks do pacote dados_cvm (ver `python -m benchmarks.run --help`)."""
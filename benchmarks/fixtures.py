@@ -0,0 +1,195 @@
+"""Geração de ZIPs/CSVs sintéticos no formato dos arquivos da CVM (DFP/ITR).
+
+Os arquivos seguem o layout oficial: latin1, separador `;`, os mesmos cabeçalhos
+dos demonstrativos e um CSV de índice por ZIP (ex.: itr_cia_aberta_2024.csv).
+As linhas são geradas em blocos vetorizados e gravadas direto no ZIP, de modo que
+é possível gerar dezenas de milhões de linhas sem mantê-las em memória.
+"""
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Cabeçalhos oficiais (BPA/BPP não têm DT_INI_EXERC; DMPL tem COLUNA_DF)
+_POSITION_COLS = [
+    "CNPJ_CIA", "DT_REFER", "VERSAO", "DENOM_CIA", "CD_CVM", "GRUPO_DFP", "MOEDA",
+    "ESCALA_MOEDA", "ORDEM_EXERC", "DT_FIM_EXERC", "CD_CONTA", "DS_CONTA", "VL_CONTA",
+    "ST_CONTA_FIXA",
+]
+_PERIOD_COLS = _POSITION_COLS[:9] + ["DT_INI_EXERC"] + _POSITION_COLS[9:]
+_DMPL_COLS = _PERIOD_COLS[:-1] + ["COLUNA_DF", "ST_CONTA_FIXA"]
+_INDEX_COLS = [
+    "CNPJ_CIA", "DT_REFER", "VERSAO", "DENOM_CIA", "CD_CVM", "CATEG_DOC", "ID_DOC",
+    "DT_RECEB", "LINK_DOC",
+]
+
+# Prefixo do plano de contas de cada demonstrativo
+_PREFIXOS: Dict[str, str] = {
+    "BPA": "1", "BPP": "2", "DRE": "3", "DRA": "4", "DMPL": "5", "DFC_MD": "6",
+    "DFC_MI": "6", "DVA": "7",
+}
+STATEMENTS: Tuple[str, ...] = tuple(_PREFIXOS)
+SCOPES: Tuple[str, ...] = ("con", "ind")
+
+BLOCK_ROWS = 200_000
+# Contas por companhia e exercício (o plano sintético tem o dobro, ver `_blocks`)
+CONTAS = 60
+
+
+def plano_de_contas(statement: str, n: int = 60) -> List[str]:
+    """Códigos de conta hierárquicos (ex.: 1, 1.01, 1.01.01, ...) de um demonstrativo."""
+    raiz = _PREFIXOS[statement]
+    contas = [raiz]
+    i = 1
+    while len(contas) < n:
+        nivel1 = f"{raiz}.{i:02d}"
+        contas.append(nivel1)
+        for j in range(1, 6):
+            if len(contas) >= n:
+                break
+            contas.append(f"{nivel1}.{j:02d}")
+        i += 1
+    return contas
+
+
+def _columns(statement: str) -> List[str]:
+    if statement == "DMPL":
+        return _DMPL_COLS
+    return _POSITION_COLS if statement in ("BPA", "BPP") else _PERIOD_COLS
+
+
+def _dates(doc_type: str, ano: int) -> List[str]:
+    if doc_type == "dfp":
+        return [f"{ano}-12-31"]
+    return [f"{ano}-03-31", f"{ano}-06-30", f"{ano}-09-30"]
+
+
+def rows_per_company(doc_type: str, statement: str) -> int:
+    """Linhas de cada companhia: contas × exercícios (ÚLTIMO/PENÚLTIMO) × datas × 2."""
+    return CONTAS * 2 * len(_dates(doc_type, 2000)) * 2
+
+
+def n_companies(doc_type: str, statement: str, n_rows: int) -> int:
+    """Número de companhias necessárias para `n_rows` linhas."""
+    return max(1, -(-n_rows // rows_per_company(doc_type, statement)))
+
+
+def _blocks(doc_type: str, statement: str, ano: int, n_rows: int, seed: int) -> Iterator[pd.DataFrame]:
+    """Blocos de linhas do demonstrativo, gerados de forma vetorizada.
+
+    As linhas ficam agrupadas por companhia, como nos arquivos oficiais. Uma em cada
+    sete companhias tem uma reapresentação (VERSAO 2 das mesmas contas); as demais
+    usam um plano de contas com o dobro de contas, sem linhas repetidas.
+    """
+    rng = np.random.default_rng(seed)
+    plano = plano_de_contas(statement, 2 * CONTAS)
+    contas = np.array(plano)
+    descricoes = np.array([f"Conta {c} - Descrição Sintética" for c in plano])
+    datas = np.array(_dates(doc_type, ano))
+    n, d = CONTAS, len(datas)
+    bloco = rows_per_company(doc_type, statement)
+    cols = _columns(statement)
+    for start in range(0, n_rows, BLOCK_ROWS):
+        size = min(BLOCK_ROWS, n_rows - start)
+        pos = np.arange(start, start + size)
+        cia, local = pos // bloco, pos % bloco
+        reapresentada = cia % 7 == 0
+        # Companhia com reapresentação: N contas × 2 exercícios × D datas × 2 versões
+        # Demais: 2N contas × 2 exercícios × D datas, versão 1
+        largura = np.where(reapresentada, n, 2 * n)
+        conta = local % largura
+        ultimo = (local // largura) % 2 == 0
+        data = datas[(local // (2 * largura)) % d]
+        versao = np.where(reapresentada, 1 + local // (2 * n * d), 1)
+        # Textos por companhia montados uma vez por bloco e indexados
+        primeira = int(cia[0])
+        ids = np.arange(primeira, int(cia[-1]) + 1)
+        cnpjs = np.array([f"{i:08d}/0001-00" for i in ids])
+        nomes = np.array([f"COMPANHIA SINTÉTICA {i}" for i in ids])
+        block = {
+            "CNPJ_CIA": cnpjs[cia - primeira],
+            "DT_REFER": data,
+            "VERSAO": versao,
+            "DENOM_CIA": nomes[cia - primeira],
+            "CD_CVM": 1000 + cia,
+            "GRUPO_DFP": np.full(size, "DF Consolidado - Balanço Patrimonial Ativo"),
+            "MOEDA": np.full(size, "REAL"),
+            "ESCALA_MOEDA": np.where(cia % 2 == 0, "MIL", "UNIDADE"),
+            "ORDEM_EXERC": np.where(ultimo, "ÚLTIMO", "PENÚLTIMO"),
+            "DT_INI_EXERC": np.where(ultimo, f"{ano}-01-01", f"{ano - 1}-01-01"),
+            "DT_FIM_EXERC": np.where(ultimo, f"{ano}-12-31", f"{ano - 1}-12-31"),
+            "CD_CONTA": contas[conta],
+            "DS_CONTA": descricoes[conta],
+            "VL_CONTA": np.round(rng.normal(1e6, 5e6, size), 2),
+            "COLUNA_DF": np.full(size, "Patrimônio Líquido"),
+            "ST_CONTA_FIXA": np.where(conta < 10, "S", "N"),
+        }
+        yield pd.DataFrame({c: block[c] for c in cols})
+
+
+def write_statement_csv(fh, doc_type: str, statement: str, ano: int, n_rows: int, seed: int = 0) -> None:
+    """Grava o CSV de um demonstrativo (latin1, `;`) em um arquivo binário aberto."""
+    fh.write((";".join(_columns(statement)) + "\n").encode("latin1"))
+    for block in _blocks(doc_type, statement, ano, n_rows, seed):
+        fh.write(block.to_csv(sep=";", header=False, index=False).encode("latin1"))
+
+
+def make_zip(
+    dest: str | Path,
+    doc_type: str,
+    ano: int,
+    rows_per_csv: int,
+    statements: Tuple[str, ...] = STATEMENTS,
+    seed: int = 0,
+) -> Path:
+    """Gera um ZIP sintético no layout da CVM (ex.: dfp_cia_aberta_2024.zip).
+
+    Args:
+        dest: Diretório de destino.
+        doc_type: "dfp" ou "itr".
+        ano: Ano de referência.
+        rows_per_csv: Linhas de cada CSV de demonstrativo (o número de companhias é
+            derivado dele, ver `rows_per_company`).
+        statements: Demonstrativos incluídos (cada um nos escopos con e ind).
+        seed: Semente do gerador de valores.
+
+    Returns:
+        Path: Caminho do ZIP gerado.
+    """
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    path = dest / f"{doc_type}_cia_aberta_{ano}.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for i, statement in enumerate(statements):
+            for j, scope in enumerate(SCOPES):
+                name = f"{doc_type}_cia_aberta_{statement}_{scope}_{ano}.csv"
+                with zf.open(name, "w", force_zip64=True) as fh:
+                    write_statement_csv(fh, doc_type, statement, ano, rows_per_csv, seed + 2 * i + j)
+        companhias = max(n_companies(doc_type, st, rows_per_csv) for st in statements)
+        with zf.open(f"{doc_type}_cia_aberta_{ano}.csv", "w") as fh:
+            fh.write((";".join(_INDEX_COLS) + "\n").encode("latin1"))
+            for cia in range(companhias):
+                for data in _dates(doc_type, ano):
+                    for versao in ((1, 2) if cia % 7 == 0 else (1,)):
+                        linha = [
+                            f"{cia:08d}/0001-00", data, str(versao), f"COMPANHIA SINTÉTICA {cia}",
+                            str(1000 + cia), doc_type.upper(), f"{cia}{versao}", data, "http://localhost",
+                        ]
+                        fh.write((";".join(linha) + "\n").encode("latin1"))
+    return path
+
+
+def make_tree(
+    root: str | Path, anos: List[int], doc_types: List[str], rows_per_csv: int, **kwargs
+) -> Path:
+    """Gera os ZIPs no mesmo caminho do portal (dados/CIA_ABERTA/DOC/<TIPO>/DADOS/)."""
+    root = Path(root)
+    for doc_type in doc_types:
+        dest = root / "dados" / "CIA_ABERTA" / "DOC" / doc_type.upper() / "DADOS"
+        for ano in anos:
+            make_zip(dest, doc_type, ano, rows_per_csv, **kwargs)
+    return root
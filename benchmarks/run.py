@@ -0,0 +1,260 @@
+"""Benchmarks das etapas do pipeline (download → extração → leitura → filtros).
+
+Gera um ZIP sintético no layout da CVM, serve-o por um servidor HTTP local e mede
+tempo (melhor de N repetições) e pico de memória alocada de cada etapa: no heap
+do Python e do NumPy (tracemalloc) e, com pyarrow instalado, no pool nativo do
+Arrow, que o tracemalloc não enxerga. O resultado é gravado em JSON e pode ser
+comparado com uma execução anterior.
+
+Uso:
+    python -m benchmarks.run --rows 1000000
+    python -m benchmarks.run --rows 1000000 --compare benchmarks/results/<anterior>.json
+
+Com `--fail-on-regression`, o processo termina com código 1 se alguma etapa ficar
+mais lenta que o limite (`--threshold`, 10% por padrão) em relação à comparação.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+import pandas as pd  # noqa: E402
+
+from benchmarks.fixtures import make_tree  # noqa: E402
+from benchmarks.server import LocalCVMServer  # noqa: E402
+from dados_cvm.balanco import Balanco  # noqa: E402
+from dados_cvm.client import CVMClient  # noqa: E402
+from dados_cvm.endpoints import DocType, Scope, StatementType, UrlBuilder  # noqa: E402
+from dados_cvm.extract import ZipExtractor  # noqa: E402
+from dados_cvm.index import StatementIndex  # noqa: E402
+from dados_cvm.normalize import standardize_dataframe  # noqa: E402
+from dados_cvm.read import CSVReader, _has_module  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def measure(func: Callable[[], Any], repeat: int, memory: bool = True) -> Dict[str, float]:
+    """Tempo (melhor e média de `repeat` execuções) e pico de memória de `func`."""
+    times: List[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    result = {"seconds": min(times), "mean_seconds": sum(times) / len(times)}
+    if memory:
+        # Execução separada: o tracemalloc deixa o código mais lento
+        gc.collect()
+        with _arrow_peak() as arrow:
+            tracemalloc.start()
+            try:
+                func()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        result["peak_mb"] = peak / 2**20
+        if "peak" in arrow:
+            result["arrow_peak_mb"] = arrow["peak"] / 2**20
+    return result
+
+
+@contextmanager
+def _arrow_peak() -> Iterator[Dict[str, int]]:
+    """Pico do pool de memória do pyarrow durante o bloco (alocações nativas).
+
+    O pool padrão é trocado por um proxy dele, que contabiliza só o que é alocado
+    enquanto o bloco roda. Sem pyarrow, nada é medido.
+    """
+    stats: Dict[str, int] = {}
+    if not _has_module("pyarrow"):
+        yield stats
+        return
+    import pyarrow as pa
+
+    previous = pa.default_memory_pool()
+    pool = pa.proxy_memory_pool(previous)
+    pa.set_memory_pool(pool)
+    try:
+        yield stats
+    finally:
+        pa.set_memory_pool(previous)
+        stats["peak"] = pool.max_memory()
+
+
+def run(rows: int, repeat: int, doc_type: str, ano: int, workdir: Path) -> Dict[str, Dict[str, float]]:
+    """Executa todas as etapas e retorna as medições por etapa."""
+    www = workdir / "www"
+    t0 = time.perf_counter()
+    make_tree(www, [ano], [doc_type], rows_per_csv=rows, statements=("BPA", "DRE"))
+    print(f"fixtures: {time.perf_counter() - t0:.1f}s")
+
+    doc = DocType(doc_type)
+    stages: Dict[str, Dict[str, float]] = {}
+    data_dir = workdir / "data"
+    client = CVMClient(data_dir=data_dir)
+    zip_path = data_dir / UrlBuilder.zip_filename(doc, ano)
+    csv_name = f"{doc_type}_cia_aberta_BPA_con_{ano}.csv"
+    csv_path = data_dir / csv_name
+
+    with LocalCVMServer(www) as server:
+        UrlBuilder.BASE_URL = server.base_url  # type: ignore[misc]
+        stages["download_streaming"] = measure(
+            lambda: client.get_zip(ano, doc, extrair=False, streaming=True), repeat
+        )
+        stages["download_4_parts"] = measure(
+            lambda: CVMClient(data_dir=data_dir, download_parts=4).get_zip(
+                ano, doc, extrair=False, streaming=True
+            ),
+            repeat,
+            memory=False,
+        )
+
+    stages["extract_all"] = measure(lambda: ZipExtractor.extract_all(zip_path, data_dir), repeat)
+    stages["read_csv_c"] = measure(
+        lambda: CSVReader.read_csv(csv_path, statement=StatementType.BPA, sep=";"), repeat
+    )
+    if _has_module("pyarrow"):
+        stages["read_csv_pyarrow"] = measure(
+            lambda: CSVReader.read_csv(csv_path, statement=StatementType.BPA, sep=";", engine="pyarrow"), repeat
+        )
+    stages["read_csv_from_zip"] = measure(
+        lambda: CSVReader.read_csv(zip_path, statement=StatementType.BPA, sep=";", member=csv_name), repeat
+    )
+    stages["read_csv_chunks"] = measure(
+        lambda: sum(len(c) for c in CSVReader.read_csv(csv_path, statement=StatementType.BPA, sep=";", chunksize=250_000)),
+        repeat,
+    )
+    stages["load_latest_only"] = measure(
+        lambda: client.load_statement(ano, StatementType.BPA, Scope.CON, doc, latest_only=True), repeat
+    )
+
+    stages["aggregate_chunks"] = measure(
+        lambda: client.aggregate(
+            StatementType.BPA, Scope.CON, doc, [ano], by=["CD_CVM", "CD_CONTA"], agg={"VL_CONTA": "sum"}
+        ),
+        repeat,
+    )
+
+    if _has_module("pyarrow"):
+        # Leitura do cache colunar: Parquet (descomprime) vs Arrow com memory map
+        for fmt in ("parquet", "arrow"):
+            columnar = CVMClient(data_dir=data_dir, columnar_dir=workdir / f"columnar_{fmt}", columnar_format=fmt)
+            columnar.load_balanco(ano, StatementType.BPA, Scope.CON, doc)  # converte o CSV uma vez
+            stages[f"load_balanco_{fmt}"] = measure(
+                lambda c=columnar: c.load_balanco(ano, StatementType.BPA, Scope.CON, doc), repeat
+            )
+
+    df = CSVReader.read_csv(csv_path, statement=StatementType.BPA, sep=";")
+    assert isinstance(df, pd.DataFrame)
+    cd_cvm = int(df["CD_CVM"].iloc[len(df) // 2])
+    stages["standardize_dataframe"] = measure(lambda: standardize_dataframe(df), repeat)
+    stages["balanco_filters"] = measure(
+        lambda: Balanco(df)
+        .filtrar_por_cd_cvm(cd_cvm)
+        .filtrar_por_exercicio("ÚLTIMO")
+        .filtrar_por_data_referencia(f"01/01/{ano}")
+        .get_dataframe(),
+        repeat,
+    )
+    sorted_df, index = StatementIndex.build(df)
+    stages["balanco_filters_indexed"] = measure(
+        lambda: Balanco(sorted_df, index=index)
+        .filtrar_por_cd_cvm(cd_cvm)
+        .filtrar_por_exercicio("ÚLTIMO")
+        .get_dataframe(),
+        repeat,
+    )
+    stages["statement_cube"] = measure(lambda: Balanco(df).to_cube(), repeat)
+    return stages
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any], threshold: float) -> List[str]:
+    """Imprime a variação por etapa e retorna as etapas que regrediram."""
+    regressions: List[str] = []
+    print(f"\n{'etapa':<28}{'anterior':>12}{'atual':>12}{'variação':>12}")
+    for stage, cur in current["stages"].items():
+        prev = previous.get("stages", {}).get(stage)
+        if prev is None:
+            print(f"{stage:<28}{'-':>12}{cur['seconds']:>12.4f}{'nova':>12}")
+            continue
+        ratio = cur["seconds"] / prev["seconds"] - 1 if prev["seconds"] else 0.0
+        flag = "  <-- regressão" if ratio > threshold else ""
+        print(f"{stage:<28}{prev['seconds']:>12.4f}{cur['seconds']:>12.4f}{ratio:>+11.1%}{flag}")
+        if ratio > threshold:
+            regressions.append(stage)
+    return regressions
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks do pipeline dados_cvm.")
+    parser.add_argument("--rows", type=int, default=500_000, help="Linhas por CSV de demonstrativo.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por etapa.")
+    parser.add_argument("--doc-type", choices=["dfp", "itr"], default="dfp")
+    parser.add_argument("--ano", type=int, default=2024)
+    parser.add_argument("--output", type=Path, default=None, help="Arquivo JSON de saída.")
+    parser.add_argument("--compare", type=Path, default=None, help="JSON de uma execução anterior.")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Limite de regressão (0.10 = 10%%).")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="dados_cvm_bench_") as tmp:
+        stages = run(args.rows, args.repeat, args.doc_type, args.ano, Path(tmp))
+
+    result = {
+        "meta": {
+            "rows_per_csv": args.rows,
+            "repeat": args.repeat,
+            "doc_type": args.doc_type,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+        },
+        "stages": stages,
+    }
+    for stage, m in stages.items():
+        mem = f"{m['peak_mb']:9.1f} MiB" if "peak_mb" in m else ""
+        if m.get("arrow_peak_mb"):
+            mem += f" + {m['arrow_peak_mb']:.1f} MiB (arrow)"
+        print(f"{stage:<28}{m['seconds']:9.4f}s {mem}")
+
+    output = args.output or RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}-{args.rows}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"\nResultados gravados em {output}")
+
+    if args.compare:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(result, previous, args.threshold)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
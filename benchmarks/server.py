@@ -0,0 +1,110 @@
+"""Servidor HTTP local que imita o portal de dados da CVM nos benchmarks.
+
+Serve os arquivos de um diretório com `ETag`, `Last-Modified`, respostas 304 e
+`Range`, o suficiente para exercitar o `ZipDownloader` sem acesso à rede.
+"""
+from __future__ import annotations
+
+import email.utils
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Tuple
+
+CHUNK = 1024 * 1024
+
+
+def _handler(root: Path):
+    etags: Dict[Tuple[str, float], str] = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:  # silencioso
+            pass
+
+        def do_HEAD(self) -> None:
+            self._serve(head=True)
+
+        def do_GET(self) -> None:
+            self._serve(head=False)
+
+        def _etag(self, path: Path) -> str:
+            key = (str(path), path.stat().st_mtime)
+            if key not in etags:
+                digest = hashlib.md5()
+                with open(path, "rb") as fh:
+                    for chunk in iter(lambda: fh.read(CHUNK), b""):
+                        digest.update(chunk)
+                etags[key] = f'"{digest.hexdigest()}"'
+            return etags[key]
+
+        def _serve(self, head: bool) -> None:
+            path = root / self.path.split("?")[0].lstrip("/")
+            if not path.is_file():
+                self.send_response(404)
+                self.end_headers()
+                return
+            size = path.stat().st_size
+            etag = self._etag(path)
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            start, end = 0, size - 1
+            rng = self.headers.get("Range")
+            if rng and rng.startswith("bytes="):
+                a, b = rng[6:].split("-")
+                start, end = int(a), (int(b) if b else size - 1)
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Type", "application/zip")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", email.utils.formatdate(path.stat().st_mtime, usegmt=True))
+            self.send_header("Accept-Ranges", "bytes")
+            self.end_headers()
+            if head:
+                return
+            with open(path, "rb") as fh:
+                fh.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = fh.read(min(CHUNK, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+
+    return Handler
+
+
+class LocalCVMServer:
+    """Servidor em uma thread daemon; use como context manager.
+
+    Exemplo:
+        with LocalCVMServer("/tmp/bench/www") as server:
+            UrlBuilder.BASE_URL = server.base_url
+    """
+
+    def __init__(self, root: str | Path, port: int = 0):
+        self.root = Path(root)
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _handler(self.root))
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Template de URL no formato de `UrlBuilder.BASE_URL`."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/dados/CIA_ABERTA/DOC/{{TIPO}}/DADOS/{{tipo}}_cia_aberta_{{ANO}}.zip"
+
+    def __enter__(self) -> 'LocalCVMServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Final, Iterable, List, Literal, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .dedup import LatestVersionFilter
+from .endpoints import StatementType
+from .metrics import Instrumentation
+from .read import CSVEngine, CSVReader
+from .utils import Filters, build_mask, concat_frames
+
+__all__ = ["Aggregator", "AggFunc", "aggregate_source"]
+
+AggFunc = Literal["sum", "count", "min", "max", "mean", "latest"]
+
+_FUNCS: Final[tuple[str, ...]] = ("sum", "count", "min", "max", "mean", "latest")
+
+# Estado parcial de cada função e a redução que combina dois estados
+_STATE_OPS: Final[Dict[str, str]] = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+
+
+class Aggregator:
+    """Agregações group-by incrementais, com estados parciais combináveis.
+
+    Cada chunk vira um estado parcial pequeno (uma linha por grupo) que pode ser
+    combinado com outros estados em qualquer agrupamento, de modo que o resultado
+    final é o mesmo do `groupby` sobre o arquivo inteiro, mas o pico de memória
+    depende do tamanho do chunk e do número de grupos, não do tamanho do arquivo.
+
+    Funções suportadas (estado parcial entre parênteses):
+    - "sum" (soma), "count" (valores não nulos), "min", "max";
+    - "mean" (soma e contagem);
+    - "latest": valor da linha mais recente do grupo segundo `order_by` (ex.: maior
+      DT_REFER e, no empate, maior VERSAO). Empates completos ficam com a última linha
+      na ordem de leitura.
+
+    Args:
+        by: Colunas do agrupamento (ex.: ["CD_CVM", "CD_CONTA"]). Linhas com chave
+            nula são descartadas, como no `groupby` do pandas.
+        agg: Coluna -> função ou lista de funções (ex.: {"VL_CONTA": ["sum", "latest"]}).
+            Com uma única função a coluna do resultado mantém o nome; com uma lista,
+            as colunas são `<coluna>_<função>`.
+        order_by: Colunas que definem a linha mais recente em "latest".
+
+    Raises:
+        ValueError: se `by` ou `agg` estiverem vazios ou houver função desconhecida.
+
+    Exemplo:
+        Soma e último valor de cada conta por companhia, chunk a chunk:
+
+            agg = Aggregator(["CD_CVM", "CD_CONTA"], {"VL_CONTA": ["sum", "latest"]})
+            state = agg.reduce(client.load_statement(..., chunks=True))
+            df = agg.finalize(state)
+    """
+
+    def __init__(
+        self,
+        by: Sequence[str],
+        agg: Mapping[str, AggFunc | Sequence[AggFunc]],
+        order_by: Sequence[str] = ("DT_REFER", "VERSAO"),
+    ):
+        if not by:
+            raise ValueError("Informe ao menos uma coluna em `by`.")
+        if not agg:
+            raise ValueError("Informe ao menos uma agregação em `agg`.")
+        self.by: List[str] = list(by)
+        self.order_by: List[str] = list(order_by)
+        self.agg: Dict[str, List[str]] = {}
+        self._names: Dict[tuple[str, str], str] = {}
+        for col, funcs in agg.items():
+            lista = [funcs] if isinstance(funcs, str) else list(funcs)
+            for func in lista:
+                if func not in _FUNCS:
+                    raise ValueError(f"Agregação inválida: {func!r}. Use uma de {_FUNCS}.")
+                self._names[(col, func)] = col if isinstance(funcs, str) else f"{col}_{func}"
+            self.agg[col] = lista
+        self._latest = [col for col, funcs in self.agg.items() if "latest" in funcs]
+        if self._latest and not self.order_by:
+            raise ValueError("A agregação 'latest' requer colunas em `order_by`.")
+
+    def columns(self) -> List[str]:
+        """Colunas que precisam ser lidas para a agregação."""
+        extra = self.order_by if self._latest else []
+        return list(dict.fromkeys([*self.by, *self.agg, *extra]))
+
+    # -----------------------------
+    # Estados parciais
+    # -----------------------------
+    def partial(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Estado parcial de um chunk: uma linha por grupo, com as colunas de `by`."""
+        ops = {name: (col, func) for name, (col, func) in self._state_columns().items()}
+        latest = {f"__order__{c}": c for c in self.order_by} if self._latest else {}
+        latest.update({f"{c}__latest": c for c in self._latest})
+        return self._reduce(df.dropna(subset=self.by), ops, latest, self.order_by)
+
+    def merge(self, *states: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """Combina estados parciais (None é o estado vazio) em um único estado.
+
+        Estados de "latest" com a mesma ordem completam o empate a favor do estado
+        passado por último, o que preserva a ordem de leitura.
+        """
+        frames = [s for s in states if s is not None]
+        if len(frames) <= 1:
+            return frames[0] if frames else None
+        ops = {name: (name, _STATE_OPS[func]) for name, (_, func) in self._state_columns().items()}
+        order = [f"__order__{c}" for c in self.order_by] if self._latest else []
+        latest = {c: c for c in order + [f"{c}__latest" for c in self._latest]}
+        return self._reduce(concat_frames(frames), ops, latest, order)
+
+    def reduce(self, chunks: Iterable[pd.DataFrame], state: Optional[pd.DataFrame] = None) -> Optional[pd.DataFrame]:
+        """Acumula os chunks em um estado, mantendo em memória só o estado e o chunk atual."""
+        for chunk in chunks:
+            state = self.merge(state, self.partial(chunk))
+        return state
+
+    def finalize(self, state: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """Resultado final, indexado pelas colunas de `by` e ordenado como no `groupby`."""
+        if state is None:
+            state = pd.DataFrame(columns=[*self.by, *self._state_columns(), *(f"{c}__latest" for c in self._latest)])
+        state = state.copy()
+        for col in self.by:
+            # Categorias unidas entre chunks ficam fora de ordem; o groupby ordena pelos valores
+            if isinstance(state[col].dtype, pd.CategoricalDtype):
+                state[col] = state[col].cat.set_categories(sorted(state[col].cat.categories))
+        state = state.set_index(self.by).sort_index()
+
+        result = pd.DataFrame(index=state.index)
+        for (col, func), name in self._names.items():
+            if func == "mean":
+                result[name] = state[f"{col}__sum"] / state[f"{col}__count"]
+            else:
+                result[name] = state[f"{col}__{func}"]
+        return result
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    def _state_columns(self) -> Dict[str, tuple[str, str]]:
+        """Colunas do estado das reduções numéricas: nome -> (coluna, função)."""
+        named: Dict[str, tuple[str, str]] = {}
+        for col, funcs in self.agg.items():
+            for func in funcs:
+                parts = ("sum", "count") if func == "mean" else (func,)
+                for part in parts:
+                    if part in _STATE_OPS:
+                        named[f"{col}__{part}"] = (col, part)
+        return named
+
+    def _reduce(
+        self,
+        df: pd.DataFrame,
+        ops: Dict[str, tuple[str, str]],
+        latest: Dict[str, str],
+        order: List[str],
+    ) -> pd.DataFrame:
+        """Um único groupby: reduções `ops` (nome -> (coluna, função)) e, para `latest`
+        (nome -> coluna), os valores da última linha de cada grupo após ordenar por `order`.
+        """
+        if latest:
+            df = df.sort_values(order, kind="stable", na_position="first")
+        grouped = df.groupby(self.by, observed=True, sort=False)
+        state = grouped.agg(**ops) if ops else grouped.size().to_frame("__size")
+        if latest:
+            # Com sort=False, o número de cada grupo segue a ordem das linhas do estado
+            ids = grouped.ngroup().to_numpy()
+            rows = np.flatnonzero(~pd.Series(ids).duplicated(keep="last").to_numpy())
+            last = np.empty(len(state), dtype=np.intp)
+            last[ids[rows]] = rows
+            for name, col in latest.items():
+                state[name] = df[col].iloc[last].array
+        return state.drop(columns="__size", errors="ignore").reset_index()
+
+
+def aggregate_source(
+    source: str | Path,
+    member: Optional[str],
+    statement: StatementType,
+    aggregator: Aggregator,
+    filters: Optional[Filters] = None,
+    latest_only: bool = False,
+    chunksize: int = 250_000,
+    sep: Optional[str] = ";",
+    encoding: Optional[str] = "latin1",
+    engine: CSVEngine = "c",
+    instrumentation: Optional[Instrumentation] = None,
+) -> Optional[pd.DataFrame]:
+    """Estado parcial de um CSV de demonstrativo, lido em chunks.
+
+    Função de módulo para poder rodar em um pool de processos (ver `CVMClient.aggregate`).
+    Com `latest_only`, uma primeira passada lê só as colunas-chave para descartar as
+    versões reapresentadas (ver `LatestVersionFilter`).
+    """
+    filter_cols = list(filters or [])
+
+    def _chunks(usecols: List[str]) -> Iterable[pd.DataFrame]:
+        for chunk in CSVReader.read_csv(
+            source,
+            chunksize=chunksize,
+            usecols=usecols,
+            statement=statement,
+            member=member,
+            sep=sep,
+            encoding=encoding,
+            engine=engine,
+            instrumentation=instrumentation,
+        ):
+            mask = build_mask(chunk, filters)
+            yield chunk if mask is None else chunk[mask]
+
+    dedup: Optional[LatestVersionFilter] = None
+    if latest_only:
+        dedup = LatestVersionFilter()
+        for keys in _chunks(list(dict.fromkeys(LatestVersionFilter.columns() + filter_cols))):
+            dedup.update(keys)
+
+    cols = aggregator.columns() + filter_cols + (LatestVersionFilter.columns() if latest_only else [])
+    chunks = _chunks(list(dict.fromkeys(cols)))
+    if dedup is not None:
+        chunks = (chunk[dedup.is_latest(chunk)] for chunk in chunks)
+    return aggregator.reduce(chunks)
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, Callable, Final, Iterable, List, Optional, TypeVar
+
+import pandas as pd
+import requests
+
+from .client import CVMClient, ZipFetchResult
+from .download import RateLimiter, ZipDownloader
+from .endpoints import DocType, Scope, StatementType, UrlBuilder
+from .extract import ZipExtractor
+from .metrics import Instrumentation
+from .read import _import_optional
+
+__all__ = ["AsyncCVMClient"]
+
+_T = TypeVar("_T")
+
+# Bytes acumulados em memória antes de cada gravação no executor
+_WRITE_BUFFER_BYTES: Final[int] = 8 * ZipDownloader.CHUNK_SIZE
+
+
+class AsyncCVMClient:
+    """Versão assíncrona do `CVMClient`, para uso dentro de um event loop do asyncio.
+
+    Os downloads usam um `httpx.AsyncClient` com pool de conexões e são gravados em
+    disco em blocos, no executor, sem bloquear o loop. Extração e leitura dos CSVs (CPU e disco)
+    rodam em um executor, via `loop.run_in_executor`. Um semáforo limita quantas
+    operações (downloads e leituras) ficam em andamento ao mesmo tempo.
+
+    Cancelar a tarefa (`task.cancel()` ou timeout do `asyncio`) interrompe o download
+    e remove o arquivo parcial; nada fica registrado no cache. Uma leitura já entregue
+    ao executor termina em segundo plano, mas o seu resultado é descartado.
+
+    Requer o pacote opcional `httpx`.
+
+    Args:
+        data_dir, cache_dir, cache_max_bytes, cache_max_age, columnar_dir, columnar_format:
+            Repassados para o `CVMClient` interno (mesmo layout de arquivos e caches).
+        max_concurrency (int, optional): Máximo de operações simultâneas e de conexões
+            HTTP abertas. Padrão é 4.
+        executor (Executor, optional): Executor (de threads) para extração e leitura. Se
+            None, usa o executor padrão do loop.
+        http_client (httpx.AsyncClient, optional): Cliente HTTP a reutilizar. Se None, um
+            cliente é criado e fechado em `aclose()`.
+        rate_limiter (RateLimiter, optional): Limite de requisições por host. Se None, o
+            `CVMClient` interno cria o seu (ver `CVMClient`).
+        instrumentation (Instrumentation, optional): Recebe as medições das etapas, como
+            no `CVMClient`.
+
+    Exemplo:
+        async with AsyncCVMClient(data_dir="./arquivos", max_concurrency=8) as client:
+            await client.get_zips(range(2015, 2026), [DocType.DFP, DocType.ITR])
+            df = await client.load_statement(2024, StatementType.BPA, Scope.CON, DocType.DFP)
+
+    Raises:
+        ImportError: se o `httpx` não estiver instalado.
+    """
+
+    def __init__(
+        self,
+        data_dir: str | Path = "./arquivos",
+        cache_dir: Optional[str | Path] = None,
+        cache_max_bytes: Optional[int] = None,
+        cache_max_age: Optional[float] = 24 * 60 * 60,
+        columnar_dir: Optional[str | Path] = None,
+        columnar_format: str = "parquet",
+        max_concurrency: int = 4,
+        executor: Optional[Executor] = None,
+        http_client: Any = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency deve ser >= 1.")
+        httpx = _import_optional("httpx", "AsyncCVMClient")
+        self._client = CVMClient(
+            data_dir=data_dir,
+            cache_dir=cache_dir,
+            cache_max_bytes=cache_max_bytes,
+            cache_max_age=cache_max_age,
+            columnar_dir=columnar_dir,
+            columnar_format=columnar_format,  # type: ignore[arg-type]
+            rate_limiter=rate_limiter,
+            instrumentation=instrumentation,
+        )
+        self._limiter = self._client.rate_limiter
+        self._executor = executor
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            timeout=ZipDownloader.TIMEOUT_SECONDS,
+            follow_redirects=True,
+            headers={"User-Agent": ZipDownloader.USER_AGENT},
+        )
+
+    async def __aenter__(self) -> 'AsyncCVMClient':
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Fecha o cliente HTTP (se tiver sido criado por esta instância)."""
+        if self._owns_http:
+            await self._http.aclose()
+
+    @property
+    def path_data_dir(self) -> Path:
+        return self._client.path_data_dir
+
+    # -----------------------------
+    # Download / Extração
+    # -----------------------------
+    async def get_zip(
+        self,
+        ano: int,
+        doc_type: DocType,
+        extrair: bool = True,
+        refresh: bool = False,
+    ) -> Path:
+        """Baixa o ZIP em disco (no cache, se configurado) e opcionalmente o extrai.
+
+        Equivale a `CVMClient.get_zip(streaming=True)`: com cache, um ZIP dentro de
+        `cache_max_age` não gera acesso à rede e um ZIP vencido é revalidado com uma
+        requisição condicional. Sem cache, um ZIP já presente em `path_data_dir` é
+        reaproveitado (com `refresh=True`, é baixado de novo).
+
+        Returns:
+            Path: Caminho do ZIP no disco.
+        """
+        async with self._semaphore:
+            zip_path = await self._fetch(ano, doc_type, refresh)
+            if extrair:
+                await self._run(
+                    ZipExtractor.extract_all, zip_path, self.path_data_dir, instrumentation=self._client.instrumentation
+                )
+        return zip_path
+
+    async def get_zips(
+        self,
+        anos: Iterable[int],
+        doc_types: Iterable[DocType],
+        extrair: bool = True,
+        refresh: bool = False,
+    ) -> List[ZipFetchResult]:
+        """Baixa vários ZIPs concorrentemente, respeitando `max_concurrency`.
+
+        Uma falha em um item não interrompe os demais (o erro fica no resultado);
+        cancelar a chamada cancela todos os downloads em andamento.
+        """
+        pares = [(ano, doc_type) for doc_type in doc_types for ano in anos]
+
+        async def _one(ano: int, doc_type: DocType) -> ZipFetchResult:
+            result = ZipFetchResult(ano=ano, doc_type=doc_type)
+            try:
+                result.zip_path = await self.get_zip(ano, doc_type, extrair=extrair, refresh=refresh)
+            except Exception as e:
+                result.error = e
+            return result
+
+        return list(await asyncio.gather(*(_one(ano, doc_type) for ano, doc_type in pares)))
+
+    # -----------------------------
+    # Leitura
+    # -----------------------------
+    async def load_statement(
+        self,
+        ano: int,
+        statement: StatementType,
+        scope: Scope,
+        doc_type: DocType,
+        from_zip: bool = False,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Carrega o demonstrativo no executor, sem bloquear o loop.
+
+        Args:
+            from_zip (bool, opcional): Lê direto do ZIP; se ele ainda não estiver no
+                disco, é baixado pelo cliente assíncrono antes da leitura.
+            **kwargs: Repassados para `CVMClient.load_statement` (ex.: cols, filters,
+                latest_only). `chunks=True` não é suportado.
+        """
+        if kwargs.get("chunks"):
+            raise ValueError("chunks=True não é suportado no cliente assíncrono.")
+        if from_zip and (
+            self._client.cache is not None
+            or not (self.path_data_dir / UrlBuilder.zip_filename(doc_type, ano)).exists()
+        ):
+            await self.get_zip(ano, doc_type, extrair=False)
+
+        async with self._semaphore:
+            return await self._run(
+                self._client.load_statement, ano, statement, scope, doc_type, from_zip=from_zip, **kwargs
+            )
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    async def _run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _fetch(self, ano: int, doc_type: DocType, refresh: bool) -> Path:
+        """Resolve o ZIP no disco, baixando-o (ou revalidando-o) se necessário.
+
+        As operações do cache (índice, hash e cópia do blob) rodam no executor.
+        """
+        cache = self._client.cache
+        if cache is None:
+            dest = self.path_data_dir / UrlBuilder.zip_filename(doc_type, ano)
+            if refresh or not dest.exists():
+                await self._download(doc_type, ano, dest, etag=None, last_modified=None)
+            return dest
+
+        entry = await self._run(cache.lookup, doc_type, ano)
+        if entry is not None and not refresh and cache.is_fresh(entry):
+            await self._run(cache.touch, doc_type, ano)
+            return cache.blob_path(entry.sha256)
+
+        staging = cache.staging_path(doc_type, ano)
+        result = await self._download(
+            doc_type,
+            ano,
+            staging,
+            etag=entry.etag if entry else None,
+            last_modified=entry.last_modified if entry else None,
+        )
+        if result is None:
+            assert entry is not None
+            await self._run(cache.touch, doc_type, ano, revalidated=True)
+            return cache.blob_path(entry.sha256)
+
+        url, etag, last_modified, sha256 = result
+        entry = await self._run(
+            cache.store_file, doc_type, ano, staging, url=url, etag=etag, last_modified=last_modified, sha256=sha256
+        )
+        return cache.blob_path(entry.sha256)
+
+    async def _download(
+        self,
+        doc_type: DocType,
+        ano: int,
+        dest: Path,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> Optional[tuple[str, Optional[str], Optional[str], str]]:
+        """Baixa o ZIP para `dest` com retries; retorna None se o servidor responder 304.
+
+        Segue a política do `ZipDownloader` (`retry_delay`): limite de taxa por host e
+        backoff exponencial com jitter, respeitando o `Retry-After` de respostas 429/503.
+        ZIPs corrompidos são repetidos; conteúdo que não é ZIP não. Os blocos recebidos
+        são acumulados em memória e gravados (com o hash) no executor a cada
+        `_WRITE_BUFFER_BYTES`; antes de virar `dest`, o `.part` passa pela mesma
+        verificação de integridade do `ZipDownloader`.
+
+        Returns:
+            Tupla (url, etag, last_modified, sha256) do arquivo gravado, ou None.
+        """
+        httpx = _import_optional("httpx", "AsyncCVMClient")
+        url = UrlBuilder.build_zip_url(doc_type, ano)
+        headers = ZipDownloader._conditional_headers(etag, last_modified)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part = ZipDownloader.part_path(dest)
+
+        attempts = ZipDownloader.DEFAULT_RETRIES
+        instr = self._client.instrumentation
+        with instr.stage("download", doc_type=doc_type.value, ano=ano, mode="async") as stage:
+            for n in range(1, attempts + 1):
+                status: Optional[int] = None
+                retry_after: Optional[str] = None
+                try:
+                    wait = self._limiter.reserve(url)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    async with self._http.stream("GET", url, headers=headers) as response:
+                        if response.status_code == 304:
+                            return None
+                        response.raise_for_status()
+
+                        digest = hashlib.sha256()
+                        fh = await self._run(open, part, "wb")
+                        try:
+                            buffer: List[bytes] = []
+                            buffered = 0
+                            first = True
+                            async for chunk in response.aiter_bytes(ZipDownloader.CHUNK_SIZE):
+                                if first:
+                                    _check_zip(response.headers.get("Content-Type", ""), chunk[:2])
+                                    first = False
+                                buffer.append(chunk)
+                                buffered += len(chunk)
+                                stage.add(bytes=len(chunk))
+                                if buffered >= _WRITE_BUFFER_BYTES:
+                                    await self._run(_write_chunks, fh, digest, buffer)
+                                    buffer, buffered = [], 0
+                            if buffer:
+                                await self._run(_write_chunks, fh, digest, buffer)
+                        finally:
+                            await self._run(fh.close)
+
+                        await self._run(
+                            ZipDownloader._finalize_part, part, dest, digest.hexdigest(), None, verify_zip=True
+                        )
+                        return (
+                            url,
+                            response.headers.get("ETag"),
+                            response.headers.get("Last-Modified"),
+                            digest.hexdigest(),
+                        )
+                except httpx.HTTPStatusError as e:
+                    part.unlink(missing_ok=True)
+                    status = e.response.status_code
+                    retry_after = e.response.headers.get("Retry-After")
+                    error: Exception = e
+                except (httpx.TransportError, requests.RequestException) as e:
+                    part.unlink(missing_ok=True)
+                    error = e
+                except BaseException:
+                    # Cancelamento, conteúdo que não é ZIP ou erro inesperado: não repete
+                    # e não deixa arquivo parcial para trás
+                    part.unlink(missing_ok=True)
+                    raise
+                decision = ZipDownloader.retry_delay(n, attempts, status, retry_after)
+                if decision is None:
+                    raise error
+                delay, throttled = decision
+                if throttled:
+                    self._limiter.penalize(url, delay)
+                stage.add(retries=1)
+                await asyncio.sleep(delay)
+            raise AssertionError("unreachable")
+
+
+def _write_chunks(fh: Any, digest: Any, chunks: List[bytes]) -> None:
+    """Grava os blocos acumulados e atualiza o hash (roda no executor)."""
+    for chunk in chunks:
+        fh.write(chunk)
+        digest.update(chunk)
+
+
+def _check_zip(content_type: str, head: bytes) -> None:
+    """Mesma validação leve de `ZipDownloader`: Content-Type de ZIP ou assinatura PK."""
+    content_type = content_type.lower()
+    if "zip" not in content_type and "octet-stream" not in content_type and not head.startswith(b"PK"):
+        raise ValueError(f"Conteúdo inesperado (Content-Type={content_type!r}).")
@@ -1,19 +1,109 @@
+from __future__ import annotations
+
+import numpy as np
 import pandas as pd
-from typing import Literal
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple
 from datetime import datetime, date
 
+from .cube import StatementCube
+from .index import StatementIndex
+from .utils import Filters
+
+if TYPE_CHECKING:
+    from .client import CVMClient
+    from .endpoints import DocType, Scope, StatementType
+
+
+@dataclass(frozen=True)
+class _Filtro:
+    """Filtro registrado por um `filtrar_por_*`, avaliado só em `get_dataframe()`."""
+
+    coluna: str
+    operador: Literal["==", ">="]
+    valor: Any
+
+
 class Balanco:
-    def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
-        
+    """Filtros encadeáveis sobre um demonstrativo da CVM.
+
+    Os métodos `filtrar_por_*` apenas registram o filtro; `get_dataframe()` combina
+    todos em uma única máscara booleana e materializa o resultado em uma só passada
+    pelo DataFrame. O DataFrame original não é copiado nem alterado.
+
+    Quando criado com `Balanco.from_client`, os filtros de igualdade (CNPJ, CD_CVM,
+    exercício) são repassados ao leitor, que descarta as linhas chunk a chunk.
+
+    Com um `StatementIndex` (ver `CVMClient.load_balanco`), filtros por CD_CVM, CNPJ e
+    CD_CONTA são resolvidos pelo índice: a companhia vira uma fatia contígua de linhas
+    e só essa fatia é comparada com os demais filtros. Filtros resolvidos só por
+    fatias (ex.: uma companhia) retornam uma view do DataFrame, sem cópia; com o cache
+    colunar no formato "arrow", a view aponta direto para o arquivo mapeado em memória.
+
+    Args:
+        df: DataFrame do demonstrativo (ex.: retorno de `CVMClient.load_statement`).
+        loader: Alternativa a `df`: função que recebe os filtros de igualdade e
+            retorna o DataFrame já filtrado na leitura.
+        index: Índice do demonstrativo; `df` deve estar na ordem do índice.
+    """
+
+    def __init__(
+        self,
+        df: Optional[pd.DataFrame] = None,
+        loader: Optional[Callable[[Filters], pd.DataFrame]] = None,
+        index: Optional[StatementIndex] = None,
+    ):
+        if (df is None) == (loader is None):
+            raise ValueError("Informe exatamente um entre df e loader.")
+        if index is not None and (df is None or len(df) != index.n_rows):
+            raise ValueError("O índice precisa corresponder ao DataFrame informado.")
+        self._df = df
+        self._loader = loader
+        self._index = index
+        self._filtros: List[_Filtro] = []
+        self._dt_refer: Optional[pd.Series] = None
+        self._resultado: Optional[pd.DataFrame] = None
+
+    @classmethod
+    def from_client(
+        cls,
+        client: CVMClient,
+        anos: Iterable[int],
+        statement: StatementType,
+        scope: Scope,
+        doc_type: DocType,
+        **kwargs: Any,
+    ) -> 'Balanco':
+        """Cria um Balanco que só lê os dados em `get_dataframe()`, com filtros na leitura.
+
+        Args:
+            client: Cliente usado para ler os demonstrativos.
+            anos: Anos a carregar.
+            statement: Tipo do demonstrativo (ex.: StatementType.BPA).
+            scope: Escopo do demonstrativo (ex.: Scope.CON).
+            doc_type: Tipo de documento (ex.: DocType.DFP).
+            **kwargs: Repassados para `CVMClient.load_statements` (ex.: from_zip=True).
+        """
+        anos = list(anos)
+
+        def loader(filters: Filters) -> pd.DataFrame:
+            return client.load_statements(
+                anos, statement, scope, doc_type, filters=filters or None, **kwargs
+            )
+
+        return cls(loader=loader)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """DataFrame com os filtros aplicados (equivale a `get_dataframe()`)."""
+        return self.get_dataframe()
+
     def filtrar_por_cnpj(self, cnpj: str) -> 'Balanco':
-        self.df = self.df[self.df['CNPJ_CIA'] == cnpj]
-        return self
-    
+        return self._registrar("CNPJ_CIA", "==", cnpj)
+
     def filtrar_por_cd_cvm(self, cd_cvm: int) -> 'Balanco':
-        self.df = self.df[self.df['CD_CVM'] == cd_cvm]
-        return self    
-    
+        return self._registrar("CD_CVM", "==", cd_cvm)
+
     def filtrar_por_data_referencia(self, dt_refer: str | date) -> 'Balanco':
         """
         Filtra o balanço pela data de referência.
@@ -28,14 +118,124 @@ class Balanco:
         if isinstance(dt_refer, str):
             dt_refer = datetime.strptime(dt_refer, "%d/%m/%Y").date()
 
-        self.df['DT_REFER'] = pd.to_datetime(self.df['DT_REFER'])
-        dt_refer = pd.to_datetime(dt_refer, dayfirst=True, format='%d/%m/%Y')
-        self.df = self.df[self.df['DT_REFER'] >= dt_refer]
-        return self
-        
+        return self._registrar("DT_REFER", ">=", pd.Timestamp(dt_refer))
+
     def filtrar_por_exercicio(self, ordem_exerc:Literal['PENÚLTIMO', 'ÚLTIMO']) -> 'Balanco':
-        self.df = self.df[self.df['ORDEM_EXERC'] == ordem_exerc]
-        return self
-        
+        return self._registrar("ORDEM_EXERC", "==", ordem_exerc)
+
+    def filtrar_por_conta(self, cd_conta: str) -> 'Balanco':
+        return self._registrar("CD_CONTA", "==", cd_conta)
+
     def get_dataframe(self) -> pd.DataFrame:
-        return self.df
\ No newline at end of file
+        """Aplica os filtros registrados e retorna o resultado.
+
+        O resultado fica em memória até que um novo filtro seja registrado. Sem
+        filtros, retorna o próprio DataFrame original (sem cópia).
+        """
+        if self._resultado is not None:
+            return self._resultado
+
+        if self._df is not None:
+            df, filtros = self._df, self._filtros
+            if self._index is not None:
+                df, filtros = self._aplicar_indice(df, filtros)
+        else:
+            assert self._loader is not None
+            pushdown, filtros = self._separar_pushdown()
+            df = self._loader(pushdown)
+
+        mask = self._mascara(df, filtros)
+        # Máscara que mantém todas as linhas não precisa copiar as candidatas
+        self._resultado = df if mask is None or mask.all() else df[mask]
+        return self._resultado
+
+    def to_cube(self, **kwargs: Any) -> StatementCube:
+        """Resultado filtrado no formato largo companhia × DT_REFER × CD_CONTA.
+
+        Args:
+            **kwargs: Repassados para `StatementCube.from_frame` (ex.: sparse=True).
+        """
+        return StatementCube.from_frame(self.get_dataframe(), **kwargs)
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    def _registrar(self, coluna: str, operador: Literal["==", ">="], valor: Any) -> 'Balanco':
+        self._filtros.append(_Filtro(coluna, operador, valor))
+        self._resultado = None
+        return self
+
+    def _mascara(self, df: pd.DataFrame, filtros: List[_Filtro]) -> Optional[np.ndarray]:
+        """Combina os filtros em uma única máscara booleana."""
+        mask: Optional[np.ndarray] = None
+        for f in filtros:
+            col = self._coluna(df, f.coluna)
+            m = (col == f.valor) if f.operador == "==" else (col >= f.valor)
+            m = m.to_numpy(dtype=bool)
+            mask = m if mask is None else (mask & m)
+        return mask
+
+    def _coluna(self, df: pd.DataFrame, coluna: str) -> pd.Series:
+        """Coluna pronta para comparação; DT_REFER em texto é convertida uma única vez."""
+        serie = df[coluna]
+        if coluna != "DT_REFER" or pd.api.types.is_datetime64_any_dtype(serie):
+            return serie
+        if df is not self._df:
+            return pd.to_datetime(serie)
+        if self._dt_refer is None:
+            self._dt_refer = pd.to_datetime(serie)
+        return self._dt_refer
+
+    def _aplicar_indice(self, df: pd.DataFrame, filtros: List[_Filtro]) -> Tuple[pd.DataFrame, List[_Filtro]]:
+        """Resolve pelo índice os filtros de igualdade em colunas indexadas.
+
+        Returns:
+            Tupla (linhas candidatas, filtros que ainda precisam de máscara).
+        """
+        assert self._index is not None
+        indexadas = self._index.indexed_columns()
+        candidatas: slice | np.ndarray | None = None
+        restantes: List[_Filtro] = []
+        for f in filtros:
+            if f.operador != "==" or f.coluna not in indexadas:
+                restantes.append(f)
+                continue
+            try:
+                linhas = self._index.rows(f.coluna, f.valor)
+            except LookupError:
+                restantes.append(f)
+                continue
+            candidatas = _intersecao(candidatas, linhas)
+        if candidatas is None:
+            return df, filtros
+        return df.iloc[candidatas], restantes
+
+    def _separar_pushdown(self) -> Tuple[Dict[str, List[Any]], List[_Filtro]]:
+        """Separa filtros de igualdade (repassados ao leitor) dos demais.
+
+        Filtros de igualdade repetidos na mesma coluna são combinados pela interseção
+        dos valores, preservando a semântica de filtros encadeados.
+        """
+        pushdown: Dict[str, List[Any]] = {}
+        restantes: List[_Filtro] = []
+        for f in self._filtros:
+            if f.operador != "==":
+                restantes.append(f)
+            elif f.coluna in pushdown:
+                pushdown[f.coluna] = [v for v in pushdown[f.coluna] if v == f.valor]
+            else:
+                pushdown[f.coluna] = [f.valor]
+        return pushdown, restantes
+
+
+def _intersecao(a: slice | np.ndarray | None, b: slice | np.ndarray) -> slice | np.ndarray:
+    """Interseção de conjuntos de linhas representados por fatias ou posições ordenadas."""
+    if a is None:
+        return b
+    if isinstance(a, slice) and isinstance(b, slice):
+        start, stop = max(a.start, b.start), min(a.stop, b.stop)
+        return slice(start, max(start, stop))
+    if isinstance(a, slice) or isinstance(b, slice):
+        s, arr = (a, b) if isinstance(a, slice) else (b, a)
+        return arr[(arr >= s.start) & (arr < s.stop)]
+    return np.intersect1d(a, b, assume_unique=True)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Final, List, Optional
+
+from .endpoints import DocType
+
+__all__ = ["ZipCache", "CacheEntry"]
+
+
+@dataclass
+class CacheEntry:
+    """Metadados de um ZIP armazenado no cache.
+
+    Attributes:
+        sha256: Hash do conteúdo (endereço do blob no disco).
+        size: Tamanho do ZIP em bytes.
+        url: URL de origem.
+        etag: ETag informado pelo servidor no último download/revalidação.
+        last_modified: Last-Modified informado pelo servidor.
+        fetched_at: Momento (epoch) da última validação com o servidor.
+        last_access: Momento (epoch) do último uso, base da política LRU.
+    """
+
+    sha256: str
+    size: int
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    last_access: float = 0.0
+
+
+class ZipCache:
+    """Cache em disco, endereçado por conteúdo, para os ZIPs da CVM.
+
+    Os blobs ficam em `blobs/<sha[:2]>/<sha>.zip` e um índice JSON mapeia
+    `(doc_type, ano)` para o blob correspondente e seus metadados HTTP.
+
+    Args:
+        cache_dir: Diretório raiz do cache.
+        max_bytes: Tamanho máximo total dos blobs; acima disso os menos usados
+            recentemente são removidos. Se None, não há limite.
+        max_age: Segundos durante os quais uma entrada é servida direto do disco,
+            sem consultar o servidor. Se None, entradas nunca expiram.
+    """
+
+    INDEX_FILENAME: Final[str] = "index.json"
+    BLOBS_DIRNAME: Final[str] = "blobs"
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        self.root = Path(cache_dir)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._entries: Dict[str, CacheEntry] = self._load_index()
+
+    # -----------------------------
+    # Consulta
+    # -----------------------------
+    @staticmethod
+    def key(doc_type: DocType, ano: int) -> str:
+        """Chave do índice para o par tipo/ano (ex.: 'dfp/2024')."""
+        return f"{doc_type.value}/{ano}"
+
+    def lookup(self, doc_type: DocType, ano: int) -> Optional[CacheEntry]:
+        """Retorna a entrada do cache, ou None se não houver blob válido no disco."""
+        with self._lock:
+            entry = self._entries.get(self.key(doc_type, ano))
+            if entry is None or not self.blob_path(entry.sha256).exists():
+                return None
+            return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Indica se a entrada pode ser servida sem revalidação no servidor."""
+        if self.max_age is None:
+            return True
+        return (time.time() - entry.fetched_at) < self.max_age
+
+    def blob_path(self, sha256: str) -> Path:
+        """Caminho do blob para o hash informado."""
+        return self.root / self.BLOBS_DIRNAME / sha256[:2] / f"{sha256}.zip"
+
+    def path(self, doc_type: DocType, ano: int) -> Optional[Path]:
+        """Caminho do ZIP em cache para o tipo/ano, ou None se ausente."""
+        entry = self.lookup(doc_type, ano)
+        return self.blob_path(entry.sha256) if entry else None
+
+    def read(self, doc_type: DocType, ano: int) -> bytes:
+        """Lê o ZIP em cache e marca o acesso para a política LRU.
+
+        Raises:
+            KeyError: se não houver entrada para o tipo/ano.
+        """
+        entry = self.lookup(doc_type, ano)
+        if entry is None:
+            raise KeyError(self.key(doc_type, ano))
+        self.touch(doc_type, ano)
+        return self.blob_path(entry.sha256).read_bytes()
+
+    @property
+    def total_bytes(self) -> int:
+        """Soma do tamanho dos blobs referenciados pelo índice."""
+        with self._lock:
+            return sum(e.size for e in {e.sha256: e for e in self._entries.values()}.values())
+
+    # -----------------------------
+    # Escrita
+    # -----------------------------
+    def store(
+        self,
+        doc_type: DocType,
+        ano: int,
+        content: bytes,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CacheEntry:
+        """Grava o ZIP no cache e atualiza o índice.
+
+        O blob é gravado em arquivo temporário e renomeado atomicamente. Blobs com
+        o mesmo conteúdo são compartilhados entre chaves.
+        """
+        sha = hashlib.sha256(content).hexdigest()
+        blob = self.blob_path(sha)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._tmp_path(blob)
+            tmp.write_bytes(content)
+            os.replace(tmp, blob)
+        return self._register(doc_type, ano, sha, len(content), url, etag, last_modified)
+
+    def store_file(
+        self,
+        doc_type: DocType,
+        ano: int,
+        path: str | Path,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        sha256: Optional[str] = None,
+    ) -> CacheEntry:
+        """Move um ZIP já gravado em disco para o cache e atualiza o índice.
+
+        Usado pelo download em streaming: o arquivo é movido (não copiado) para o
+        blob, então `path` deve estar no mesmo sistema de arquivos do cache.
+
+        Args:
+            path: Arquivo ZIP a ser movido para o cache.
+            sha256: Hash do conteúdo, se já conhecido; caso contrário é calculado
+                lendo o arquivo em blocos.
+        """
+        path = Path(path)
+        sha = sha256 or self.file_sha256(path)
+        size = path.stat().st_size
+        blob = self.blob_path(sha)
+        if blob.exists():
+            path.unlink()
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, blob)
+        return self._register(doc_type, ano, sha, size, url, etag, last_modified)
+
+    def staging_path(self, doc_type: DocType, ano: int) -> Path:
+        """Caminho, dentro do cache, para baixar um ZIP antes de `store_file`.
+
+        O nome é estável para que um download interrompido possa ser retomado a
+        partir do seu `.part` numa execução posterior.
+        """
+        staging = self.root / "staging"
+        staging.mkdir(parents=True, exist_ok=True)
+        return staging / f"{doc_type.value}_{ano}.zip"
+
+    @staticmethod
+    def file_sha256(path: str | Path, block_size: int = 1024 * 1024) -> str:
+        """Calcula o SHA-256 de um arquivo lendo-o em blocos."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for block in iter(lambda: fh.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def touch(self, doc_type: DocType, ano: int, revalidated: bool = False) -> None:
+        """Atualiza o último acesso (e, se `revalidated`, o momento da validação)."""
+        with self._lock:
+            entry = self._entries.get(self.key(doc_type, ano))
+            if entry is None:
+                return
+            now = time.time()
+            entry.last_access = now
+            if revalidated:
+                entry.fetched_at = now
+            self._save_index()
+
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        """Remove entradas menos usadas recentemente até respeitar `max_bytes`.
+
+        Args:
+            keep: Chave que não deve ser removida (ex.: a que acabou de ser gravada).
+
+        Returns:
+            Lista das chaves removidas.
+        """
+        removed: List[str] = []
+        if self.max_bytes is None:
+            return removed
+        with self._lock:
+            candidates = sorted(
+                (k for k in self._entries if k != keep),
+                key=lambda k: self._entries[k].last_access,
+            )
+            for k in candidates:
+                if self.total_bytes <= self.max_bytes:
+                    break
+                entry = self._entries.pop(k)
+                self._remove_blob_if_orphan(entry.sha256)
+                removed.append(k)
+            if removed:
+                self._save_index()
+        return removed
+
+    def clear(self) -> None:
+        """Remove todas as entradas e blobs do cache."""
+        with self._lock:
+            for sha in {e.sha256 for e in self._entries.values()}:
+                self.blob_path(sha).unlink(missing_ok=True)
+            self._entries.clear()
+            self._save_index()
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    def _register(
+        self,
+        doc_type: DocType,
+        ano: int,
+        sha: str,
+        size: int,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> CacheEntry:
+        now = time.time()
+        entry = CacheEntry(
+            sha256=sha,
+            size=size,
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=now,
+            last_access=now,
+        )
+        key = self.key(doc_type, ano)
+        with self._lock:
+            previous = self._entries.get(key)
+            self._entries[key] = entry
+            if previous is not None and previous.sha256 != sha:
+                self._remove_blob_if_orphan(previous.sha256)
+            self.evict(keep=key)
+            self._save_index()
+        return entry
+
+    @staticmethod
+    def _tmp_path(path: Path) -> Path:
+        return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    def _remove_blob_if_orphan(self, sha256: str) -> None:
+        if all(e.sha256 != sha256 for e in self._entries.values()):
+            self.blob_path(sha256).unlink(missing_ok=True)
+
+    def _load_index(self) -> Dict[str, CacheEntry]:
+        index_path = self.root / self.INDEX_FILENAME
+        if not index_path.exists():
+            return {}
+        try:
+            raw = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # Índice corrompido: recomeça vazio (blobs órfãos são sobrescritos ao baixar de novo)
+            return {}
+        return {k: CacheEntry(**v) for k, v in raw.items()}
+
+    def _save_index(self) -> None:
+        index_path = self.root / self.INDEX_FILENAME
+        tmp = self._tmp_path(index_path)
+        tmp.write_text(
+            json.dumps({k: asdict(v) for k, v in self._entries.items()}, indent=2),
+            encoding="utf-8",
+        )
+        os.replace(tmp, index_path)
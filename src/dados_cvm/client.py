@@ -1,19 +1,65 @@
 from __future__ import annotations
 
+import email.utils
 import io
+import numbers
+import os
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Final, Iterable, Mapping, Optional, List, Sequence, Tuple
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Iterator
 
-from .endpoints import DocType, Scope, StatementType
-from .download import ZipDownloader
+from .aggregate import AggFunc, Aggregator, aggregate_source
+from .balanco import Balanco
+from .endpoints import DocType, Scope, StatementType, UrlBuilder
+from .cache import ZipCache
+from .columnar import ColumnarCache, ColumnarFormat
+from .dedup import LatestVersionFilter
+from .download import RateLimiter, ZipDownloader
 from .extract import ZipExtractor
+from .index import StatementIndex
+from .indicators import DEFAULT_INDICATORS, Indicator, IndicatorCache, IndicatorEngine
+from .metrics import DISABLED, Instrumentation
 
-from .read import CSVReader 
-from .normalize import standardize_dataframe
+from .read import Backend, CSVEngine, CSVReader, _has_module
+from .sync import SyncManifest, SyncReport, SyncResult
+from .normalize import CVM_DATE_FORMAT, standardize_dataframe
+from .utils import Filters, build_mask, concat_frames, source_fingerprint
 
-__all__ = ["CVMClient"]
+__all__ = ["CVMClient", "ZipFetchResult"]
+
+
+@dataclass
+class ZipFetchResult:
+    """Resultado de um item de `CVMClient.get_zips`.
+
+    Attributes:
+        ano: Ano do arquivo.
+        doc_type: Tipo de documento.
+        zip_bytes: Conteúdo do ZIP. Só é mantido quando o ZIP não foi extraído,
+            para não acumular todos os arquivos em memória durante o lote.
+        zip_path: Caminho do ZIP no disco, quando baixado com `streaming=True`.
+        error: Exceção levantada ao baixar/extrair este item, se houver.
+    """
+
+    ano: int
+    doc_type: DocType
+    zip_bytes: Optional[io.BytesIO] = None
+    zip_path: Optional[Path] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True se o item foi baixado (e extraído, se solicitado) sem erros."""
+        return self.error is None
 
 
 class CVMClient:
@@ -24,6 +70,31 @@ class CVMClient:
         Padrão é "./arquivos".
     cache_dir (str | Path, optional): Diretório para armazenamento em cache dos dados,
         para evitar downloads repetidos. Se None, o cache não será utilizado.
+    cache_max_bytes (int, optional): Tamanho máximo do cache de ZIPs; os ZIPs usados há
+        mais tempo são removidos quando o limite é excedido. Se None, não há limite.
+    cache_max_age (float, optional): Segundos durante os quais um ZIP em cache é servido
+        direto do disco. Depois disso ele é revalidado com o servidor (ETag/Last-Modified).
+        Se None, o ZIP em cache nunca é revalidado automaticamente. Padrão é 24 horas.
+    download_parts (int, optional): Número de faixas HTTP Range baixadas em paralelo nos
+        downloads em streaming. Padrão é 1 (download sequencial, retomável).
+    columnar_dir (str | Path, optional): Diretório do cache colunar de demonstrativos já
+        convertidos (requer `pyarrow`). Se None, os CSVs são sempre lidos diretamente.
+    columnar_format (str, optional): Formato do cache colunar, "parquet", "feather" ou
+        "arrow". Com "arrow" os demonstrativos são abertos com memory map, sem cópia:
+        processos que leem o mesmo ano compartilham o page cache (ver `ColumnarCache`).
+        Padrão é "parquet".
+    pool_size (int, optional): Conexões mantidas abertas pela sessão HTTP do cliente.
+        `get_zips`/`sync` ampliam o pool se `max_workers` for maior. Padrão é 10.
+    rate_limiter (RateLimiter, optional): Limite de requisições por host. Se None, o
+        cliente cria o seu (5 req/s por host); passe o mesmo limitador a vários clientes
+        para que dividam a cota.
+    instrumentation (Instrumentation, optional): Recebe as medições (tempo, bytes, linhas,
+        retries) de cada etapa: "download", "extract", "read_csv", "columnar_read",
+        "load_all_statements", "aggregate", "indicators" e "normalize". Se None, nada
+        é medido.
+
+    O cliente mantém uma `requests.Session` própria (keep-alive) para todos os
+    downloads; use `close()` ou `with CVMClient(...) as client:` para liberá-la.
 
     Exemplo:
     Para instanciar a classe, fornecendo um diretório específico para os dados:
@@ -31,13 +102,46 @@ class CVMClient:
         client = CVMClient(data_dir="./arquivos")
     """
 
-    def __init__(self, data_dir: str | Path = "./arquivos", cache_dir: Optional[str | Path] = None):
+    INDEX_FILENAME: Final[str] = "index.npz"
+
+    def __init__(
+        self,
+        data_dir: str | Path = "./arquivos",
+        cache_dir: Optional[str | Path] = None,
+        cache_max_bytes: Optional[int] = None,
+        cache_max_age: Optional[float] = 24 * 60 * 60,
+        download_parts: int = 1,
+        columnar_dir: Optional[str | Path] = None,
+        columnar_format: ColumnarFormat = "parquet",
+        pool_size: int = ZipDownloader.DEFAULT_POOL_SIZE,
+        rate_limiter: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
         self._path_data_dir = Path(data_dir)
         self._path_data_dir.mkdir(parents=True, exist_ok=True)
         self._path_cache_dir = Path(cache_dir) if cache_dir else None
         self._files_downloaded: List[str] = []
+        self._cache: Optional[ZipCache] = None
+        self._download_parts = download_parts
+        self._instr = instrumentation or DISABLED
+        self._pool_size = pool_size
+        self._rate_limiter = (
+            rate_limiter
+            if rate_limiter is not None
+            else RateLimiter(rate=ZipDownloader.DEFAULT_RATE, burst=ZipDownloader.DEFAULT_BURST)
+        )
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        self._columnar: Optional[ColumnarCache] = (
+            ColumnarCache(columnar_dir, format=columnar_format) if columnar_dir else None
+        )
         if self._path_cache_dir:
             self._path_cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache = ZipCache(
+                self._path_cache_dir / "zips",
+                max_bytes=cache_max_bytes,
+                max_age=cache_max_age,
+            )
 
     @property
     def path_data_dir(self):
@@ -51,32 +155,273 @@ class CVMClient:
             raise ValueError("O caminho precisa ser um diretório válido ou da classe Path.")
         self._path_data_dir = Path(caminho)
 
+    @property
+    def cache(self) -> Optional[ZipCache]:
+        """Cache de ZIPs (`cache_dir`), ou None se o cliente não usa cache."""
+        return self._cache
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Limite de requisições por host usado pelos downloads do cliente."""
+        return self._rate_limiter
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Instrumentação que recebe as medições das etapas (desligada por padrão)."""
+        return self._instr
+
+    def close(self) -> None:
+        """Fecha a sessão HTTP do cliente (uma nova é criada se houver outro download)."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self) -> 'CVMClient':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
 
     # -----------------------------
     # Download / Extração de DFP    
     # -----------------------------
-    def get_zip(self, ano: int, doc_type: DocType, extrair: bool = True) -> io.BytesIO:
+    def get_zip(
+        self,
+        ano: int,
+        doc_type: DocType,
+        extrair: bool = True,
+        refresh: bool = False,
+        session: Optional[requests.Session] = None,
+        streaming: bool = False,
+        statements: Optional[Iterable[StatementType]] = None,
+        scopes: Optional[Iterable[Scope]] = None,
+    ) -> io.BytesIO | Path:
         """
-        Baixa o arquivo ZIP em memória do Demonstrativo Financeiro solicitado (DFP/ITR/DRE) para o ano especificado e,
+        Baixa o arquivo ZIP do tipo de documento solicitado (ex.: DFP/ITR) para o ano especificado e,
         opcionalmente, extrai o conteúdo para o diretório padrão.
 
+        Por padrão o ZIP inteiro é mantido em memória. Com `streaming=True` ele é gravado
+        em disco em blocos (no cache, se configurado, ou em `path_data_dir`) e extraído a
+        partir do arquivo, sem nunca ser carregado inteiro em memória.
+
+        Com `cache_dir` configurado, um ZIP já baixado é lido do disco sem acesso à rede
+        enquanto estiver dentro de `cache_max_age`; depois disso é revalidado com uma
+        requisição condicional e só é baixado de novo se tiver mudado no servidor.
+
         Args:
             ano (int): Ano para o arquivo DFP/ITR/DRE.
+            doc_type (DocType): Tipo de documento (ex.: DocType.DFP).
             extrair (bool, opcional): Se True, extrai o conteúdo do ZIP para o diretório `path_data_dir`.
                 Padrão é True.
+            refresh (bool, opcional): Se True, revalida o ZIP em cache com o servidor mesmo
+                que ainda esteja dentro de `cache_max_age`. Padrão é False.
+            session (requests.Session, opcional): Sessão HTTP a reutilizar entre downloads.
+            streaming (bool, opcional): Se True, baixa o ZIP direto para o disco e retorna
+                o caminho do arquivo. Padrão é False.
+            statements (Iterable[StatementType], opcional): Na extração, só os CSVs desses
+                demonstrativos. Se None, extrai todos os arquivos.
+            scopes (Iterable[Scope], opcional): Na extração, só os CSVs desses escopos.
+
+        A extração mantém os CSVs de `path_data_dir` idênticos aos do ZIP (mesmo tamanho
+        e CRC32), de modo que atualizar um ano só regrava o que mudou.
 
         Returns:
-            io.BytesIO: BytesIO contendo o conteúdo do zip.
+            io.BytesIO | Path: BytesIO contendo o conteúdo do zip, ou o caminho do zip
+                no disco quando `streaming=True`.
 
         Exemplo:
-            Para baixar e extrair os dados do DFP de 2023:
+            Para baixar e extrair os dados do DFP de 2023 sem carregar o ZIP em memória:
 
-                caminho = client.get_dfp(2023, extrair=True)
+                caminho = client.get_zip(2023, DocType.DFP, streaming=True)
         """
-        zip_bytes = ZipDownloader.download_zip(doc_type, ano)
+        if not UrlBuilder.is_zip(doc_type):
+            raise ValueError(f"{doc_type.value} não é distribuído em ZIP. Utilize get_cadastro().")
+        zip_source: io.BytesIO | Path
+        session = session or self._http_session()
+        if self._cache is not None:
+            zip_source = self._fetch_cached(ano, doc_type, refresh=refresh, session=session)
+            if not streaming:
+                zip_source = io.BytesIO(zip_source.read_bytes())
+        elif streaming:
+            zip_source = self.path_data_dir / UrlBuilder.zip_filename(doc_type, ano)
+            ZipDownloader.download_zip_to_file(
+                doc_type,
+                ano,
+                zip_source,
+                session=session,
+                rate_limiter=self._rate_limiter,
+                parts=self._download_parts,
+                instrumentation=self._instr,
+            )
+        else:
+            zip_source = ZipDownloader.download_zip(
+                doc_type, ano, session=session, rate_limiter=self._rate_limiter, instrumentation=self._instr
+            )
         if extrair:
-            ZipExtractor.extract_all(zip_bytes, self.path_data_dir)
-        return zip_bytes
+            ZipExtractor.extract_all(
+                zip_source,
+                self.path_data_dir,
+                instrumentation=self._instr,
+                statements=statements,
+                scopes=scopes,
+            )
+        return zip_source
+
+    def get_zips(
+        self,
+        anos: Iterable[int],
+        doc_types: Iterable[DocType],
+        extrair: bool = True,
+        refresh: bool = False,
+        max_workers: int = 4,
+        streaming: bool = False,
+        statements: Optional[Iterable[StatementType]] = None,
+        scopes: Optional[Iterable[Scope]] = None,
+    ) -> List[ZipFetchResult]:
+        """Baixa (e opcionalmente extrai) vários ZIPs em paralelo.
+
+        Cada par `(ano, doc_type)` é processado por um pool limitado de threads que
+        compartilham a `requests.Session` do cliente, reaproveitando conexões. Cada ZIP é
+        extraído assim que o seu download termina, e uma falha em um item não
+        interrompe os demais: o erro fica registrado no resultado do item.
+
+        Args:
+            anos (Iterable[int]): Anos desejados (ex.: range(2010, 2026)).
+            doc_types (Iterable[DocType]): Tipos de documento (ex.: [DocType.DFP, DocType.ITR]).
+            extrair (bool, opcional): Se True, extrai cada ZIP para `path_data_dir`.
+                Padrão é True.
+            refresh (bool, opcional): Repassado para `get_zip`. Padrão é False.
+            max_workers (int, opcional): Número máximo de downloads simultâneos.
+                Padrão é 4.
+            streaming (bool, opcional): Repassado para `get_zip`; com True cada ZIP é
+                gravado em disco em blocos e o resultado traz `zip_path`. Padrão é False.
+            statements, scopes (opcional): Repassados para `get_zip` (seleção dos CSVs extraídos).
+
+        Returns:
+            List[ZipFetchResult]: Um resultado por par, na ordem (doc_type, ano) informada.
+
+        Exemplo:
+            Para baixar DFP e ITR de 2010 a 2025:
+
+                resultados = client.get_zips(range(2010, 2026), [DocType.DFP, DocType.ITR])
+                falhas = [r for r in resultados if not r.ok]
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser >= 1.")
+
+        # `anos` é percorrido uma vez por tipo de documento (pode ser um gerador)
+        anos = list(anos)
+        pares = [(ano, doc_type) for doc_type in doc_types for ano in anos]
+        results = {par: ZipFetchResult(ano=par[0], doc_type=par[1]) for par in pares}
+        statements = list(statements) if statements is not None else None
+        scopes = list(scopes) if scopes is not None else None
+
+        session = self._http_session(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.get_zip,
+                    ano,
+                    doc_type,
+                    extrair=extrair,
+                    refresh=refresh,
+                    session=session,
+                    streaming=streaming,
+                    statements=statements,
+                    scopes=scopes,
+                ): (ano, doc_type)
+                for ano, doc_type in pares
+            }
+            for future in as_completed(futures):
+                result = results[futures[future]]
+                try:
+                    zip_source = future.result()
+                except Exception as e:
+                    result.error = e
+                    continue
+                if isinstance(zip_source, Path):
+                    result.zip_path = zip_source
+                elif not extrair:
+                    result.zip_bytes = zip_source
+
+        return [results[par] for par in pares]
+
+    def sync(
+        self,
+        anos: Iterable[int],
+        doc_types: Iterable[DocType],
+        max_workers: int = 4,
+        manifest_path: Optional[str | Path] = None,
+    ) -> SyncReport:
+        """Atualização incremental: baixa, extrai e cacheia apenas o que mudou.
+
+        A CVM republica com frequência os ZIPs do ano corrente e do anterior (reentregas
+        incrementam `VERSAO`), enquanto anos antigos praticamente não mudam. Cada ZIP é
+        revalidado com uma requisição condicional (ETag/Last-Modified do manifesto ou
+        do cache) e só é baixado se mudou no servidor. Dos ZIPs alterados, só são
+        extraídos os CSVs cujo CRC32/tamanho mudou ou que não estão em `path_data_dir`.
+
+        O manifesto (URL, ETag, Last-Modified, tamanho e sha256 de cada ZIP; tamanho e
+        CRC32 de cada CSV; chaves já vistas) fica em `path_data_dir/sync_manifest.json`,
+        a menos que `manifest_path` seja informado.
+
+        Os argumentos seguem a ordem de `get_zips` (anos, depois tipos) e são validados
+        antes de qualquer requisição.
+
+        Args:
+            anos (Iterable[int]): Anos a sincronizar.
+            doc_types (Iterable[DocType]): Tipos de documento (ex.: [DocType.DFP, DocType.ITR]).
+            max_workers (int, opcional): Número máximo de ZIPs processados em paralelo.
+                Padrão é 4.
+            manifest_path (str | Path, opcional): Caminho do manifesto.
+
+        Returns:
+            SyncReport: Um resultado por par, com os CSVs extraídos e as chaves
+                `(CD_CVM, DT_REFER, VERSAO)` novas (ver `SyncReport.new_keys()`).
+
+        Raises:
+            TypeError: Se `anos` contiver algo que não seja inteiro.
+            ValueError: Se algum tipo de documento for inválido ou não for distribuído
+                em ZIP (DocType.CAD), ou se `max_workers` < 1.
+
+        Exemplo:
+            Para processar apenas as entregas novas de DFP/ITR dos dois últimos anos:
+
+                report = client.sync([2024, 2025], [DocType.DFP, DocType.ITR])
+                novas = report.new_keys()
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser >= 1.")
+        anos = list(anos)
+        if any(isinstance(ano, bool) or not isinstance(ano, numbers.Integral) for ano in anos):
+            raise TypeError(f"anos deve conter apenas inteiros (ex.: [2024, 2025]): {anos!r}")
+        try:
+            doc_types = [DocType(doc_type) for doc_type in doc_types]
+        except ValueError as e:
+            raise ValueError(f"Tipo de documento inválido: {e}. Use sync(anos, doc_types).") from None
+
+        pares = [(ano, doc_type) for doc_type in doc_types for ano in anos]
+        if any(not UrlBuilder.is_zip(doc_type) for _, doc_type in pares):
+            raise ValueError("O cadastro não é distribuído em ZIP. Utilize get_cadastro(refresh=True).")
+        manifest = SyncManifest(manifest_path or self.path_data_dir / "sync_manifest.json")
+        results = {par: SyncResult(ano=par[0], doc_type=par[1]) for par in pares}
+
+        session = self._http_session(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._sync_one, results[par], manifest, session): par
+                for par in pares
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    results[futures[future]].error = e
+
+        manifest.save()
+        return SyncReport([results[par] for par in pares])
 
     # -----------------------------
     # Leitura de demonstrativos
@@ -93,6 +438,11 @@ class CVMClient:
         normalize: bool = False, 
         sep: Optional[str] = ";",
         encoding: Optional[str] = "latin1",
+        from_zip: bool = False,
+        engine: CSVEngine = "c",
+        backend: Backend = "pandas",
+        filters: Optional[Filters] = None,
+        latest_only: bool = False,
     ) -> pd.DataFrame | Iterator[pd.DataFrame]:
         """Essa função carrega um CSV de demonstrativo (ex.: DRE CON / BPA CON) para o ano informado.
 
@@ -122,52 +472,1045 @@ class CVMClient:
                 Padrão é ";".
             encoding (str, opcional): Codificação do arquivo CSV.
                 Padrão é "latin1".
+            from_zip (bool, opcional): Se True, lê o CSV direto de dentro do ZIP (do cache,
+                ou baixado em `path_data_dir` com `get_zip(streaming=True)`), sem extração.
+                Se o ZIP ainda não estiver no disco, ele é baixado sem ser extraído.
+                Padrão é False.
+            engine (str, opcional): Parser do CSV: "c" (padrão), "pyarrow" (multithread,
+                recai para "c" se o pyarrow não estiver instalado) ou "python".
+            backend (str, opcional): Tipo do resultado: "pandas" (padrão), "arrow"
+                (`pyarrow.Table`) ou "polars" (`polars.DataFrame`). `normalize` só é
+                suportado com "pandas".
+            filters (dict, opcional): Filtros de igualdade aplicados durante a leitura,
+                coluna -> valor ou lista de valores (ex.: {"CD_CVM": [9512], "ORDEM_EXERC": "ÚLTIMO"}).
+                O CSV é lido em chunks de `chunksize` linhas e só as linhas que atendem
+                aos filtros são mantidas. Só é suportado com backend "pandas".
+            latest_only (bool, opcional): Se True, mantém só a maior `VERSAO` de cada
+                (CD_CVM, DT_REFER, ORDEM_EXERC, CD_CONTA), descartando versões
+                reapresentadas durante a leitura em chunks (ver `LatestVersionFilter`).
+                Com `chunks=True` o arquivo é lido duas vezes: a primeira só com as
+                colunas-chave. Só é suportado com backend "pandas". Padrão é False.
 
         Returns:
             pd.DataFrame | Iterator[pd.DataFrame]: DataFrame ou iterador de DataFrames.
 
         Raises:
             FileNotFoundError: se o arquivo CSV não for encontrado.
+            ValueError: se `normalize`, `filters` ou `latest_only` forem pedidos com backend
+                diferente de "pandas".
 
-        Requer que os arquivos já estejam presentes em `path_data_dir`.
+        Sem `from_zip`, requer que os arquivos já estejam presentes em `path_data_dir`.
+
+        Com `columnar_dir` configurado (e `chunks=False`), o CSV é convertido uma única vez
+        para Parquet/Feather; leituras seguintes carregam só as colunas de `cols` do
+        arquivo colunar enquanto o CSV de origem não mudar.
         """
-        csv_path = self._find_csv_path(doc_type, statement, scope, ano)
+        if normalize and backend != "pandas":
+            raise ValueError("normalize=True só é suportado com backend='pandas'.")
+        if filters and backend != "pandas":
+            raise ValueError("filters só é suportado com backend='pandas'.")
+        if latest_only and backend != "pandas":
+            raise ValueError("latest_only só é suportado com backend='pandas'.")
 
-        reader = CSVReader.read_csv(
-            csv_path,
-            chunksize=chunksize if chunks else None,
-            usecols=cols,
-            statement=statement,
-            encoding=encoding,
-            sep=sep,
-        )
+        # Colunas filtradas/da deduplicação precisam ser lidas mesmo que não tenham sido pedidas
+        extra = list(filters or []) + (LatestVersionFilter.columns() if latest_only else [])
+        read_cols = cols
+        if extra and cols is not None:
+            read_cols = list(cols) + [c for c in dict.fromkeys(extra) if c not in cols]
+
+        source, member = self._resolve_source(ano, statement, scope, doc_type, from_zip)
+
+        if self._columnar is not None and not chunks:
+            df = self._load_columnar(
+                ano, statement, scope, doc_type, source, member, read_cols, sep, encoding, engine, backend,
+                filters=filters,
+            )
+            if filters:
+                df = self._apply_filters(df, filters, None)
+            if latest_only:
+                df = LatestVersionFilter.apply(df)
+            if read_cols is not cols:
+                df = df[list(cols)]  # type: ignore[arg-type]
+            return self._normalize(df) if normalize else df
+
+        def _read(usecols: Optional[list[str]], chunked: bool) -> Any:
+            return CSVReader.read_csv(
+                source,
+                chunksize=chunksize if chunked else None,
+                usecols=usecols,
+                statement=statement,
+                encoding=encoding,
+                sep=sep,
+                member=member,
+                engine=engine,
+                backend=backend,
+                instrumentation=self._instr,
+            )
+
+        def _select(df: pd.DataFrame) -> pd.DataFrame:
+            return df[list(cols)] if read_cols is not cols else df  # type: ignore[arg-type]
+
+        reader = _read(read_cols, chunks or bool(filters) or latest_only)
 
         if chunks:
             def _norm_iter() -> Iterator[pd.DataFrame]:
+                dedup: Optional[LatestVersionFilter] = None
+                if latest_only:
+                    # 1ª passada: só as colunas-chave, para conhecer a versão máxima
+                    dedup = LatestVersionFilter()
+                    for keys in _read(list(dict.fromkeys(extra)), True):
+                        if filters:
+                            keys = self._apply_filters(keys, filters, None)
+                        dedup.update(keys)
                 for df in reader:  # type: ignore[assignment]
-                    yield standardize_dataframe(df) if normalize else df
+                    if filters:
+                        df = self._apply_filters(df, filters, None)
+                    if dedup is not None:
+                        df = df[dedup.is_latest(df)]
+                    df = _select(df)
+                    yield self._normalize(df) if normalize else df
 
             return _norm_iter()
 
-        df = reader  # type: ignore[assignment]
-        return standardize_dataframe(df) if normalize else df
+        if filters or latest_only:
+            # Só as linhas filtradas de cada chunk ficam em memória
+            chunks_iter = (
+                self._apply_filters(chunk, filters, None) if filters else chunk for chunk in reader
+            )
+            if latest_only:
+                df = LatestVersionFilter().stream(chunks_iter)
+            else:
+                df = concat_frames(list(chunks_iter))
+            df = _select(df)
+        else:
+            df = reader  # type: ignore[assignment]
+        return self._normalize(df) if normalize else df
+
+    def load_statements(
+        self,
+        anos: Iterable[int],
+        statement: StatementType,
+        scope: Scope,
+        doc_type: DocType,
+        filters: Optional[Filters] = None,
+        cols: Optional[list[str]] = None,
+        chunksize: int = 250_000,
+        max_workers: int = 4,
+        from_zip: bool = False,
+        engine: CSVEngine = "c",
+        normalize: bool = False,
+        latest_only: bool = False,
+    ) -> pd.DataFrame:
+        """Carrega o mesmo demonstrativo de vários anos em um único DataFrame.
+
+        Os anos são lidos em paralelo e os filtros são aplicados chunk a chunk durante
+        a leitura, de modo que só as linhas selecionadas de cada ano ficam em memória.
+        As colunas `category` são unificadas entre os anos, mantendo o layout compacto.
+
+        Args:
+            anos (Iterable[int]): Anos desejados (ex.: range(2015, 2025)).
+            statement (StatementType): Tipo do demonstrativo (ex.: StatementType.BPA).
+            scope (Scope): Escopo do demonstrativo (ex.: Scope.CON).
+            doc_type (DocType): Tipo de documento (ex.: DocType.ITR).
+            filters (dict, opcional): Filtros de igualdade, coluna -> valor ou lista de
+                valores (ex.: {"CD_CVM": [9512, 4170], "ORDEM_EXERC": "ÚLTIMO"}).
+            cols (list[str], opcional): Colunas a retornar. Se None, todas.
+            chunksize (int, opcional): Linhas por chunk na leitura filtrada. Padrão é 250_000.
+            max_workers (int, opcional): Número máximo de anos lidos ao mesmo tempo. Padrão é 4.
+            from_zip (bool, opcional): Repassado para `load_statement`. Padrão é False.
+            engine (str, opcional): Repassado para `load_statement`. Padrão é "c".
+            normalize (bool, opcional): Se True, normaliza o DataFrame final. Padrão é False.
+            latest_only (bool, opcional): Repassado para `load_statement`. Padrão é False.
+
+        Returns:
+            pd.DataFrame: Linhas de todos os anos que atendem aos filtros.
+
+        Raises:
+            FileNotFoundError: se o CSV de algum ano não for encontrado.
+
+        Exemplo:
+            Série histórica do BPA consolidado de duas companhias:
+
+                df = client.load_statements(
+                    anos=range(2015, 2025),
+                    statement=StatementType.BPA,
+                    scope=Scope.CON,
+                    doc_type=DocType.ITR,
+                    filters={"CD_CVM": [9512, 4170], "ORDEM_EXERC": "ÚLTIMO"},
+                )
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser >= 1.")
+        anos = list(anos)
+
+        def _load(ano: int) -> pd.DataFrame:
+            return self.load_statement(
+                ano,
+                statement,
+                scope,
+                doc_type,
+                chunksize=chunksize,
+                cols=cols,
+                from_zip=from_zip,
+                engine=engine,
+                filters=filters,
+                latest_only=latest_only,
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(len(anos), 1))) as executor:
+            frames = list(executor.map(_load, anos))
+
+        df = concat_frames(frames)
+        return self._normalize(df) if normalize else df
+
+    def aggregate(
+        self,
+        statement: StatementType,
+        scope: Scope,
+        doc_type: DocType,
+        anos: Iterable[int],
+        by: Sequence[str],
+        agg: Mapping[str, AggFunc | Sequence[AggFunc]],
+        filters: Optional[Filters] = None,
+        latest_only: bool = False,
+        order_by: Sequence[str] = ("DT_REFER", "VERSAO"),
+        chunksize: int = 250_000,
+        max_workers: int = 4,
+        processes: bool = False,
+        from_zip: bool = False,
+        engine: CSVEngine = "c",
+        sep: Optional[str] = ";",
+        encoding: Optional[str] = "latin1",
+    ) -> pd.DataFrame:
+        """Agregação group-by de um demonstrativo ao longo de vários anos, fora da memória.
+
+        Cada ano é lido em chunks de `chunksize` linhas e reduzido a um estado parcial
+        (uma linha por grupo, ver `Aggregator`); os estados dos anos são combinados no
+        final. O resultado é o mesmo de `groupby(by).agg(...)` sobre todos os dados,
+        mas o pico de memória é limitado pelo chunk e pelo número de grupos.
+
+        Args:
+            statement (StatementType): Tipo do demonstrativo (ex.: StatementType.DRE).
+            scope (Scope): Escopo do demonstrativo (ex.: Scope.CON).
+            doc_type (DocType): Tipo de documento (ex.: DocType.ITR).
+            anos (Iterable[int]): Anos a agregar.
+            by (Sequence[str]): Colunas do agrupamento (ex.: ["CD_CVM", "CD_CONTA"]).
+            agg (dict): Coluna -> função ou lista de funções: "sum", "count", "min",
+                "max", "mean" ou "latest" (ex.: {"VL_CONTA": ["sum", "latest"]}).
+            filters (dict, opcional): Filtros de igualdade aplicados a cada chunk.
+            latest_only (bool, opcional): Descarta as versões reapresentadas antes de
+                agregar (ver `load_statement`). Padrão é False.
+            order_by (Sequence[str], opcional): Ordem que define a linha mais recente em
+                "latest". Padrão é ("DT_REFER", "VERSAO").
+            chunksize (int, opcional): Linhas por chunk. Padrão é 250_000.
+            max_workers (int, opcional): Número máximo de anos agregados ao mesmo tempo.
+                Padrão é 4.
+            processes (bool, opcional): Se True, os anos são agregados em um pool de
+                processos em vez de threads (útil com engine="c", que segura o GIL).
+            from_zip, engine, sep, encoding: Como em `load_statement`.
+
+        Returns:
+            pd.DataFrame: Uma linha por grupo, indexada pelas colunas de `by`.
+
+        Raises:
+            FileNotFoundError: se o CSV de algum ano não for encontrado.
+            ValueError: se `by`/`agg` forem inválidos ou `max_workers` < 1.
+
+        Exemplo:
+            Receita acumulada e último valor informado de cada companhia:
+
+                df = client.aggregate(
+                    StatementType.DRE, Scope.CON, DocType.ITR, range(2015, 2025),
+                    by=["CD_CVM", "CD_CONTA"],
+                    agg={"VL_CONTA": ["sum", "latest"]},
+                    filters={"CD_CONTA": "3.01", "ORDEM_EXERC": "ÚLTIMO"},
+                )
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser >= 1.")
+        aggregator = Aggregator(by, agg, order_by=order_by)
+        sources = [self._resolve_source(ano, statement, scope, doc_type, from_zip) for ano in anos]
+
+        run = partial(
+            aggregate_source,
+            statement=statement,
+            aggregator=aggregator,
+            filters=filters,
+            latest_only=latest_only,
+            chunksize=chunksize,
+            sep=sep,
+            encoding=encoding,
+            engine=engine,
+        )
+        workers = min(max_workers, max(len(sources), 1))
+        with self._instr.stage(
+            "aggregate", doc_type=doc_type.value, statement=statement.value, scope=scope.value
+        ) as stage:
+            if workers == 1:
+                states = [run(source, member, instrumentation=self._instr) for source, member in sources]
+            else:
+                executor: Executor
+                if processes:
+                    # Os processos do pool não compartilham a instrumentação
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                else:
+                    executor = ThreadPoolExecutor(max_workers=workers)
+                    run = partial(run, instrumentation=self._instr)
+                with executor:
+                    states = list(executor.map(run, *zip(*sources)))
+            # Combina na ordem de `anos`: empates completos de "latest" ficam com o último
+            state = aggregator.merge(*states)
+            stage.add(rows=0 if state is None else len(state))
+        return aggregator.finalize(state)
+
+    def load_all_statements(
+        self,
+        ano: int,
+        doc_type: DocType,
+        from_zip: bool = False,
+        max_workers: Optional[int] = None,
+        statements: Optional[Iterable[StatementType]] = None,
+        scopes: Optional[Iterable[Scope]] = None,
+        sep: Optional[str] = ";",
+        encoding: Optional[str] = "latin1",
+    ) -> Dict[Tuple[StatementType, Scope], pd.DataFrame]:
+        """Carrega todos os demonstrativos de um ano em paralelo, em um pool de processos.
+
+        Cada CSV (demonstrativo × escopo) é lido por um processo. Com `pyarrow`
+        instalado, o processo grava o resultado em um arquivo Arrow IPC temporário,
+        que é mapeado em memória pelo processo principal; assim os DataFrames não são
+        serializados com pickle, e as colunas numéricas e de datas sem nulos apontam
+        direto para o arquivo mapeado, sem cópia (textos e categorias são convertidos).
+        Sem `pyarrow`, os DataFrames voltam pelo próprio pool.
+
+        Os arquivos maiores são enviados primeiro, de modo que o tempo total fica
+        próximo do tempo de leitura do maior CSV.
+
+        Args:
+            ano (int): Ano do arquivo.
+            doc_type (DocType): Tipo de documento (ex.: DocType.DFP).
+            from_zip (bool, opcional): Lê os CSVs direto do ZIP (ver `load_statement`).
+            max_workers (int, opcional): Número de processos. Se None, usa o número de CPUs.
+            statements (Iterable[StatementType], opcional): Demonstrativos a carregar. Se
+                None, todos.
+            scopes (Iterable[Scope], opcional): Escopos a carregar. Se None, todos.
+            sep, encoding: Repassados para o `CSVReader`.
+
+        Returns:
+            Dict[Tuple[StatementType, Scope], pd.DataFrame]: Um DataFrame por demonstrativo
+                e escopo encontrados (pares ausentes no ZIP/diretório são omitidos).
+        """
+        pares = [
+            (statement, scope)
+            for statement in (statements if statements is not None else StatementType)
+            for scope in (scopes if scopes is not None else Scope)
+        ]
+
+        tasks: List[Tuple[Tuple[StatementType, Scope], str, Optional[str], int]] = []
+        if from_zip:
+            zip_path = self._find_zip_path(doc_type, ano)
+            with zipfile.ZipFile(zip_path, "r") as zf:
+                sizes = {info.filename: info.file_size for info in zf.infolist()}
+            for statement, scope in pares:
+                member = UrlBuilder.statement_filename(doc_type, statement, scope, ano)
+                if member in sizes:
+                    tasks.append(((statement, scope), str(zip_path), member, sizes[member]))
+        else:
+            for statement, scope in pares:
+                path = self.path_data_dir / UrlBuilder.statement_filename(doc_type, statement, scope, ano)
+                if path.exists():
+                    tasks.append(((statement, scope), str(path), None, path.stat().st_size))
+        if not tasks:
+            raise FileNotFoundError(
+                f"Nenhum demonstrativo de {doc_type.value} {ano} encontrado. Baixe o ZIP primeiro (ex.: get_zip({ano}))."
+            )
+        tasks.sort(key=lambda t: t[3], reverse=True)
+
+        results: Dict[Tuple[StatementType, Scope], pd.DataFrame] = {}
+        use_ipc = _has_module("pyarrow")
+        # Os processos do pool não compartilham a instrumentação: o lote é medido como um todo
+        with self._instr.stage(
+            "load_all_statements", doc_type=doc_type.value, ano=ano
+        ) as stage, tempfile.TemporaryDirectory(prefix="dados_cvm_ipc_") as tmp, ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _parse_statement, source, member, key[0], sep, encoding, tmp if use_ipc else None
+                ): (key, size)
+                for key, source, member, size in tasks
+            }
+            for future in as_completed(futures):
+                parsed = future.result()
+                key, size = futures[future]
+                results[key] = _read_ipc(parsed) if isinstance(parsed, str) else parsed
+                stage.add(bytes=size, rows=len(results[key]))
+
+        return {key: results[key] for key in pares if key in results}
+
+    def load_balanco(
+        self,
+        ano: int,
+        statement: StatementType,
+        scope: Scope,
+        doc_type: DocType,
+        from_zip: bool = False,
+        sep: Optional[str] = ";",
+        encoding: Optional[str] = "latin1",
+        engine: CSVEngine = "c",
+    ) -> Balanco:
+        """Carrega o demonstrativo com um índice persistente por CD_CVM, CNPJ e CD_CONTA.
+
+        O índice é gerado na primeira leitura e salvo em `.npz` (na partição colunar, ou
+        em `path_data_dir` ao lado dos CSVs). Leituras seguintes reaproveitam o índice
+        enquanto a origem não mudar, e os filtros `filtrar_por_cd_cvm`, `filtrar_por_cnpj`
+        e `filtrar_por_conta` do `Balanco` retornado viram acessos diretos às linhas
+        da companhia/conta, sem comparar a coluna inteira.
+
+        Com `columnar_format="arrow"`, o demonstrativo é aberto com memory map e os
+        filtros por companhia retornam views do arquivo mapeado: vários processos que
+        carregam o mesmo ano compartilham as mesmas páginas, e cada um só ocupa memória
+        com as linhas que efetivamente acessa.
+
+        Args:
+            ano (int): Ano do arquivo.
+            statement (StatementType): Tipo do demonstrativo (ex.: BPA).
+            scope (Scope): Escopo do demonstrativo (ex.: CON, IND).
+            doc_type (DocType): Tipo de documento (ex.: DFP, ITR).
+            from_zip (bool, opcional): Lê o CSV direto do ZIP (ver `load_statement`).
+            sep, encoding, engine: Repassados para `load_statement`.
+
+        Returns:
+            Balanco: Demonstrativo completo, ordenado por CD_CVM, com o índice associado.
+        """
+        source, member = self._resolve_source(ano, statement, scope, doc_type, from_zip)
+        fingerprint = self._fingerprint(source, member, statement)
+        df = self.load_statement(
+            ano, statement, scope, doc_type, sep=sep, encoding=encoding, from_zip=from_zip, engine=engine
+        )
+        assert isinstance(df, pd.DataFrame)
+
+        path = self._index_path(ano, statement, scope, doc_type)
+        index = StatementIndex.load(path)
+        if index is not None and index.fingerprint == fingerprint and index.n_rows == len(df):
+            df = index.apply_order(df)
+        else:
+            df, index = StatementIndex.build(df, fingerprint)
+            index.save(path)
+        return Balanco(df, index=index)
+
+    def load_indicators(
+        self,
+        anos: Iterable[int],
+        scope: Scope,
+        doc_type: DocType,
+        indicadores: Sequence[Indicator] = DEFAULT_INDICATORS,
+        ordem_exerc: Optional[str] = "ÚLTIMO",
+        refresh: bool = False,
+        max_workers: int = 3,
+        from_zip: bool = False,
+        engine: CSVEngine = "c",
+    ) -> pd.DataFrame:
+        """Indicadores financeiros de todas as companhias e datas dos anos informados.
+
+        Cada ano lê só as contas usadas pelos indicadores (ex.: BPA 1.01, BPP 2.01,
+        DRE 3.11) e calcula todos os indicadores de uma vez (ver `IndicatorEngine`).
+        O resultado de cada ano é gravado em `.npz` (no cache colunar, ou em
+        `path_data_dir`) e, enquanto as origens não mudarem, é devolvido sem ler
+        nenhum CSV. Se um ZIP for baixado de novo, as contas são lidas outra vez, mas o
+        resultado só é recalculado se mudar a `VERSAO` de algum documento usado (ver
+        `IndicatorCache`).
+
+        Args:
+            anos (Iterable[int]): Anos desejados.
+            scope (Scope): Escopo dos demonstrativos (ex.: Scope.CON).
+            doc_type (DocType): Tipo de documento (ex.: DocType.DFP).
+            indicadores (Sequence[Indicator], opcional): Indicadores a calcular. Padrão é
+                `DEFAULT_INDICATORS` (liquidez corrente, ROE, margem líquida e endividamento).
+            ordem_exerc (str, opcional): Exercício usado. Padrão é "ÚLTIMO".
+            refresh (bool, opcional): Se True, ignora os resultados gravados. Padrão é False.
+            max_workers (int, opcional): Demonstrativos lidos ao mesmo tempo. Padrão é 3.
+            from_zip, engine: Como em `load_statement`.
+
+        Returns:
+            pd.DataFrame: Uma linha por CD_CVM/DT_REFER, com uma coluna por indicador.
+
+        Raises:
+            FileNotFoundError: se o CSV de algum demonstrativo não for encontrado.
+            ValueError: se `max_workers` < 1.
+
+        Exemplo:
+            df = client.load_indicators(range(2020, 2025), Scope.CON, DocType.DFP)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser >= 1.")
+        ind_engine = IndicatorEngine(indicadores, ordem_exerc=ordem_exerc)
+        contas = ind_engine.contas()
+        cache = IndicatorCache(self._indicators_dir())
+        filters_extra: Filters = {"ORDEM_EXERC": ordem_exerc} if ordem_exerc is not None else {}
+
+        def _load(ano: int, statement: StatementType) -> pd.DataFrame:
+            return self.load_statement(
+                ano,
+                statement,
+                scope,
+                doc_type,
+                cols=ind_engine.columns(statement),
+                filters={"CD_CONTA": contas[statement], **filters_extra},
+                from_zip=from_zip,
+                engine=engine,
+            )
+
+        results = []
+        with self._instr.stage("indicators", doc_type=doc_type.value, scope=scope.value) as stage:
+            for ano in anos:
+                path = cache.path(f"{doc_type.value}_{scope.value}_{ano}", ind_engine.key())
+                sources = {
+                    st.value: self._fingerprint(*self._resolve_source(ano, st, scope, doc_type, from_zip), st)
+                    for st in contas
+                }
+                cached = None if refresh else cache.load(path)
+                if cached is not None and cached[1].get("sources") == sources:
+                    results.append(cached[0])
+                    continue
+
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(contas))) as executor:
+                    frames = dict(zip(contas, executor.map(partial(_load, ano), contas)))
+                digest = IndicatorEngine.versions_digest(ind_engine.versions(frames))
+                if cached is not None and cached[1].get("versions") == digest:
+                    df = cached[0]
+                else:
+                    df = ind_engine.compute(frames)
+                cache.save(path, df, {"sources": sources, "versions": digest})
+                results.append(df)
+
+            df = concat_frames(results)
+            if len(df):
+                df = df.sort_values(list(IndicatorEngine.KEY_COLUMNS), ignore_index=True)
+            stage.add(rows=len(df))
+        return df
+
+    # -----------------------------
+    # FCA, FRE, IPE e cadastro
+    # -----------------------------
+    def load_table(
+        self,
+        ano: int,
+        doc_type: DocType,
+        table: Optional[str] = None,
+        cols: Optional[list[str]] = None,
+        filters: Optional[Filters] = None,
+        chunks: bool = False,
+        chunksize: int = 250_000,
+        sep: Optional[str] = ";",
+        encoding: Optional[str] = "latin1",
+        from_zip: bool = False,
+        engine: CSVEngine = "c",
+        backend: Backend = "pandas",
+    ) -> Any:
+        """Carrega uma tabela do FCA/FRE, os documentos do IPE ou o CSV de índice de um ZIP.
+
+        Usa o mesmo caminho dos demonstrativos: o ZIP vem do cache (ou de `path_data_dir`),
+        o CSV é lido com o esquema do tipo de documento e, com `columnar_dir`
+        configurado, é convertido uma única vez para Parquet/Feather.
+
+        Args:
+            ano (int): Ano do arquivo.
+            doc_type (DocType): Tipo de documento (ex.: DocType.FCA, DocType.FRE, DocType.IPE).
+            table (str, opcional): Tabela do ZIP (ex.: FCATable.VALOR_MOBILIARIO ou
+                "capital_social" no FRE). Se None, lê o CSV principal do ZIP: o índice de
+                documentos entregues (DFP/ITR/FCA/FRE) ou os próprios dados (IPE).
+            cols (list[str], opcional): Colunas a retornar. Se None, todas.
+            filters (dict, opcional): Filtros de igualdade (ver `load_statement`). Só é
+                suportado com backend "pandas".
+            chunks (bool, opcional): Se True, retorna um iterador de DataFrames.
+            chunksize (int, opcional): Tamanho do chunk. Padrão é 250_000.
+            sep, encoding, engine, backend: Repassados para o `CSVReader`.
+            from_zip (bool, opcional): Lê o CSV direto do ZIP (ver `load_statement`).
+
+        Returns:
+            DataFrame (ou iterador de DataFrames, ou o equivalente em Arrow/polars).
+
+        Raises:
+            FileNotFoundError: se o CSV não for encontrado.
+            ValueError: se `filters` for pedido com backend diferente de "pandas".
+
+        Exemplo:
+            Códigos de negociação das companhias para enriquecer os demonstrativos:
+
+                tickers = client.load_table(
+                    2024, DocType.FCA, FCATable.VALOR_MOBILIARIO,
+                    cols=["Codigo_CVM", "Codigo_Negociacao"],
+                )
+        """
+        if filters and backend != "pandas":
+            raise ValueError("filters só é suportado com backend='pandas'.")
+        table = getattr(table, "value", table)
+        filename = UrlBuilder.csv_filename(doc_type, ano, table)
+        source, member = self._resolve_file(doc_type, ano, filename, from_zip)
+        return self._load_dataset(
+            doc_type, table, ano, source, member, cols, filters, chunks, chunksize, sep, encoding, engine, backend
+        )
+
+    def get_cadastro(self, refresh: bool = False, session: Optional[requests.Session] = None) -> Path:
+        """Baixa o cadastro de companhias abertas (cad_cia_aberta.csv) para `path_data_dir`.
+
+        O cadastro é um único CSV (sem ZIP e sem ano), republicado diariamente pela CVM.
+        O download é feito em streaming, como o dos ZIPs. Um arquivo já presente é
+        reutilizado; com `refresh=True` ele é revalidado com uma requisição condicional
+        (If-Modified-Since a partir da data de modificação do arquivo, que recebe o
+        Last-Modified do servidor) e só é baixado de novo se tiver mudado.
+
+        Args:
+            refresh (bool, opcional): Se True, revalida o arquivo com o servidor.
+            session (requests.Session, opcional): Sessão HTTP a reutilizar.
+
+        Returns:
+            Path: Caminho do CSV do cadastro.
+        """
+        path = self.path_data_dir / UrlBuilder.csv_filename(DocType.CAD)
+        if path.exists() and not refresh:
+            return path
+        last_modified = email.utils.formatdate(path.stat().st_mtime, usegmt=True) if path.exists() else None
+        result = ZipDownloader.download_zip_to_file(
+            DocType.CAD,
+            None,
+            path,
+            last_modified=last_modified,
+            session=session or self._http_session(),
+            rate_limiter=self._rate_limiter,
+            instrumentation=self._instr,
+        )
+        if not result.not_modified and result.last_modified:
+            try:
+                mtime = email.utils.parsedate_to_datetime(result.last_modified).timestamp()
+            except (TypeError, ValueError):
+                return path
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def load_cadastro(
+        self,
+        refresh: bool = False,
+        cols: Optional[list[str]] = None,
+        filters: Optional[Filters] = None,
+        sep: Optional[str] = ";",
+        encoding: Optional[str] = "latin1",
+        engine: CSVEngine = "c",
+        backend: Backend = "pandas",
+    ) -> Any:
+        """Carrega o cadastro de companhias abertas, baixando-o se necessário.
+
+        Args:
+            refresh (bool, opcional): Repassado para `get_cadastro`.
+            cols, filters, sep, encoding, engine, backend: Como em `load_table`.
+
+        Returns:
+            DataFrame (ou o equivalente em Arrow/polars) com uma linha por registro.
+
+        Exemplo:
+            Setor de atividade das companhias ativas:
+
+                cad = client.load_cadastro(cols=["CD_CVM", "SETOR_ATIV"], filters={"SIT": "ATIVO"})
+        """
+        if filters and backend != "pandas":
+            raise ValueError("filters só é suportado com backend='pandas'.")
+        path = self.get_cadastro(refresh=refresh)
+        return self._load_dataset(
+            DocType.CAD, None, None, path, None, cols, filters, False, 250_000, sep, encoding, engine, backend
+        )
 
     # -----------------------------
     # Helpers
     # -----------------------------
-    def _find_csv_path(self, doc_type: DocType, statement: StatementType, scope: Scope, ano: int) -> Path:
-        """Resolve o caminho do CSV com base no padrão oficial dos arquivos.
+    def _sync_one(self, result: SyncResult, manifest: SyncManifest, session: requests.Session) -> None:
+        """Sincroniza um par tipo/ano, preenchendo `result` e o registro do manifesto."""
+        ano, doc_type = result.ano, result.doc_type
+        previous = manifest.get(doc_type, ano) or {}
 
-        Padrão esperado (exemplos reais de DFP):
+        if self._cache is not None:
+            zip_path = self._fetch_cached(ano, doc_type, refresh=True, session=session)
+            entry = self._cache.lookup(doc_type, ano)
+            assert entry is not None
+            record = {
+                "url": entry.url,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "size": entry.size,
+                "sha256": entry.sha256,
+            }
+        else:
+            zip_path = self.path_data_dir / UrlBuilder.zip_filename(doc_type, ano)
+            known = bool(previous) and zip_path.exists()
+            download = ZipDownloader.download_zip_to_file(
+                doc_type,
+                ano,
+                zip_path,
+                etag=previous.get("etag") if known else None,
+                last_modified=previous.get("last_modified") if known else None,
+                session=session,
+                rate_limiter=self._rate_limiter,
+                parts=self._download_parts,
+                instrumentation=self._instr,
+            )
+            if download.not_modified:
+                record = {k: previous.get(k) for k in ("url", "etag", "last_modified", "size", "sha256")}
+            else:
+                record = {
+                    "url": download.url,
+                    "etag": download.etag,
+                    "last_modified": download.last_modified,
+                    "size": download.size,
+                    "sha256": download.sha256,
+                }
+
+        result.zip_path = zip_path
+        result.changed = record["sha256"] != previous.get("sha256")
+
+        # Só extrai os CSVs alterados ou ausentes no disco
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            csvs = {
+                info.filename: {"size": info.file_size, "crc32": info.CRC}
+                for info in zf.infolist()
+                if not info.is_dir()
+            }
+        old_csvs = previous.get("csvs", {})
+        stale = [
+            name
+            for name, meta in csvs.items()
+            if old_csvs.get(name) != meta
+            or not (self.path_data_dir / name).exists()
+            or (self.path_data_dir / name).stat().st_size != meta["size"]
+        ]
+        if stale:
+            # A lista já considera o manifesto e o disco: não precisa recalcular os CRC32
+            ZipExtractor.extract_all(
+                zip_path, self.path_data_dir, members=stale, instrumentation=self._instr, skip_unchanged=False
+            )
+        result.extracted = stale
+
+        old_keys = SyncManifest.keys_from_record(previous.get("keys"))
+        if result.changed or "keys" not in previous:
+            index_member = UrlBuilder.csv_filename(doc_type, ano)
+            keys = SyncManifest.read_keys(zip_path, index_member)
+        else:
+            keys = old_keys
+        result.new_keys = SyncManifest.new_keys(keys, old_keys)
+
+        manifest.update(
+            doc_type, ano, {**record, "csvs": csvs, "keys": SyncManifest.keys_to_record(keys)}
+        )
+
+    def _http_session(self, min_pool_size: int = 1) -> requests.Session:
+        """Sessão HTTP do cliente, com pool de pelo menos `min_pool_size` conexões."""
+        with self._session_lock:
+            if self._session is None:
+                self._session = ZipDownloader.create_session(max(self._pool_size, min_pool_size))
+            elif min_pool_size > self._pool_size:
+                # Amplia o pool para os downloads paralelos (conexões abertas são descartadas)
+                adapter = HTTPAdapter(pool_connections=min_pool_size, pool_maxsize=min_pool_size)
+                self._session.mount("https://", adapter)
+                self._session.mount("http://", adapter)
+            self._pool_size = max(self._pool_size, min_pool_size)
+            return self._session
+
+    def _fetch_cached(
+        self,
+        ano: int,
+        doc_type: DocType,
+        refresh: bool = False,
+        session: Optional[requests.Session] = None,
+    ) -> Path:
+        """Obtém o caminho do ZIP no cache, revalidando com o servidor apenas quando necessário.
+
+        Downloads novos são gravados em streaming numa área temporária do cache e
+        movidos para o blob definitivo, sem passar pela memória.
+        """
+        assert self._cache is not None
+        entry = self._cache.lookup(doc_type, ano)
+        if entry is not None and not refresh and self._cache.is_fresh(entry):
+            self._cache.touch(doc_type, ano)
+            return self._cache.blob_path(entry.sha256)
+
+        staging = self._cache.staging_path(doc_type, ano)
+        result = ZipDownloader.download_zip_to_file(
+            doc_type,
+            ano,
+            staging,
+            etag=entry.etag if entry else None,
+            last_modified=entry.last_modified if entry else None,
+            session=session,
+            rate_limiter=self._rate_limiter,
+            parts=self._download_parts,
+            instrumentation=self._instr,
+        )
+        if result.not_modified:
+            assert entry is not None
+            self._cache.touch(doc_type, ano, revalidated=True)
+            return self._cache.blob_path(entry.sha256)
+
+        entry = self._cache.store_file(
+            doc_type,
+            ano,
+            staging,
+            url=result.url,
+            etag=result.etag,
+            last_modified=result.last_modified,
+            sha256=result.sha256,
+        )
+        return self._cache.blob_path(entry.sha256)
+
+    def _load_columnar(
+        self,
+        ano: int,
+        statement: StatementType,
+        scope: Scope,
+        doc_type: DocType,
+        source: Path,
+        member: Optional[str],
+        cols: Optional[list[str]],
+        sep: Optional[str],
+        encoding: Optional[str],
+        engine: CSVEngine = "c",
+        backend: Backend = "pandas",
+        filters: Optional[Filters] = None,
+    ) -> pd.DataFrame:
+        """Lê o demonstrativo do cache colunar, (re)convertendo o CSV se a origem mudou."""
+        assert self._columnar is not None
+        fingerprint = self._fingerprint(source, member, statement)
+        if not self._columnar.is_valid(doc_type, statement, scope, ano, fingerprint):
+            full = CSVReader.read_csv(
+                source,
+                statement=statement,
+                encoding=encoding,
+                sep=sep,
+                member=member,
+                engine=engine,
+                instrumentation=self._instr,
+            )
+            assert isinstance(full, pd.DataFrame)
+            # Grava já na ordem do índice, para que `load_balanco` não precise reordenar
+            full, index = StatementIndex.build(full, fingerprint)
+            index.order = None
+            self._columnar.write(doc_type, statement, scope, ano, full, fingerprint)
+            index.save(self._columnar.partition_dir(doc_type, statement, scope, ano) / self.INDEX_FILENAME)
+        with self._instr.stage(
+            "columnar_read", doc_type=doc_type.value, statement=statement.value, scope=scope.value, ano=ano
+        ) as stage:
+            df = self._columnar.read(
+                doc_type, statement, scope, ano, columns=cols, backend=backend, filters=filters
+            )
+            stage.add(rows=len(df))
+        return df
+
+    def _load_dataset(
+        self,
+        doc_type: DocType,
+        table: Optional[str],
+        ano: Optional[int],
+        source: Path,
+        member: Optional[str],
+        cols: Optional[list[str]],
+        filters: Optional[Filters],
+        chunks: bool,
+        chunksize: int,
+        sep: Optional[str],
+        encoding: Optional[str],
+        engine: CSVEngine,
+        backend: Backend,
+    ) -> Any:
+        """Leitura comum de `load_table`/`load_cadastro` (colunar, em chunks ou completa)."""
+        # Demonstrativos pedidos como tabela (ex.: "BPA_con") mantêm o esquema próprio
+        match = ZipExtractor.match_statement(member or source.name)
+        statement = match[0] if match else None
+        read_cols = cols
+        if filters and cols is not None:
+            read_cols = list(cols) + [c for c in filters if c not in cols]
+
+        if self._columnar is not None and not chunks:
+            partition = self._columnar.table_dir(doc_type, table, ano)
+            fingerprint = self._fingerprint(source, member, statement, doc_type)
+            if not self._columnar.is_valid_partition(partition, fingerprint):
+                full = CSVReader.read_csv(
+                    source,
+                    statement=statement,
+                    doc_type=doc_type,
+                    encoding=encoding,
+                    sep=sep,
+                    member=member,
+                    engine=engine,
+                    instrumentation=self._instr,
+                )
+                self._columnar.write_partition(partition, full, fingerprint)
+            labels = {"doc_type": doc_type.value, "table": table or "_main"}
+            if ano is not None:
+                labels["ano"] = ano
+            with self._instr.stage("columnar_read", **labels) as stage:
+                df = self._columnar.read_partition(partition, columns=read_cols, backend=backend, filters=filters)
+                stage.add(rows=len(df))
+            return self._apply_filters(df, filters, cols) if filters else df
+
+        reader = CSVReader.read_csv(
+            source,
+            chunksize=chunksize if chunks or filters else None,
+            usecols=read_cols,
+            statement=statement,
+            doc_type=doc_type,
+            encoding=encoding,
+            sep=sep,
+            member=member,
+            engine=engine,
+            backend=backend,
+            instrumentation=self._instr,
+        )
+        if not filters:
+            return reader
+        # Só as linhas filtradas de cada chunk ficam em memória
+        filtered = (self._apply_filters(chunk, filters, cols) for chunk in reader)
+        return filtered if chunks else concat_frames(list(filtered))
+
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """`standardize_dataframe` medido como a etapa "normalize"."""
+        with self._instr.stage("normalize") as stage:
+            df = standardize_dataframe(df, date_format=CVM_DATE_FORMAT)
+            stage.add(rows=len(df))
+        return df
+
+    @staticmethod
+    def _fingerprint(
+        source: Path,
+        member: Optional[str],
+        statement: Optional[StatementType],
+        doc_type: Optional[DocType] = None,
+    ) -> dict:
+        """Impressão digital da origem mais o esquema de leitura do demonstrativo (ou do tipo de documento)."""
+        fingerprint = source_fingerprint(source, member)
+        # Mudanças no esquema de leitura também invalidam os dados derivados
+        if statement is not None:
+            fingerprint["schema"] = {
+                "dtypes": CSVReader.get_default_dtypes(statement),
+                "dates": CSVReader.get_default_date_cols(statement),
+            }
+        else:
+            fingerprint["schema"] = {
+                "dtypes": CSVReader.get_dataset_dtypes(doc_type),
+                "dates": CSVReader.get_dataset_date_cols(doc_type),
+            }
+        return fingerprint
+
+    def _resolve_source(
+        self, ano: int, statement: StatementType, scope: Scope, doc_type: DocType, from_zip: bool
+    ) -> tuple[Path, Optional[str]]:
+        """Origem do demonstrativo: (ZIP, membro) com `from_zip`, ou (CSV extraído, None)."""
+        filename = UrlBuilder.statement_filename(doc_type, statement, scope, ano)
+        return self._resolve_file(doc_type, ano, filename, from_zip)
+
+    def _resolve_file(
+        self, doc_type: DocType, ano: int, filename: str, from_zip: bool
+    ) -> tuple[Path, Optional[str]]:
+        """Origem de um CSV do ZIP: (ZIP, membro) com `from_zip`, ou (CSV extraído, None)."""
+        if from_zip:
+            return self._find_zip_path(doc_type, ano), filename
+        return self._find_csv_path(doc_type, ano, filename), None
+
+    def _indicators_dir(self) -> Path:
+        """Diretório dos resultados de `load_indicators`."""
+        base = self._columnar.root if self._columnar is not None else self.path_data_dir
+        return base / "indicadores"
+
+    def _index_path(
+        self, ano: int, statement: StatementType, scope: Scope, doc_type: DocType
+    ) -> Path:
+        """Arquivo do índice: na partição colunar, ou ao lado dos CSVs em `path_data_dir`."""
+        if self._columnar is not None:
+            return self._columnar.partition_dir(doc_type, statement, scope, ano) / self.INDEX_FILENAME
+        filename = UrlBuilder.statement_filename(doc_type, statement, scope, ano)
+        return self.path_data_dir / f"{Path(filename).stem}.idx.npz"
+
+    @staticmethod
+    def _apply_filters(df: pd.DataFrame, filters: Filters, cols: Optional[list[str]]) -> pd.DataFrame:
+        """Mantém as linhas que atendem aos filtros e apenas as colunas pedidas."""
+        mask = build_mask(df, filters)
+        if mask is not None:
+            df = df[mask]
+        if cols is not None:
+            df = df[list(cols)]
+        return df
+
+    def _find_zip_path(self, doc_type: DocType, ano: int) -> Path:
+        """Resolve o ZIP no disco (cache ou `path_data_dir`), baixando-o se necessário."""
+        if self._cache is not None:
+            cached = self._cache.path(doc_type, ano)
+            if cached is not None:
+                return cached
+        else:
+            path = self.path_data_dir / UrlBuilder.zip_filename(doc_type, ano)
+            if path.exists():
+                return path
+        zip_path = self.get_zip(ano, doc_type, extrair=False, streaming=True)
+        assert isinstance(zip_path, Path)
+        return zip_path
+
+    def _find_csv_path(self, doc_type: DocType, ano: int, filename: str) -> Path:
+        """Resolve o caminho de um CSV já extraído em `path_data_dir`.
+
+        O nome segue o padrão oficial dos arquivos (ver `UrlBuilder.csv_filename`), ex.:
             dfp_cia_aberta_DRE_con_2024.csv
-            dfp_cia_aberta_BPA_ind_2024.csv
+            fca_cia_aberta_geral_2024.csv
         """
-        # Nome no padrão visto nos arquivos oficiais
-        filename = f"{doc_type.value}_cia_aberta_{statement.value}_{scope.value}_{ano}.csv"
         path = self.path_data_dir / filename
         if not path.exists():
             raise FileNotFoundError(
-                f"Arquivo não encontrado: {path}. Baixe e extraia o ZIP primeiro (ex.: get_zip({ano}))."
+                f"Arquivo não encontrado: {path}. Baixe e extraia o ZIP primeiro "
+                f"(ex.: get_zip({ano}, DocType.{doc_type.name}))."
             )
         return path
 
+
+
+def _parse_statement(
+    source: str,
+    member: Optional[str],
+    statement: StatementType,
+    sep: Optional[str],
+    encoding: Optional[str],
+    out_dir: Optional[str],
+) -> str | pd.DataFrame:
+    """Lê um demonstrativo em um processo do pool de `load_all_statements`.
+
+    Com `out_dir`, grava a tabela em Arrow IPC e retorna o caminho do arquivo;
+    sem ele, retorna o próprio DataFrame.
+    """
+    if out_dir is None:
+        return CSVReader.read_csv(source, statement=statement, member=member, sep=sep, encoding=encoding)
+
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    table = CSVReader.read_csv(
+        source, statement=statement, member=member, sep=sep, encoding=encoding, backend="arrow"
+    )
+    # O leitor do pyarrow gera um bloco por trecho de 1 MB, cada um com o próprio
+    # dicionário nas colunas `category`; o formato IPC de arquivo aceita um único
+    # dicionário por coluna. Um único bloco também permite a leitura sem cópia.
+    table = table.unify_dictionaries().combine_chunks()
+    path = Path(out_dir) / f"{Path(member or source).stem}.arrow"
+    with pa.OSFile(str(path), "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return str(path)
+
+
+def _read_ipc(path: str) -> pd.DataFrame:
+    """Lê (com memory map) o arquivo Arrow IPC gravado por `_parse_statement`.
+
+    Colunas numéricas e datas sem nulos viram views do arquivo mapeado; as demais
+    são convertidas liberando a tabela Arrow coluna a coluna.
+    """
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    with pa.memory_map(path, "r") as source:
+        table = ipc.open_file(source).read_all()
+    return table.to_pandas(
+        split_blocks=True, self_destruct=True, types_mapper=CSVReader.pandas_types_mapper
+    )
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Final, Iterable, Literal, Optional
+
+import pandas as pd
+
+from .endpoints import DocType, Scope, StatementType
+from .read import Backend, CSVReader
+from .utils import Filters, filters_to_arrow, source_fingerprint
+
+__all__ = ["ColumnarCache", "ColumnarFormat"]
+
+ColumnarFormat = Literal["parquet", "feather", "arrow"]
+
+
+class ColumnarCache:
+    """Cache colunar (Parquet/Feather) dos demonstrativos já convertidos para DataFrame.
+
+    Cada CSV é convertido uma única vez, com os dtypes do `CSVReader`, e gravado em
+    uma partição `doc_type=<tipo>/statement=<demonstrativo>/scope=<escopo>/ano=<ano>`.
+    Um arquivo `_source.json` guarda a impressão digital da origem (tamanho e mtime do
+    CSV, ou CRC/tamanho do membro do ZIP); enquanto ela não mudar, leituras seguintes
+    carregam apenas as colunas pedidas do arquivo colunar, sem reler o CSV.
+
+    Os demais arquivos (índices, tabelas do FCA/FRE, IPE e cadastro) usam partições
+    `doc_type=<tipo>/table=<tabela>/ano=<ano>` (ver `table_dir`) e os métodos `*_partition`.
+
+    No formato "arrow" a partição é um Arrow IPC sem compressão, gravado em um único
+    bloco e lido com memory map: processos que leem o mesmo demonstrativo compartilham
+    o page cache do sistema, e o DataFrame pandas aponta direto para o arquivo mapeado
+    (colunas numéricas, datas e códigos das categorias; textos `object` são copiados).
+    Só as páginas efetivamente acessadas ocupam memória. As colunas mapeadas são somente
+    leitura, e operações do pandas que consolidam blocos (ex.: `df.copy()`, `df.values`)
+    materializam os dados em memória.
+
+    Requer o pacote opcional `pyarrow`.
+
+    Args:
+        root: Diretório raiz do cache colunar.
+        format: "parquet" (padrão, comprimido), "feather" (Arrow IPC comprimido, leitura
+            mais rápida) ou "arrow" (Arrow IPC sem compressão, com memory map).
+
+    Raises:
+        ImportError: se o `pyarrow` não estiver instalado.
+        ValueError: se o formato for desconhecido.
+    """
+
+    FORMATS: Final[tuple[str, ...]] = ("parquet", "feather", "arrow")
+    SOURCE_FILENAME: Final[str] = "_source.json"
+
+    def __init__(self, root: str | Path, format: ColumnarFormat = "parquet"):
+        if format not in self.FORMATS:
+            raise ValueError(f"Formato colunar inválido: {format!r}. Use um de {self.FORMATS}.")
+        if importlib.util.find_spec("pyarrow") is None:
+            raise ImportError("O cache colunar requer o pacote 'pyarrow' (pip install pyarrow).")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.format = format
+
+    # -----------------------------
+    # Caminhos
+    # -----------------------------
+    def partition_dir(self, doc_type: DocType, statement: StatementType, scope: Scope, ano: int) -> Path:
+        """Diretório da partição do demonstrativo."""
+        return (
+            self.root
+            / f"doc_type={doc_type.value}"
+            / f"statement={statement.value}"
+            / f"scope={scope.value}"
+            / f"ano={ano}"
+        )
+
+    def data_path(self, doc_type: DocType, statement: StatementType, scope: Scope, ano: int) -> Path:
+        """Arquivo colunar da partição (ex.: .../ano=2024/data.parquet)."""
+        return self.partition_data_path(self.partition_dir(doc_type, statement, scope, ano))
+
+    def table_dir(self, doc_type: DocType, table: Optional[str], ano: Optional[int]) -> Path:
+        """Diretório da partição de um arquivo que não é demonstrativo.
+
+        Layout `doc_type=<tipo>/table=<tabela>/ano=<ano>`; o CSV principal do ZIP (sem
+        tabela) usa `table=_main` e o cadastro, que não tem ano, fica sem `ano=`.
+        """
+        partition = self.root / f"doc_type={doc_type.value}" / f"table={getattr(table, 'value', table) or '_main'}"
+        return partition / f"ano={ano}" if ano is not None else partition
+
+    def partition_data_path(self, partition: Path) -> Path:
+        """Arquivo colunar de uma partição (ver `partition_dir`/`table_dir`)."""
+        return partition / f"data.{self.format}"
+
+    # -----------------------------
+    # Validade
+    # -----------------------------
+    @staticmethod
+    def fingerprint(source: str | Path, member: Optional[str] = None) -> Dict[str, object]:
+        """Impressão digital da origem usada para invalidar o cache (ver `source_fingerprint`)."""
+        return source_fingerprint(source, member)
+
+    def is_valid(
+        self,
+        doc_type: DocType,
+        statement: StatementType,
+        scope: Scope,
+        ano: int,
+        fingerprint: Dict[str, object],
+    ) -> bool:
+        """True se a partição existe e foi gerada a partir da mesma origem."""
+        return self.is_valid_partition(self.partition_dir(doc_type, statement, scope, ano), fingerprint)
+
+    def is_valid_partition(self, partition: Path, fingerprint: Dict[str, object]) -> bool:
+        """`is_valid` para uma partição qualquer."""
+        meta = partition / self.SOURCE_FILENAME
+        if not meta.exists() or not self.partition_data_path(partition).exists():
+            return False
+        try:
+            return json.loads(meta.read_text(encoding="utf-8")) == fingerprint
+        except ValueError:
+            return False
+
+    # -----------------------------
+    # Leitura / escrita
+    # -----------------------------
+    def read(
+        self,
+        doc_type: DocType,
+        statement: StatementType,
+        scope: Scope,
+        ano: int,
+        columns: Optional[Iterable[str]] = None,
+        backend: Backend = "pandas",
+        filters: Optional[Filters] = None,
+    ) -> Any:
+        """Lê a partição, carregando apenas as colunas pedidas.
+
+        Args:
+            columns: Colunas a carregar. Se None, todas.
+            backend: "pandas" (padrão), "arrow" (`pyarrow.Table`) ou "polars".
+            filters: Filtros de igualdade empurrados para o leitor Parquet, que descarta
+                row groups e linhas que não os atendem. Ignorados nos formatos Feather
+                e Arrow (o chamador deve filtrar o resultado).
+        """
+        return self.read_partition(
+            self.partition_dir(doc_type, statement, scope, ano), columns=columns, backend=backend, filters=filters
+        )
+
+    def read_partition(
+        self,
+        partition: Path,
+        columns: Optional[Iterable[str]] = None,
+        backend: Backend = "pandas",
+        filters: Optional[Filters] = None,
+    ) -> Any:
+        """`read` para uma partição qualquer."""
+        path = self.partition_data_path(partition)
+        cols = list(columns) if columns is not None else None
+        arrow_filters = filters_to_arrow(filters) if self.format == "parquet" else None
+        if backend == "pandas":
+            if self.format == "parquet":
+                return pd.read_parquet(path, columns=cols, filters=arrow_filters)
+            if self.format == "feather":
+                return pd.read_feather(path, columns=cols)
+
+        if self.format == "parquet":
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(path, columns=cols, filters=arrow_filters)
+        else:
+            import pyarrow.feather as feather
+
+            table = feather.read_table(path, columns=cols, memory_map=self.format == "arrow")
+        if backend == "pandas":
+            # Um bloco por coluna: colunas sem nulos viram views do arquivo mapeado
+            return table.to_pandas(split_blocks=True, types_mapper=CSVReader.pandas_types_mapper)
+        return CSVReader.to_backend(table, backend)
+
+    def write(
+        self,
+        doc_type: DocType,
+        statement: StatementType,
+        scope: Scope,
+        ano: int,
+        df: pd.DataFrame,
+        fingerprint: Dict[str, object],
+    ) -> Path:
+        """Grava a partição de forma atômica e registra a origem."""
+        return self.write_partition(self.partition_dir(doc_type, statement, scope, ano), df, fingerprint)
+
+    def write_partition(self, partition: Path, df: pd.DataFrame, fingerprint: Dict[str, object]) -> Path:
+        """`write` para uma partição qualquer."""
+        partition.mkdir(parents=True, exist_ok=True)
+        path = self.partition_data_path(partition)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        df = df.reset_index(drop=True)
+        if self.format == "parquet":
+            df.to_parquet(tmp, index=False)
+        elif self.format == "feather":
+            df.to_feather(tmp)
+        else:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+
+            # Sem compressão e em um único bloco, para que a leitura não precise copiar
+            table = pa.Table.from_pandas(df, preserve_index=False).combine_chunks()
+            feather.write_feather(table, tmp, compression="uncompressed", chunksize=max(len(table), 1))
+        # Leitores que já mapearam o arquivo anterior continuam com a versão antiga
+        os.replace(tmp, path)
+
+        meta = partition / self.SOURCE_FILENAME
+        meta.write_text(json.dumps(fingerprint), encoding="utf-8")
+        return path
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from typing import Dict, Final, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["StatementCube"]
+
+
+class StatementCube:
+    """Demonstrativo no formato largo: cubo companhia × DT_REFER × CD_CONTA.
+
+    Substitui o `pivot_table` sobre o formato longo (`CD_CONTA`/`DS_CONTA`/`VL_CONTA`)
+    por uma construção vetorizada: cada eixo é fatorizado uma única vez e os valores
+    são espalhados em um array NumPy pela posição linear `(companhia, data, conta)`.
+
+    Na construção (`from_frame`):
+      * `VL_CONTA` é multiplicado pela escala de `ESCALA_MOEDA` (UNIDADE = 1, MIL = 1000);
+      * quando há mais de uma `VERSAO` para a mesma célula, fica a maior (reapresentações);
+      * por padrão só entram as linhas de `ORDEM_EXERC == "ÚLTIMO"`.
+
+    O cubo pode ser denso (`values`, NaN onde não há dado) ou esparso (só as células
+    preenchidas, em coordenadas). Triagens entre companhias viram operações de array:
+
+        cube = StatementCube.from_frame(df_bpa)
+        ativo = cube.conta("1")            # companhias × datas
+        circ = cube.conta("1.01")
+        selecionadas = cube.companies[(circ / ativo)[:, -1] > 0.5]
+
+    Attributes:
+        companies: `CD_CVM` de cada linha do cubo (ordenados).
+        dates: `DT_REFER` de cada coluna do cubo (ordenadas).
+        contas: `CD_CONTA` de cada camada do cubo (ordenados).
+        descricoes: `DS_CONTA` de cada conta (primeira descrição encontrada).
+    """
+
+    ESCALAS: Final[Dict[str, float]] = {"UNIDADE": 1.0, "MIL": 1000.0}
+
+    def __init__(
+        self,
+        companies: np.ndarray,
+        dates: pd.DatetimeIndex,
+        contas: np.ndarray,
+        values: Optional[np.ndarray] = None,
+        coords: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+        data: Optional[np.ndarray] = None,
+        descricoes: Optional[np.ndarray] = None,
+    ):
+        if (values is None) == (coords is None or data is None):
+            raise ValueError("Informe `values` (denso) ou `coords` e `data` (esparso).")
+        self.companies = companies
+        self.dates = dates
+        self.contas = contas
+        self.descricoes = descricoes
+        self._values = values
+        self._coords = coords
+        self._data = data
+        self._conta_pos: Dict[str, int] = {c: i for i, c in enumerate(contas.tolist())}
+        self._company_pos: Dict[int, int] = {c: i for i, c in enumerate(companies.tolist())}
+
+    # -----------------------------
+    # Construção
+    # -----------------------------
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        *,
+        ordem_exerc: Optional[str] = "ÚLTIMO",
+        scale: bool = True,
+        sparse: bool = False,
+        value_col: str = "VL_CONTA",
+    ) -> 'StatementCube':
+        """Constrói o cubo a partir de um demonstrativo no formato longo.
+
+        Args:
+            df: Demonstrativo com `CD_CVM`, `DT_REFER`, `CD_CONTA` e `VL_CONTA` (e,
+                se houver, `VERSAO`, `ESCALA_MOEDA`, `ORDEM_EXERC` e `DS_CONTA`).
+            ordem_exerc: Exercício mantido ("ÚLTIMO" ou "PENÚLTIMO"). Se None, não filtra.
+            scale: Se True, aplica `ESCALA_MOEDA` aos valores.
+            sparse: Se True, guarda só as células preenchidas.
+            value_col: Coluna de valores.
+
+        Linhas sem `CD_CVM`, `DT_REFER` ou `CD_CONTA` são descartadas: não há célula
+        do cubo para elas.
+
+        Raises:
+            ValueError: se restar mais de um valor para a mesma célula (ex.: DMPL com
+                várias `COLUNA_DF`, ou `ordem_exerc=None` com os dois exercícios).
+        """
+        if ordem_exerc is not None and "ORDEM_EXERC" in df.columns:
+            df = df[(df["ORDEM_EXERC"] == ordem_exerc).to_numpy()]
+        # pd.factorize codifica ausentes como -1, que o ravel_multi_index rejeita
+        sem_chave = df[["CD_CVM", "DT_REFER", "CD_CONTA"]].isna().any(axis=1).to_numpy()
+        if sem_chave.any():
+            df = df[~sem_chave]
+
+        c_codes, companies = pd.factorize(df["CD_CVM"], sort=True)
+        dt = df["DT_REFER"]
+        if not pd.api.types.is_datetime64_any_dtype(dt):
+            dt = pd.to_datetime(dt, format="%Y-%m-%d")
+        d_codes, dates = pd.factorize(dt, sort=True)
+        a_codes, contas = pd.factorize(df["CD_CONTA"].astype(str), sort=True)
+
+        values = df[value_col].to_numpy(dtype=np.float64)
+        if scale and "ESCALA_MOEDA" in df.columns:
+            values = values * cls._scale_factors(df["ESCALA_MOEDA"])
+
+        shape = (len(companies), len(dates), len(contas))
+        flat = np.ravel_multi_index((c_codes, d_codes, a_codes), shape)
+
+        # Mantém a maior VERSAO de cada célula: ordena por (célula, versão) e fica o último
+        versoes = df["VERSAO"].to_numpy(dtype=np.int32, na_value=-1) if "VERSAO" in df.columns else None
+        if versoes is not None:
+            order = np.lexsort((versoes, flat))
+        else:
+            order = np.argsort(flat, kind="stable")
+        flat_sorted = flat[order]
+        last = np.ones(len(flat_sorted), dtype=bool)
+        last[:-1] = flat_sorted[1:] != flat_sorted[:-1]
+        if versoes is not None:
+            versao = versoes[order]
+            empate = ~last[:-1] & (versao[1:] == versao[:-1])
+            if empate.any():
+                raise ValueError(
+                    "Há mais de um valor por companhia/data/conta na mesma VERSAO; "
+                    "filtre o demonstrativo (ex.: ORDEM_EXERC, COLUNA_DF) antes de montar o cubo."
+                )
+        keep = order[last]
+
+        descricoes = None
+        if "DS_CONTA" in df.columns:
+            _, first = np.unique(a_codes, return_index=True)
+            descricoes = df["DS_CONTA"].astype(str).to_numpy()[first]
+
+        companies_arr = np.asarray(companies)
+        dates_idx = pd.DatetimeIndex(dates)
+        contas_arr = np.asarray(contas).astype(str)
+        if sparse:
+            coords = (c_codes[keep], d_codes[keep], a_codes[keep])
+            return cls(companies_arr, dates_idx, contas_arr, coords=coords, data=values[keep], descricoes=descricoes)
+
+        dense = np.full(shape, np.nan, dtype=np.float64)
+        dense.reshape(-1)[flat[keep]] = values[keep]
+        return cls(companies_arr, dates_idx, contas_arr, values=dense, descricoes=descricoes)
+
+    # -----------------------------
+    # Acesso
+    # -----------------------------
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """(companhias, datas, contas)."""
+        return (len(self.companies), len(self.dates), len(self.contas))
+
+    @property
+    def is_sparse(self) -> bool:
+        return self._values is None
+
+    @property
+    def values(self) -> np.ndarray:
+        """Array denso companhias × datas × contas (NaN onde não há dado)."""
+        return self.to_dense()
+
+    def to_dense(self) -> np.ndarray:
+        """Array denso; no cubo esparso é materializado a cada chamada."""
+        if self._values is not None:
+            return self._values
+        assert self._coords is not None and self._data is not None
+        dense = np.full(self.shape, np.nan, dtype=np.float64)
+        dense[self._coords] = self._data
+        return dense
+
+    def conta(self, cd_conta: str) -> np.ndarray:
+        """Valores de uma conta para todas as companhias e datas (companhias × datas)."""
+        a = self._conta_pos.get(str(cd_conta))
+        if a is None:
+            raise KeyError(f"Conta não encontrada no cubo: {cd_conta}")
+        if self._values is not None:
+            return self._values[:, :, a]
+        assert self._coords is not None and self._data is not None
+        c, d, contas = self._coords
+        sel = contas == a
+        out = np.full(self.shape[:2], np.nan, dtype=np.float64)
+        out[c[sel], d[sel]] = self._data[sel]
+        return out
+
+    def company(self, cd_cvm: int) -> pd.DataFrame:
+        """Demonstrativo de uma companhia no formato largo (datas × contas)."""
+        i = self._company_pos.get(int(cd_cvm))
+        if i is None:
+            raise KeyError(f"Companhia não encontrada no cubo: {cd_cvm}")
+        if self._values is not None:
+            block = self._values[i]
+        else:
+            assert self._coords is not None and self._data is not None
+            c, d, a = self._coords
+            sel = c == i
+            block = np.full(self.shape[1:], np.nan, dtype=np.float64)
+            block[d[sel], a[sel]] = self._data[sel]
+        return pd.DataFrame(block, index=self.dates, columns=self.contas)
+
+    def to_frame(self, dt_refer: str | pd.Timestamp) -> pd.DataFrame:
+        """Corte de uma data: companhias × contas, com `CD_CVM` no índice."""
+        d = self.dates.get_loc(pd.Timestamp(dt_refer))
+        if self._values is not None:
+            block = self._values[:, d, :]
+        else:
+            assert self._coords is not None and self._data is not None
+            c, dd, a = self._coords
+            sel = dd == d
+            block = np.full((self.shape[0], self.shape[2]), np.nan, dtype=np.float64)
+            block[c[sel], a[sel]] = self._data[sel]
+        return pd.DataFrame(
+            block,
+            index=pd.Index(self.companies, name="CD_CVM"),
+            columns=pd.Index(self.contas, name="CD_CONTA"),
+        )
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    @classmethod
+    def _scale_factors(cls, escala: pd.Series) -> np.ndarray:
+        """Fator de cada linha a partir de `ESCALA_MOEDA` (desconhecida = 1)."""
+        codes, uniques = pd.factorize(escala)
+        factors = np.array([cls.ESCALAS.get(str(u).upper(), 1.0) for u in uniques] + [1.0])
+        # Código -1 (ausente) indexa o último elemento, que é 1.0
+        return factors[codes]
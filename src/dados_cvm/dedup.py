@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Final, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .utils import concat_frames
+
+__all__ = ["LatestVersionFilter"]
+
+
+class LatestVersionFilter:
+    """Mantém só a maior `VERSAO` de cada `(CD_CVM, DT_REFER, ORDEM_EXERC, CD_CONTA)`.
+
+    Os arquivos da CVM trazem várias versões da mesma companhia/período quando um
+    documento é reapresentado. Em vez de ordenar e aplicar `drop_duplicates` sobre o
+    DataFrame inteiro, o filtro acompanha os chunks da leitura com um mapa compacto
+    chave -> versão máxima:
+
+      * cada chave é codificada em um único `uint64` (CD_CVM com 24 bits; DT_REFER,
+        ORDEM_EXERC e CD_CONTA por vocabulário com 14, 2 e 24 bits);
+      * o mapa é um par de arrays ordenados (chaves `uint64`, versões `int32`), cerca de
+        12 bytes por chave, atualizado de forma vetorizada a cada chunk.
+
+    Uso em uma passada (`stream`): linhas de um chunk já superadas são descartadas na
+    hora; as que forem superadas por chunks seguintes são descartadas no final.
+
+    Uso em duas passadas: `update` com todos os chunks (só as colunas-chave) e depois
+    `is_latest` em cada chunk da leitura completa.
+    """
+
+    KEY_COLUMNS: Final[tuple[str, ...]] = ("CD_CVM", "DT_REFER", "ORDEM_EXERC", "CD_CONTA")
+    VERSION_COLUMN: Final[str] = "VERSAO"
+    # Bits de cada coluna da chave (somam 64)
+    _BITS: Final[tuple[int, ...]] = (24, 14, 2, 24)
+
+    def __init__(self) -> None:
+        # Id 0 fica reservado para valores ausentes
+        self._vocab: Dict[str, Dict[Any, int]] = {c: {} for c in self.KEY_COLUMNS[1:]}
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._max = np.empty(0, dtype=np.int32)
+
+    @classmethod
+    def columns(cls) -> List[str]:
+        """Colunas necessárias para a deduplicação."""
+        return [*cls.KEY_COLUMNS, cls.VERSION_COLUMN]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # -----------------------------
+    # Mapa chave -> versão máxima
+    # -----------------------------
+    def encode(self, df: pd.DataFrame) -> np.ndarray:
+        """Codifica a chave de cada linha em um `uint64`."""
+        # CD_CVM ausente vira 0, como o id reservado das demais colunas
+        cd_cvm = df[self.KEY_COLUMNS[0]].to_numpy(dtype=np.int64, na_value=0)
+        if len(cd_cvm) and (cd_cvm.min() < 0 or cd_cvm.max() >= 1 << self._BITS[0]):
+            raise ValueError("CD_CVM fora do intervalo suportado pela deduplicação.")
+        keys = cd_cvm.astype(np.uint64)
+        for col, bits in zip(self.KEY_COLUMNS[1:], self._BITS[1:]):
+            keys = (keys << np.uint64(bits)) | self._vocab_ids(df[col], col, bits)
+        return keys
+
+    def update(self, df: pd.DataFrame, keys: Optional[np.ndarray] = None) -> np.ndarray:
+        """Incorpora as versões de um chunk ao mapa e retorna as chaves codificadas."""
+        if keys is None:
+            keys = self.encode(df)
+        versions = self._versions(df)
+        k = np.concatenate([self._keys, keys])
+        v = np.concatenate([self._max, versions])
+        order = np.lexsort((v, k))
+        k, v = k[order], v[order]
+        last = np.ones(len(k), dtype=bool)
+        last[:-1] = k[1:] != k[:-1]
+        self._keys, self._max = k[last], v[last]
+        return keys
+
+    def latest(self, keys: np.ndarray) -> np.ndarray:
+        """Versão máxima conhecida de cada chave (-1 se a chave nunca foi vista)."""
+        if not len(self._keys):
+            return np.full(len(keys), -1, dtype=np.int32)
+        pos = np.searchsorted(self._keys, keys)
+        pos = np.minimum(pos, len(self._keys) - 1)
+        found = self._keys[pos] == keys
+        return np.where(found, self._max[pos], -1)
+
+    def is_latest(self, df: pd.DataFrame, keys: Optional[np.ndarray] = None) -> np.ndarray:
+        """Máscara das linhas que estão na versão máxima conhecida."""
+        if keys is None:
+            keys = self.encode(df)
+        return self._versions(df) >= self.latest(keys)
+
+    # -----------------------------
+    # Atalhos
+    # -----------------------------
+    def stream(self, chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+        """Deduplica uma sequência de chunks em uma única passada."""
+        kept: List[Tuple[pd.DataFrame, np.ndarray, np.ndarray]] = []
+        for chunk in chunks:
+            keys = self.update(chunk)
+            mask = self.is_latest(chunk, keys)
+            if not mask.all():
+                chunk, keys = chunk[mask], keys[mask]
+            kept.append((chunk, keys, self._versions(chunk)))
+
+        # Descarta o que foi superado por chunks posteriores
+        frames = []
+        for chunk, keys, versions in kept:
+            mask = versions >= self.latest(keys)
+            frames.append(chunk if mask.all() else chunk[mask])
+        return concat_frames(frames)
+
+    @classmethod
+    def apply(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Deduplica um DataFrame já carregado."""
+        dedup = cls()
+        keys = dedup.update(df)
+        mask = dedup.is_latest(df, keys)
+        return df if mask.all() else df[mask]
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    def _versions(self, df: pd.DataFrame) -> np.ndarray:
+        # VERSAO ausente perde para qualquer versão informada da mesma chave
+        return df[self.VERSION_COLUMN].to_numpy(dtype=np.int32, na_value=-1)
+
+    def _vocab_ids(self, serie: pd.Series, col: str, bits: int) -> np.ndarray:
+        """Ids estáveis (entre chunks) dos valores de uma coluna da chave."""
+        codes, uniques = pd.factorize(serie)
+        vocab = self._vocab[col]
+        ids = np.empty(len(uniques) + 1, dtype=np.uint64)
+        for i, value in enumerate(uniques.tolist()):
+            ident = vocab.get(value)
+            if ident is None:
+                ident = vocab[value] = len(vocab) + 1
+            ids[i] = ident
+        ids[-1] = 0  # código -1 (ausente)
+        if len(vocab) >= 1 << bits:
+            raise ValueError(f"Valores distintos demais em {col} para a deduplicação.")
+        return ids[codes]
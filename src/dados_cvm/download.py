@@ -1,38 +1,257 @@
 from __future__ import annotations
 
+import email.utils
+import hashlib
 import io
+import logging
+import os
+import random
+import threading
 import time
-from typing import Final
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Final, Optional, TypeVar
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .endpoints import DocType, UrlBuilder
+from .metrics import DISABLED, Instrumentation
 
-__all__ = ["ZipDownloader"]
+__all__ = ["ZipDownloader", "DownloadResult", "RateLimiter"]
+
+_T = TypeVar("_T")
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    """Resultado de um download condicional.
+
+    Attributes:
+        url: URL requisitada.
+        content: Bytes do ZIP quando baixado em memória.
+        etag: Valor do cabeçalho ETag retornado pelo servidor, se houver.
+        last_modified: Valor do cabeçalho Last-Modified retornado pelo servidor, se houver.
+        path: Arquivo de destino quando baixado em modo streaming.
+        sha256: Hash do conteúdo, calculado durante o download em modo streaming.
+        size: Tamanho em bytes do conteúdo baixado.
+        not_modified: True quando o servidor respondeu 304 (cópia local continua válida).
+    """
+
+    url: str
+    content: Optional[bytes] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    path: Optional[Path] = None
+    sha256: Optional[str] = None
+    size: int = 0
+    not_modified: bool = False
+
+
+class RateLimiter:
+    """Limita a taxa de requisições por host (GCRA, equivalente a um token bucket).
+
+    Cada host tem sua própria cota: até `burst` requisições imediatas e, depois, uma a
+    cada `1 / rate` segundos. Um host que respondeu 429/503 com `Retry-After` fica
+    bloqueado (`penalize`) para todas as threads até o prazo indicado, evitando que
+    os downloads paralelos insistam ao mesmo tempo.
+
+    Args:
+        rate: Requisições por segundo por host. Se None, não há limite de taxa (mas
+            `penalize` continua valendo).
+        burst: Requisições permitidas de uma vez, antes de aplicar a taxa. Padrão é 1.
+
+    Exemplo:
+        limiter = RateLimiter(rate=2.0, burst=4)
+        client = CVMClient(data_dir="./arquivos", rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: Optional[float], burst: int = 1):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate deve ser > 0 (ou None para não limitar).")
+        if burst < 1:
+            raise ValueError("burst deve ser >= 1.")
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tat: Dict[str, float] = {}
+        self._blocked_until: Dict[str, float] = {}
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def reserve(self, url: str, tokens: int = 1) -> float:
+        """Reserva uma requisição para o host de `url` e retorna quantos segundos esperar.
+
+        Com `tokens=0` nada é consumido da cota: só se espera o fim de um bloqueio
+        (`penalize`) do host. Usado pelas requisições que fazem parte de um download já
+        reservado (ex.: as faixas de um download em partes).
+        """
+        host = self.host(url)
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until.get(host, 0.0) - now)
+            if self.rate is not None and tokens > 0:
+                interval = 1.0 / self.rate
+                # Theoretical arrival time: instante em que a cota do host estará livre
+                tat = max(self._tat.get(host, now), now + wait)
+                wait = max(wait, tat - (self.burst - 1) * interval - now)
+                self._tat[host] = tat + interval
+            return wait
+
+    def acquire(self, url: str, tokens: int = 1) -> None:
+        """Bloqueia a thread até que uma requisição ao host de `url` seja permitida."""
+        wait = self.reserve(url, tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self, url: str, seconds: float) -> None:
+        """Bloqueia o host de `url` por `seconds` (ex.: a partir de um `Retry-After`)."""
+        host = self.host(url)
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._blocked_until[host] = max(self._blocked_until.get(host, 0.0), until)
 
 
 class ZipDownloader:
-    """Responsável por baixar os arquivos ZIP da CVM."""
+    """Responsável por baixar os arquivos ZIP da CVM.
+
+    Sem uma sessão explícita, os downloads usam uma `requests.Session` compartilhada
+    (`shared_session()`), que mantém as conexões abertas (keep-alive) entre chamadas.
+    Todo download passa pelo `RateLimiter` por host informado (cada `CVMClient` tem o
+    seu; chamadas diretas sem limitador usam `RATE_LIMITER`) e falhas temporárias são
+    repetidas com backoff exponencial com jitter, respeitando o `Retry-After` de
+    respostas 429/503. Um download em partes conta como uma única requisição: as
+    faixas só respeitam os bloqueios do host.
+    """
 
     DEFAULT_RETRIES: Final[int] = 3
     BACKOFF_SECONDS: Final[float] = 1.5
+    MAX_BACKOFF_SECONDS: Final[float] = 60.0
+    MAX_RETRY_AFTER_SECONDS: Final[float] = 300.0
     TIMEOUT_SECONDS: Final[float] = 60.0
+    CHUNK_SIZE: Final[int] = 1024 * 1024
+    DEFAULT_POOL_SIZE: Final[int] = 10
+    USER_AGENT: Final[str] = "dadoscvm (+https://github.com/BlancoVinicius/DadosCvm)"
+
+    # Limite padrão por host (cada `CVMClient` cria o seu com estes valores)
+    DEFAULT_RATE: Final[float] = 5.0
+    DEFAULT_BURST: Final[int] = 5
+    # Limitador das chamadas diretas ao ZipDownloader feitas sem `rate_limiter`
+    RATE_LIMITER: RateLimiter = RateLimiter(rate=DEFAULT_RATE, burst=DEFAULT_BURST)
+
+    _shared_session: Optional[requests.Session] = None
+    _shared_lock: Final[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def create_session(cls, pool_size: int | None = None) -> requests.Session:
+        """Cria uma `requests.Session` com pool de conexões para `pool_size` hosts/conexões.
+
+        Use um `pool_size` >= ao número de downloads simultâneos; acima disso o urllib3
+        descarta as conexões excedentes em vez de reaproveitá-las.
+        """
+        size = pool_size if pool_size is not None else cls.DEFAULT_POOL_SIZE
+        if size < 1:
+            raise ValueError("pool_size deve ser >= 1.")
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = cls.USER_AGENT
+        return session
+
+    @classmethod
+    def shared_session(cls) -> requests.Session:
+        """Sessão usada quando nenhuma é informada (criada na primeira chamada)."""
+        with cls._shared_lock:
+            if cls._shared_session is None:
+                cls._shared_session = cls.create_session()
+            return cls._shared_session
+
+    @classmethod
+    def backoff_delay(cls, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Espera antes da tentativa seguinte a `attempt` (1, 2, ...).
+
+        Com `Retry-After`, usa o prazo do servidor (limitado a `MAX_RETRY_AFTER_SECONDS`);
+        senão, backoff exponencial `BACKOFF_SECONDS * 2**(attempt - 1)`, limitado a
+        `MAX_BACKOFF_SECONDS`, com jitter entre metade e o valor cheio para que os
+        downloads paralelos não repitam todos ao mesmo tempo.
+        """
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), cls.MAX_RETRY_AFTER_SECONDS)
+        delay = min(cls.BACKOFF_SECONDS * 2 ** (attempt - 1), cls.MAX_BACKOFF_SECONDS)
+        return random.uniform(delay / 2, delay)
+
+    @classmethod
+    def retry_delay(
+        cls,
+        attempt: int,
+        attempts: int,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[tuple[float, bool]]:
+        """Política de retry compartilhada pelos downloads síncronos e assíncronos.
+
+        Args:
+            attempt: Tentativa que falhou (1, 2, ...).
+            attempts: Total de tentativas permitidas.
+            status: Status HTTP da falha, ou None para erros de rede.
+            retry_after: Cabeçalho `Retry-After` da resposta, se houver.
+
+        Returns:
+            None se a falha não deve ser repetida (erros 4xx, exceto 429, ou tentativas
+            esgotadas); senão (espera, throttled), em que `throttled` indica que a espera
+            veio do `Retry-After` de um 429/503 e o host deve ser bloqueado no limitador.
+        """
+        if status is not None and 400 <= status < 500 and status != 429:
+            return None
+        if attempt >= attempts:
+            return None
+        seconds = cls.parse_retry_after(retry_after) if status in (429, 503) else None
+        return cls.backoff_delay(attempt, seconds), seconds is not None
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Converte o cabeçalho `Retry-After` (segundos ou data HTTP) em segundos."""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, when.timestamp() - time.time())
 
     @classmethod
     def download_zip(
         cls,
         doc_type: DocType,
-        ano: int,
+        ano: Optional[int],
         retries: int | None = None,
         timeout: float | None = None,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ) -> io.BytesIO:
         """Baixa o ZIP para o tipo/ano informado com retries e validações básicas.
 
         Args:
             doc_type: Tipo de documento (ex.: DocType.DFP, DocType.ITR)
-            ano: Ano de referência (ex.: 2024)
+            ano: Ano de referência (ex.: 2024). Ignorado para DocType.CAD.
             retries: Número de tentativas em caso de falha (default: 3)
             timeout: Timeout da requisição em segundos (default: 60)
+            session: Sessão HTTP a reutilizar (conexões keep-alive). Se None, usa `shared_session()`.
+            rate_limiter: Limite de requisições por host. Se None, usa `RATE_LIMITER`.
+            instrumentation: Recebe as medições da etapa "download" (ver `Instrumentation`).
 
         Returns:
             BytesIO contendo o conteúdo do zip.
@@ -41,37 +260,510 @@ class ZipDownloader:
             requests.HTTPError: quando a solicitação HTTP não retorna sucesso.
             requests.RequestException: para outros erros de rede após esgotar retries.
         """
-        url = UrlBuilder.build_zip_url(doc_type, ano)
-        attempts = retries if retries is not None else cls.DEFAULT_RETRIES # atribui retries se for None
+        result = cls.fetch_zip(
+            doc_type,
+            ano,
+            retries=retries,
+            timeout=timeout,
+            session=session,
+            rate_limiter=rate_limiter,
+            instrumentation=instrumentation,
+        )
+        assert result.content is not None  # sem cabeçalhos condicionais não há 304
+        return io.BytesIO(result.content)
+
+    @classmethod
+    def fetch_zip(
+        cls,
+        doc_type: DocType,
+        ano: Optional[int],
+        retries: int | None = None,
+        timeout: float | None = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> DownloadResult:
+        """Baixa o ZIP em memória com requisição condicional (If-None-Match / If-Modified-Since).
+
+        Args:
+            doc_type: Tipo de documento (ex.: DocType.DFP, DocType.ITR)
+            ano: Ano de referência (ex.: 2024). Ignorado para DocType.CAD.
+            retries: Número de tentativas em caso de falha (default: 3)
+            timeout: Timeout da requisição em segundos (default: 60)
+            etag: ETag da cópia local; se informado, envia If-None-Match.
+            last_modified: Last-Modified da cópia local; se informado, envia If-Modified-Since.
+            session: Sessão HTTP a reutilizar (conexões keep-alive). Se None, usa `shared_session()`.
+            rate_limiter: Limite de requisições por host. Se None, usa `RATE_LIMITER`.
+            instrumentation: Recebe as medições da etapa "download" (ver `Instrumentation`).
+
+        Returns:
+            DownloadResult com o conteúdo, ou com `not_modified=True` se o servidor
+            indicar que a cópia local ainda é válida (HTTP 304).
+
+        Raises:
+            requests.HTTPError: quando a solicitação HTTP não retorna sucesso.
+            requests.RequestException: para outros erros de rede após esgotar retries.
+        """
+        url = UrlBuilder.build_url(doc_type, ano)
+        is_zip = UrlBuilder.is_zip(doc_type)
         timeout_s = timeout if timeout is not None else cls.TIMEOUT_SECONDS # atribui timeout se for None
+        headers = cls._conditional_headers(etag, last_modified)
+        http = session if session is not None else cls.shared_session()
+        limiter = rate_limiter or cls.RATE_LIMITER
+
+        def attempt() -> DownloadResult:
+            limiter.acquire(url)
+            response = http.get(url, timeout=timeout_s, headers=headers)
+            if response.status_code == 304:
+                return cls._not_modified(url, response, etag, last_modified)
+            response.raise_for_status() # levanta exceção para códigos de erro HTTP
+            if is_zip:
+                cls._validate_zip_response(response, response.content[:2])
+            return DownloadResult(
+                url=url,
+                content=response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                size=len(response.content),
+            )
+
+        instr = instrumentation or DISABLED
+        with instr.stage("download", doc_type=doc_type.value, ano=ano, mode="memory") as stage:
+            result = cls._with_retries(attempt, retries, stage, limiter)
+            stage.add(bytes=result.size)
+        return result
+
+    @classmethod
+    def download_zip_to_file(
+        cls,
+        doc_type: DocType,
+        ano: Optional[int],
+        dest: str | Path,
+        retries: int | None = None,
+        timeout: float | None = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        chunk_size: int | None = None,
+        resume: bool = True,
+        parts: int = 1,
+        expected_sha256: Optional[str] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> DownloadResult:
+        """Baixa o ZIP em modo streaming direto para o disco, com retomada via HTTP Range.
+
+        A resposta é gravada em blocos (`iter_content`) em `<dest>.part`, que só é
+        renomeado atomicamente para `dest` quando o download termina e é validado. Assim
+        o uso de memória independe do tamanho do ZIP e `dest` nunca fica com um arquivo
+        parcial.
+
+        Se uma tentativa falhar no meio, o `.part` é mantido e a próxima tentativa (ou a
+        próxima chamada) pede apenas os bytes restantes com `Range`/`If-Range`. O arquivo
+        final é conferido contra o tamanho total informado pelo servidor e contra
+        `expected_sha256`, quando informado; downloads retomados ou divididos em partes
+        sem hash esperado são conferidos pelos CRC32 dos membros do ZIP.
+
+        Com DocType.CAD é baixado o CSV do cadastro, sem as validações de ZIP.
+
+        Args:
+            doc_type: Tipo de documento (ex.: DocType.DFP, DocType.ITR)
+            ano: Ano de referência (ex.: 2024). Ignorado para DocType.CAD.
+            dest: Caminho final do arquivo ZIP.
+            retries: Número de tentativas em caso de falha (default: 3)
+            timeout: Timeout da requisição em segundos (default: 60)
+            etag: ETag da cópia local; se informado, envia If-None-Match.
+            last_modified: Last-Modified da cópia local; se informado, envia If-Modified-Since.
+            session: Sessão HTTP a reutilizar (conexões keep-alive). Se None, usa `shared_session()`.
+            rate_limiter: Limite de requisições por host. Se None, usa `RATE_LIMITER`.
+            chunk_size: Tamanho dos blocos gravados em disco (default: 1 MiB).
+            resume: Se True, retoma a partir de um `.part` existente. Padrão é True.
+            parts: Número de faixas (`Range`) baixadas em paralelo. Com 1 (padrão) o
+                download é sequencial; se o servidor não aceitar Range, volta ao modo
+                sequencial.
+            expected_sha256: Hash esperado do ZIP; se não conferir, o download é refeito.
+            instrumentation: Recebe as medições da etapa "download": bytes efetivamente
+                recebidos (sem contar os já presentes no `.part`) e retries.
+
+        Returns:
+            DownloadResult com `path`, `sha256` e `size` preenchidos, ou com
+            `not_modified=True` se o servidor responder 304 (nada é gravado).
+
+        Raises:
+            requests.HTTPError: quando a solicitação HTTP não retorna sucesso.
+            requests.RequestException: para outros erros de rede, ou falha na validação
+                de tamanho/hash, após esgotar retries.
+        """
+        url = UrlBuilder.build_url(doc_type, ano)
+        is_zip = UrlBuilder.is_zip(doc_type)
+        timeout_s = timeout if timeout is not None else cls.TIMEOUT_SECONDS
+        block = chunk_size if chunk_size is not None else cls.CHUNK_SIZE
+        headers = cls._conditional_headers(etag, last_modified)
+        http = session if session is not None else cls.shared_session()
+        limiter = rate_limiter or cls.RATE_LIMITER
+
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part = cls.part_path(dest)
+        if not resume:
+            cls._discard_part(part)
 
-        last_exc: Exception | None = None # variável para armazenar a última exceção
-        for attempt in range(1, attempts + 1):
+        instr = instrumentation or DISABLED
+        stage = instr.stage("download", doc_type=doc_type.value, ano=ano, mode="streaming")
+
+        def attempt() -> DownloadResult:
+            offset = part.stat().st_size if part.exists() else 0
+            req_headers = dict(headers)
+            validator = cls._read_validator(part)
+            if offset and validator:
+                req_headers["Range"] = f"bytes={offset}-"
+                req_headers["If-Range"] = validator
+            else:
+                offset = 0
+
+            limiter.acquire(url)
+            with http.get(url, timeout=timeout_s, headers=req_headers, stream=True) as response:
+                if response.status_code == 304:
+                    return cls._not_modified(url, response, etag, last_modified)
+                if response.status_code == 416:
+                    # O .part não corresponde mais ao arquivo remoto: recomeça do zero
+                    cls._discard_part(part)
+                    raise requests.RequestException("Range inválido para o download parcial.")
+                response.raise_for_status()
+
+                digest = hashlib.sha256()
+                if response.status_code == 206:
+                    start, total = cls._parse_content_range(response.headers.get("Content-Range"))
+                    if start != offset:
+                        cls._discard_part(part)
+                        raise requests.RequestException("Content-Range não corresponde ao download parcial.")
+                    cls._hash_file(part, digest, block)
+                    mode = "ab"
+                else:
+                    # Servidor ignorou o Range (ou não havia .part): grava desde o início
+                    offset = 0
+                    total = cls._content_length(response)
+                    cls._write_validator(part, response)
+                    mode = "wb"
+
+                with open(part, mode) as fh:
+                    for chunk in response.iter_content(chunk_size=block):
+                        if is_zip and fh.tell() == 0:
+                            cls._validate_zip_response(response, chunk[:2])
+                        fh.write(chunk)
+                        digest.update(chunk)
+                        stage.add(bytes=len(chunk))
+
+                size = part.stat().st_size
+                if total is not None and size != total:
+                    # Mantém o .part: a próxima tentativa continua de onde parou
+                    raise requests.RequestException(f"Download incompleto: {size} de {total} bytes.")
+
+                cls._finalize_part(
+                    part,
+                    dest,
+                    digest.hexdigest(),
+                    expected_sha256,
+                    verify_zip=is_zip and offset > 0,
+                )
+                return DownloadResult(
+                    url=url,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    path=dest,
+                    sha256=digest.hexdigest(),
+                    size=size,
+                )
+
+        with stage:
+            # O cadastro (CSV pequeno, sem ZIP) é sempre baixado sequencialmente
+            if parts > 1 and is_zip:
+                ranged = cls._download_ranges(
+                    http, url, dest, headers, timeout_s, block, parts, retries, expected_sha256, stage, limiter
+                )
+                if ranged is not None:
+                    return ranged
+            return cls._with_retries(attempt, retries, stage, limiter)
+
+    @staticmethod
+    def part_path(dest: str | Path) -> Path:
+        """Caminho do arquivo parcial usado para retomar o download de `dest`."""
+        dest = Path(dest)
+        return dest.with_name(f"{dest.name}.part")
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    @staticmethod
+    def _conditional_headers(etag: Optional[str], last_modified: Optional[str]) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    @staticmethod
+    def _not_modified(
+        url: str,
+        response: requests.Response,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> DownloadResult:
+        return DownloadResult(
+            url=url,
+            etag=response.headers.get("ETag", etag),
+            last_modified=response.headers.get("Last-Modified", last_modified),
+            not_modified=True,
+        )
+
+    @staticmethod
+    def _validate_zip_response(response: requests.Response, head: bytes) -> None:
+        """Validação leve de conteúdo a partir do Content-Type e dos primeiros bytes."""
+        content_type = response.headers.get("Content-Type", "").lower() # pega o Content-Type da resposta
+        # Alguns servidores podem retornar octet-stream; aceitamos zip ou octet-stream
+        if "zip" not in content_type and "octet-stream" not in content_type:
+            # Ainda assim aceitamos se o conteúdo começar com bytes PK (assinatura de zip)
+            if not head.startswith(b"PK"):
+                raise requests.RequestException(
+                    f"Conteúdo inesperado (Content-Type={content_type!r})."
+                )
+
+    @classmethod
+    def _download_ranges(
+        cls,
+        http: Any,
+        url: str,
+        dest: Path,
+        headers: dict[str, str],
+        timeout_s: float,
+        block: int,
+        parts: int,
+        retries: int | None,
+        expected_sha256: Optional[str],
+        stage: Any,
+        limiter: RateLimiter,
+    ) -> Optional[DownloadResult]:
+        """Baixa o arquivo em `parts` faixas concorrentes, cada uma retomável.
+
+        Returns:
+            DownloadResult, ou None se o servidor não informar tamanho ou não aceitar
+            Range (o chamador deve usar o download sequencial).
+        """
+        head = cls._with_retries(
+            lambda: cls._head(http, limiter, url, timeout_s, headers), retries, stage, limiter
+        )
+        if head.status_code == 304:
+            return cls._not_modified(url, head, headers.get("If-None-Match"), headers.get("If-Modified-Since"))
+        total = cls._content_length(head)
+        if not total or head.headers.get("Accept-Ranges", "").lower() != "bytes":
+            return None
+
+        part = cls.part_path(dest)
+        validator = head.headers.get("ETag") or head.headers.get("Last-Modified")
+        segments = [part.with_name(f"{part.name}{i}") for i in range(parts)]
+        if validator is None or cls._read_validator(part) != validator:
+            # Versão remota mudou (ou não é possível garantir): descarta faixas antigas
+            for seg in segments:
+                seg.unlink(missing_ok=True)
+            cls._discard_part(part)
+            if validator is not None:
+                cls._write_validator(part, head)
+
+        step = -(-total // parts)
+        bounds = [(i * step, min(total, (i + 1) * step) - 1) for i in range(parts) if i * step < total]
+
+        def fetch_range(seg: Path, start: int, end: int) -> None:
+            done = seg.stat().st_size if seg.exists() else 0
+            if start + done > end:
+                return
+            req_headers = {"Range": f"bytes={start + done}-{end}"}
+            if validator:
+                req_headers["If-Range"] = validator
+            # O download já foi reservado no HEAD: as faixas só esperam bloqueios do host
+            limiter.acquire(url, tokens=0)
+            with http.get(url, timeout=timeout_s, headers=req_headers, stream=True) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise requests.RequestException("Servidor não respeitou o Range solicitado.")
+                with open(seg, "ab") as fh:
+                    for chunk in response.iter_content(chunk_size=block):
+                        fh.write(chunk)
+                        stage.add(bytes=len(chunk))
+            if seg.stat().st_size != end - start + 1:
+                raise requests.RequestException(f"Faixa incompleta: {seg.name}.")
+
+        with ThreadPoolExecutor(max_workers=len(bounds)) as executor:
+            futures = [
+                executor.submit(
+                    cls._with_retries, partial(fetch_range, segments[i], a, b), retries, stage, limiter
+                )
+                for i, (a, b) in enumerate(bounds)
+            ]
+            for future in futures:
+                future.result()
+
+        # Junta as faixas no .part calculando o hash em uma única passada
+        digest = hashlib.sha256()
+        with open(part, "wb") as dst:
+            for seg in segments[: len(bounds)]:
+                with open(seg, "rb") as src:
+                    for chunk in iter(lambda: src.read(block), b""):
+                        dst.write(chunk)
+                        digest.update(chunk)
+        for seg in segments:
+            seg.unlink(missing_ok=True)
+
+        size = part.stat().st_size
+        if size != total:
+            cls._discard_part(part)
+            raise requests.RequestException(f"Download incompleto: {size} de {total} bytes.")
+        with open(part, "rb") as fh:
+            cls._validate_zip_response(head, fh.read(2))
+        cls._finalize_part(part, dest, digest.hexdigest(), expected_sha256, verify_zip=True)
+        return DownloadResult(
+            url=url,
+            etag=head.headers.get("ETag"),
+            last_modified=head.headers.get("Last-Modified"),
+            path=dest,
+            sha256=digest.hexdigest(),
+            size=size,
+        )
+
+    @staticmethod
+    def _head(
+        http: Any, limiter: RateLimiter, url: str, timeout_s: float, headers: dict[str, str]
+    ) -> requests.Response:
+        """HEAD sujeito ao limite de taxa; erros HTTP levantam exceção (exceto 304)."""
+        limiter.acquire(url)
+        head = http.head(url, timeout=timeout_s, headers=headers, allow_redirects=True)
+        if head.status_code != 304:
+            head.raise_for_status()
+        return head
+
+    @classmethod
+    def _finalize_part(
+        cls,
+        part: Path,
+        dest: Path,
+        sha256: str,
+        expected_sha256: Optional[str],
+        verify_zip: bool,
+    ) -> None:
+        """Confere o hash/CRC do `.part` e o move atomicamente para `dest`."""
+        if expected_sha256 and sha256 != expected_sha256:
+            cls._discard_part(part)
+            raise requests.RequestException(
+                f"Checksum divergente: esperado {expected_sha256}, obtido {sha256}."
+            )
+        if verify_zip and not expected_sha256:
+            try:
+                with zipfile.ZipFile(part) as zf:
+                    bad_member = zf.testzip()
+            except zipfile.BadZipFile as e:
+                bad_member = str(e)
+            if bad_member is not None:
+                cls._discard_part(part)
+                raise requests.RequestException(f"ZIP corrompido após retomada: {bad_member}.")
+        os.replace(part, dest)
+        cls._discard_part(part)
+
+    @staticmethod
+    def _validator_path(part: Path) -> Path:
+        return part.with_name(f"{part.name}.meta")
+
+    @classmethod
+    def _read_validator(cls, part: Path) -> Optional[str]:
+        """ETag/Last-Modified da versão remota a que o `.part` pertence."""
+        meta = cls._validator_path(part)
+        if not meta.exists():
+            return None
+        return meta.read_text(encoding="utf-8").strip() or None
+
+    @classmethod
+    def _write_validator(cls, part: Path, response: requests.Response) -> None:
+        validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        meta = cls._validator_path(part)
+        if validator:
+            meta.write_text(validator, encoding="utf-8")
+        else:
+            meta.unlink(missing_ok=True)
+
+    @classmethod
+    def _discard_part(cls, part: Path) -> None:
+        part.unlink(missing_ok=True)
+        cls._validator_path(part).unlink(missing_ok=True)
+
+    @staticmethod
+    def _content_length(response: requests.Response) -> Optional[int]:
+        """Tamanho total esperado, ignorado quando há Content-Encoding (corpo decodificado)."""
+        if response.headers.get("Content-Encoding"):
+            return None
+        length = response.headers.get("Content-Length")
+        return int(length) if length and length.isdigit() else None
+
+    @staticmethod
+    def _parse_content_range(value: Optional[str]) -> tuple[int, Optional[int]]:
+        """Extrai (início, total) de um cabeçalho `Content-Range: bytes a-b/total`."""
+        if not value or not value.startswith("bytes "):
+            raise requests.RequestException(f"Content-Range inválido: {value!r}.")
+        span, _, total = value[len("bytes "):].partition("/")
+        start = int(span.split("-", 1)[0])
+        return start, int(total) if total.isdigit() else None
+
+    @staticmethod
+    def _hash_file(path: Path, digest: Any, block: int) -> None:
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(block), b""):
+                digest.update(chunk)
+
+    @classmethod
+    def _with_retries(
+        cls,
+        attempt: Callable[[], _T],
+        retries: int | None,
+        stage: Any = None,
+        limiter: Optional[RateLimiter] = None,
+    ) -> _T:
+        """Executa `attempt` com retries e backoff; erros 4xx (exceto 429) não são repetidos.
+
+        A espera entre tentativas segue `retry_delay`. Em 429/503 com `Retry-After`, o
+        host também é bloqueado no `limiter`, de modo que as demais threads esperem o
+        mesmo prazo. Cada nova tentativa é registrada no log e somada em `stage` (ver
+        `Instrumentation`).
+
+        Raises:
+            ValueError: se `retries` for menor que 1 (é o total de tentativas).
+        """
+        attempts = retries if retries is not None else cls.DEFAULT_RETRIES # atribui retries se for None
+        if attempts < 1:
+            raise ValueError(f"retries deve ser >= 1 (total de tentativas), recebido {attempts}.")
+
+        for n in range(1, attempts + 1):
+            status: Optional[int] = None
+            retry_after: Optional[str] = None
+            throttled_url: Optional[str] = None
             try:
-                response = requests.get(url, timeout=timeout_s)
-                response.raise_for_status() # levanta exceção para códigos de erro HTTP
-
-                # Validação leve de conteúdo
-                content_type = response.headers.get("Content-Type", "").lower() # pega o Content-Type da resposta
-                # Alguns servidores podem retornar octet-stream; aceitamos zip ou octet-stream
-                if "zip" not in content_type and "octet-stream" not in content_type:
-                    # Ainda assim aceitamos se o conteúdo começar com bytes PK (assinatura de zip)
-                    if not response.content.startswith(b"PK"):
-                        raise requests.RequestException(
-                            f"Conteúdo inesperado (Content-Type={content_type!r})."
-                        )
-
-                return io.BytesIO(response.content)
+                return attempt()
             except requests.HTTPError as e:
-                last_exc = e
-                status = getattr(e.response, "status_code", None)
-                if status is not None and 400 <= status < 500 and status != 429:
-                    raise
+                last_exc: Exception = e
+                if e.response is not None:
+                    status = e.response.status_code
+                    retry_after = e.response.headers.get("Retry-After")
+                    throttled_url = e.response.url
             except requests.RequestException as e:
                 last_exc = e
-            # Backoff antes do próximo attempt (se houver)
-            if attempt < attempts:
-                time.sleep(cls.BACKOFF_SECONDS * attempt)
-        # Esgotou tentativas
-        assert last_exc is not None
-        raise last_exc
+            decision = cls.retry_delay(n, attempts, status, retry_after)
+            if decision is None:
+                raise last_exc
+            # Backoff antes do próximo attempt
+            delay, throttled = decision
+            if throttled and limiter is not None and throttled_url:
+                limiter.penalize(throttled_url, delay)
+            _logger.warning("Tentativa %d/%d falhou (%s); repetindo em %.1fs.", n, attempts, last_exc, delay)
+            if stage is not None:
+                stage.add(retries=1)
+            time.sleep(delay)
+        raise AssertionError("unreachable")
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Final
+from typing import Dict, Final, Optional
 
 __all__ = [
     "DocType",
     "StatementType",
     "Scope",
+    "FCATable",
     "UrlBuilder",
 ]
 
@@ -17,10 +18,18 @@ class DocType(str, Enum):
     Atualmente suportamos:
     - DFP: Demonstrações Financeiras Padronizadas
     - ITR: Informes trimestrais
+    - FCA: Formulário Cadastral
+    - FRE: Formulário de Referência
+    - IPE: Documentos periódicos e eventuais (fatos relevantes, atas, comunicados...)
+    - CAD: Cadastro de companhias abertas (um único CSV, sem partição por ano)
     """
 
     DFP = "dfp"
     ITR = "itr"
+    FCA = "fca"
+    FRE = "fre"
+    IPE = "ipe"
+    CAD = "cad"
 
 
 class StatementType(str, Enum):
@@ -57,6 +66,24 @@ class Scope(str, Enum):
     IND = "ind"
 
 
+class FCATable(str, Enum):
+    """Tabelas do Formulário Cadastral (ex.: fca_cia_aberta_geral_2024.csv).
+
+    As tabelas do FRE seguem o mesmo padrão de nome (ex.: "capital_social",
+    "remuneracao_total_orgao") e são informadas diretamente como texto.
+    """
+
+    GERAL = "geral"
+    ENDERECO = "endereco"
+    VALOR_MOBILIARIO = "valor_mobiliario"
+    AUDITOR = "auditor"
+    CANAL_DIVULGACAO = "canal_divulgacao"
+    DEPARTAMENTO_ACIONISTAS = "departamento_acionistas"
+    DRI = "dri"
+    ESCRITURADOR = "escriturador"
+    PAIS_ESTRANGEIRO_NEGOCIACAO = "pais_estrangeiro_negociacao"
+
+
 class UrlBuilder:
     """Helper para construir URLs dos arquivos ZIP no portal da CVM.
 
@@ -67,30 +94,105 @@ class UrlBuilder:
     - {TIPO} = doc_type em maiúsculas (ex.: DFP, ITR)
     - {tipo} = doc_type em minúsculas (ex.: dfp, itr)
     - {ANO}  = ano desejado (ex.: 2024)
+
+    O cadastro (DocType.CAD) não é distribuído em ZIP: é um único CSV, atualizado
+    diariamente, em `CAD_URL`.
     """
 
     BASE_URL: Final[str] = "https://dados.cvm.gov.br/dados/CIA_ABERTA/DOC/{TIPO}/DADOS/{tipo}_cia_aberta_{ANO}.zip"
+    CAD_URL: Final[str] = "https://dados.cvm.gov.br/dados/CIA_ABERTA/CAD/DADOS/cad_cia_aberta.csv"
+
+    # Primeiro ano publicado de cada tipo de documento
+    FIRST_YEAR: Final[Dict[DocType, int]] = {
+        DocType.DFP: 2010,
+        DocType.ITR: 2010,
+        DocType.FCA: 2010,
+        DocType.FRE: 2010,
+        DocType.IPE: 2003,
+    }
+
+    @staticmethod
+    def is_zip(doc_type: DocType) -> bool:
+        """True se o tipo de documento é distribuído em ZIPs anuais (todos, exceto o cadastro)."""
+        return doc_type is not DocType.CAD
+
+    @classmethod
+    def build_url(cls, doc_type: DocType, ano: Optional[int] = None) -> str:
+        """URL do arquivo do tipo de documento: o ZIP do ano, ou o CSV do cadastro.
+
+        Args:
+            doc_type: Tipo de documento.
+            ano: Ano de referência. Ignorado para DocType.CAD.
+        """
+        if not cls.is_zip(doc_type):
+            return cls.CAD_URL
+        return cls.build_zip_url(doc_type, ano)  # type: ignore[arg-type]
 
     @classmethod
     def build_zip_url(cls, doc_type: DocType, ano: int) -> str:
         """Monta a URL do ZIP para o tipo de documento e ano informados.
 
         Args:
-            doc_type: Tipo de documento (DocType.DFP, DocType.ITR).
+            doc_type: Tipo de documento (ex.: DocType.DFP, DocType.FCA).
             ano: Ano de referência (ex.: 2024).
 
         Returns:
             URL completa para download do ZIP correspondente.
 
         Raises:
-            ValueError: se o ano for inválido (menor que 2010, por exemplo).
+            ValueError: se o ano for inválido (anterior ao primeiro ano publicado do tipo,
+                ver `FIRST_YEAR`) ou se o tipo não for distribuído em ZIP (DocType.CAD).
         """
-        if not isinstance(ano, int) or ano < 2010:
-            raise ValueError("Ano inválido. Utilize um ano >= 2010.")
+        if not cls.is_zip(doc_type):
+            raise ValueError(f"{doc_type.value} não é distribuído em ZIP. Utilize build_url().")
+        first_year = cls.FIRST_YEAR[doc_type]
+        if not isinstance(ano, int) or ano < first_year:
+            raise ValueError(f"Ano inválido. Utilize um ano >= {first_year}.")
 
         tipo_lower = doc_type.value.lower()
         tipo_upper = doc_type.value.upper()
 
         return cls.BASE_URL.format(TIPO=tipo_upper, tipo=tipo_lower, ANO=ano)
 
+    @classmethod
+    def zip_filename(cls, doc_type: DocType, ano: int) -> str:
+        """Nome do arquivo ZIP no portal (ex.: dfp_cia_aberta_2024.zip)."""
+        return cls.build_zip_url(doc_type, ano).rsplit("/", 1)[-1]
 
+    @classmethod
+    def csv_filename(cls, doc_type: DocType, ano: Optional[int] = None, table: Optional[str] = None) -> str:
+        """Nome de um CSV no padrão dos arquivos oficiais.
+
+        Sem `table`, é o CSV principal do ZIP: o índice de documentos entregues (DFP,
+        ITR, FCA, FRE) ou os próprios dados (IPE). Com `table`, é a tabela do ZIP:
+
+            dfp_cia_aberta_2024.csv
+            fca_cia_aberta_valor_mobiliario_2024.csv
+            fre_cia_aberta_capital_social_2024.csv
+            cad_cia_aberta.csv                      (DocType.CAD, sem ano)
+
+        Raises:
+            ValueError: se faltar o ano (exceto no cadastro) ou se `table` for
+                informada para o cadastro.
+        """
+        if not cls.is_zip(doc_type):
+            if table is not None:
+                raise ValueError("O cadastro não tem tabelas.")
+            return cls.CAD_URL.rsplit("/", 1)[-1]
+        if ano is None:
+            raise ValueError(f"Informe o ano do arquivo de {doc_type.value}.")
+        prefix = f"{doc_type.value}_cia_aberta"
+        if table is None:
+            return f"{prefix}_{ano}.csv"
+        return f"{prefix}_{getattr(table, 'value', table)}_{ano}.csv"
+
+    @classmethod
+    def statement_filename(cls, doc_type: DocType, statement: StatementType, scope: Scope, ano: int) -> str:
+        """Nome do CSV de um demonstrativo (ex.: dfp_cia_aberta_DRE_con_2024.csv).
+
+        Raises:
+            ValueError: se o tipo de documento não tiver demonstrativos (só DFP e ITR).
+        """
+        if doc_type not in (DocType.DFP, DocType.ITR):
+            raise ValueError(f"{doc_type.value} não tem demonstrativos financeiros (use DFP ou ITR).")
+        return cls.csv_filename(doc_type, ano, f"{statement.value}_{scope.value}")
@@ -1,61 +1,170 @@
 from __future__ import annotations
 
 import io
+import os
+import re
+import shutil
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Final, Iterable, List, Optional, Tuple
 import zipfile
 
+from .endpoints import Scope, StatementType
+from .metrics import DISABLED, Instrumentation
+
 __all__ = ["ZipExtractor"]
 
+# Origem aceita pelo zipfile: ZIP em memória ou caminho de um ZIP no disco
+ZipSource = io.BytesIO | str | Path
+
+# Nome dos CSVs de demonstrativos (ex.: dfp_cia_aberta_BPA_con_2024.csv)
+_STATEMENT_RE = re.compile(r"_cia_aberta_(?P<statement>[A-Z_]+)_(?P<scope>con|ind)_\d{4}\.csv$")
+
 
 class ZipExtractor:
-    """Opera sobre um ZIP em memória (BytesIO) para listar e extrair CSVs."""
+    """Opera sobre um ZIP (em memória ou no disco) para listar e extrair CSVs."""
+
+    COPY_BUFFER_SIZE: Final[int] = 1024 * 1024
+    DEFAULT_WORKERS: Final[int] = min(8, os.cpu_count() or 1)
 
     @staticmethod
-    def list_csv(zip_bytes: io.BytesIO) -> List[str]:
-        """Lista os arquivos .csv contidos no zip em memória."""
+    def list_csv(zip_bytes: ZipSource) -> List[str]:
+        """Lista os arquivos .csv contidos no zip."""
         with zipfile.ZipFile(zip_bytes, "r") as zf:
             return [name for name in zf.namelist() if name.lower().endswith(".csv")]
 
     @staticmethod
-    def extract_all(zip_bytes: io.BytesIO, dest_dir: Path) -> None:
-        """Extrai com segurança todos os arquivos do zip para dest_dir.
+    def match_statement(name: str) -> Optional[Tuple[StatementType, Scope]]:
+        """Demonstrativo e escopo de um CSV pelo nome, ou None se não for um demonstrativo."""
+        m = _STATEMENT_RE.search(Path(name).name)
+        if m is None or m["statement"] not in StatementType.__members__:
+            return None
+        return StatementType(m["statement"]), Scope(m["scope"])
+
+    @staticmethod
+    def extract_all(
+        zip_bytes: ZipSource,
+        dest_dir: Path,
+        members: Optional[Iterable[str]] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        statements: Optional[Iterable[StatementType]] = None,
+        scopes: Optional[Iterable[Scope]] = None,
+        skip_unchanged: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[str]:
+        """Extrai com segurança todos os arquivos do zip (ou só `members`) para dest_dir.
 
         Protege contra path traversal garantindo que nenhum membro escape de dest_dir.
+        Cada membro é copiado em blocos de tamanho fixo, de modo que o uso de memória
+        não depende do tamanho dos arquivos.
+
+        Cada membro é gravado em um temporário no mesmo diretório e movido para o
+        destino com `os.replace`: uma falha no meio da extração não deixa um CSV
+        truncado no lugar do anterior.
+
+        Os membros são descompactados em paralelo (o zlib libera o GIL). Com
+        `skip_unchanged`, um arquivo já presente em dest_dir com o mesmo tamanho e o
+        mesmo CRC32 registrados no ZIP não é regravado.
 
         Args:
-            zip_bytes: BytesIO com o conteúdo do zip.
+            zip_bytes: BytesIO com o conteúdo do zip, ou caminho do zip no disco.
             dest_dir: Diretório para onde os arquivos serão extraídos.
+            members: Nomes dos membros a extrair. Se None, extrai todos.
+            instrumentation: Recebe as medições da etapa "extract" (bytes gravados e
+                número de arquivos extraídos em `rows`).
+            statements: Extrai só os CSVs desses demonstrativos (ex.: [StatementType.BPA]).
+            scopes: Extrai só os CSVs desses escopos (ex.: [Scope.CON]). Com `statements`
+                ou `scopes`, arquivos que não são demonstrativos (ex.: o CSV de índice)
+                são ignorados.
+            skip_unchanged: Se True (padrão), mantém os arquivos idênticos aos do ZIP.
+            max_workers: Threads de descompactação. Padrão é `DEFAULT_WORKERS`.
 
         Returns:
-            None
-            
+            List[str]: Nomes dos membros efetivamente gravados.
+
         Raises:
             RuntimeError: se houver path traversal detectado.
         """
         dest = Path(dest_dir)
         dest.mkdir(parents=True, exist_ok=True)
+        # Resolvido uma única vez; os destinos dos membros são só normalizados
+        root = dest.resolve()
 
-        with zipfile.ZipFile(zip_bytes, "r") as zf:
+        wanted = set(members) if members is not None else None
+        wanted_statements = set(statements) if statements is not None else None
+        wanted_scopes = set(scopes) if scopes is not None else None
+        instr = instrumentation or DISABLED
+        with instr.stage("extract") as stage, zipfile.ZipFile(zip_bytes, "r") as zf:
+            tasks: List[Tuple[zipfile.ZipInfo, Path]] = []
             for member in zf.infolist():
+                if wanted is not None and member.filename not in wanted:
+                    continue
                 # Normaliza o caminho do membro
                 member_name = member.filename
                 # Ignorar entradas de diretório implícitas/absolutas
                 if member_name.endswith("/"):
                     continue
+                if wanted_statements is not None or wanted_scopes is not None:
+                    match = ZipExtractor.match_statement(member_name)
+                    if match is None:
+                        continue
+                    if wanted_statements is not None and match[0] not in wanted_statements:
+                        continue
+                    if wanted_scopes is not None and match[1] not in wanted_scopes:
+                        continue
 
                 # Remove componentes perigosos
                 safe_name = Path(member_name).as_posix().lstrip("/")
                 # Bloqueia qualquer tentativa de subir diretórios
                 # (zipfile pode conter caminhos como ../../outside)
-                target_path = (dest / safe_name).resolve()
-                if not str(target_path).startswith(str(dest.resolve())):
+                target_path = Path(os.path.normpath(root / safe_name))
+                if target_path == root or not target_path.is_relative_to(root):
                     raise RuntimeError(f"Path traversal detectado: {member_name}")
+                tasks.append((member, target_path))
 
+            def _extract(task: Tuple[zipfile.ZipInfo, Path]) -> bool:
+                member, target_path = task
+                if skip_unchanged and ZipExtractor._is_unchanged(member, target_path):
+                    return False
                 # Garante diretório pai
                 target_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Extrai o arquivo
-                with zf.open(member, "r") as src, open(target_path, "wb") as dst:
-                    dst.write(src.read())
+                # Extrai em blocos para um temporário no mesmo diretório e só então
+                # substitui o destino: leitores nunca veem um CSV pela metade
+                tmp = target_path.with_name(f"{target_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                try:
+                    with zf.open(member, "r") as src, open(tmp, "wb") as dst:
+                        shutil.copyfileobj(src, dst, ZipExtractor.COPY_BUFFER_SIZE)
+                    os.replace(tmp, target_path)
+                except BaseException:
+                    tmp.unlink(missing_ok=True)
+                    raise
+                stage.add(bytes=member.file_size, rows=1)
+                return True
 
+            workers = min(max_workers or ZipExtractor.DEFAULT_WORKERS, len(tasks))
+            if workers <= 1:
+                written = [_extract(task) for task in tasks]
+            else:
+                # As threads compartilham o ZipFile: a leitura do arquivo é serializada
+                # pelo zipfile, mas a descompressão de cada membro roda em paralelo
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    written = list(executor.map(_extract, tasks))
+
+        return [member.filename for (member, _), ok in zip(tasks, written) if ok]
+
+    @staticmethod
+    def _is_unchanged(member: zipfile.ZipInfo, path: Path) -> bool:
+        """True se `path` já tem o tamanho e o CRC32 do membro do ZIP."""
+        try:
+            if path.stat().st_size != member.file_size:
+                return False
+        except FileNotFoundError:
+            return False
+        crc = 0
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(ZipExtractor.COPY_BUFFER_SIZE), b""):
+                crc = zlib.crc32(chunk, crc)
+        return crc == member.CRC
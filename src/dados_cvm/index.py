@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Final, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["StatementIndex"]
+
+
+class StatementIndex:
+    """Índice de um demonstrativo para consultas por companhia e por conta sem varredura.
+
+    O DataFrame é ordenado (de forma estável) por `CD_CVM`, de modo que as linhas de
+    cada companhia ficam contíguas. O índice guarda, para cada `CD_CVM` e `CNPJ_CIA`,
+    o intervalo `[início, fim)` dessas linhas, e para cada `CD_CONTA` as posições em
+    que a conta aparece (em formato CSR: chaves, offsets e posições).
+
+    Consultas por companhia viram um `iloc[início:fim]`, e por conta um `take` das
+    posições, em vez de comparar a coluna inteira.
+
+    O índice é salvo em `.npz` ao lado dos dados, junto com a impressão digital da
+    origem, e é descartado quando a origem muda.
+
+    Attributes:
+        fingerprint: Impressão digital da origem a partir da qual o índice foi gerado.
+        order: Permutação que leva as linhas na ordem original do arquivo para a ordem
+            do índice; None quando os dados já foram gravados ordenados.
+    """
+
+    COMPANY_KEYS: Final[tuple[str, ...]] = ("CD_CVM", "CNPJ_CIA")
+    ACCOUNT_KEY: Final[str] = "CD_CONTA"
+
+    def __init__(
+        self,
+        ranges: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        contas: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        n_rows: int,
+        fingerprint: Optional[Dict[str, object]] = None,
+        order: Optional[np.ndarray] = None,
+    ):
+        self.n_rows = n_rows
+        self.fingerprint = fingerprint
+        self.order = order
+        self._ranges = ranges
+        self._contas = contas
+        # Dicionários de busca O(1) construídos a partir dos arrays
+        self._lookup: Dict[str, Dict[Any, int]] = {
+            col: {k: i for i, k in enumerate(keys.tolist())} for col, (keys, _, _) in ranges.items()
+        }
+        self._conta_lookup: Dict[str, int] = (
+            {k: i for i, k in enumerate(contas[0].tolist())} if contas is not None else {}
+        )
+
+    # -----------------------------
+    # Construção
+    # -----------------------------
+    @classmethod
+    def build(
+        cls,
+        df: pd.DataFrame,
+        fingerprint: Optional[Dict[str, object]] = None,
+    ) -> Tuple[pd.DataFrame, 'StatementIndex']:
+        """Ordena o DataFrame por CD_CVM e constrói o índice.
+
+        Args:
+            df: Demonstrativo com a coluna `CD_CVM` (e, se houver, `CNPJ_CIA`/`CD_CONTA`).
+            fingerprint: Impressão digital da origem, gravada junto com o índice.
+
+        Returns:
+            Tupla (DataFrame ordenado, índice). Se o DataFrame já estiver ordenado ele
+            é retornado sem cópia e `order` fica None.
+        """
+        cd_cvm = df["CD_CVM"].to_numpy()
+        if len(cd_cvm) and not (np.diff(cd_cvm) >= 0).all():
+            order = np.argsort(cd_cvm, kind="stable")
+            df = df.take(order).reset_index(drop=True)
+        else:
+            order = None
+
+        ranges: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        for col in cls.COMPANY_KEYS:
+            if col in df.columns:
+                ranges[col] = cls._group_ranges(df[col])
+
+        contas = cls._positions(df[cls.ACCOUNT_KEY]) if cls.ACCOUNT_KEY in df.columns else None
+        return df, cls(ranges, contas, len(df), fingerprint=fingerprint, order=order)
+
+    def apply_order(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Reordena um DataFrame lido na ordem original do arquivo para a ordem do índice."""
+        if len(df) != self.n_rows:
+            raise ValueError("O DataFrame não corresponde ao índice (número de linhas diferente).")
+        if self.order is None:
+            return df
+        return df.take(self.order).reset_index(drop=True)
+
+    # -----------------------------
+    # Consulta
+    # -----------------------------
+    def indexed_columns(self) -> tuple[str, ...]:
+        """Colunas que podem ser resolvidas pelo índice."""
+        cols = tuple(self._ranges)
+        return cols + ((self.ACCOUNT_KEY,) if self._contas is not None else ())
+
+    def rows(self, col: str, value: Any) -> slice | np.ndarray:
+        """Linhas (na ordem do índice) em que `col == value`.
+
+        Returns:
+            `slice` contíguo para companhias, ou array de posições para contas (e para
+            companhias cujas linhas não ficaram contíguas).
+
+        Raises:
+            KeyError: se a coluna não estiver indexada.
+        """
+        if col == self.ACCOUNT_KEY and self._contas is not None:
+            i = self._conta_lookup.get(str(value))
+            if i is None:
+                return np.empty(0, dtype=np.int64)
+            _, offsets, positions = self._contas
+            return positions[offsets[i]:offsets[i + 1]]
+
+        keys, starts, stops = self._ranges[col]
+        i = self._lookup[col].get(value)
+        if i is None:
+            return slice(0, 0)
+        if starts[i] < 0:
+            # Chave não contígua (ex.: CNPJ com mais de um CD_CVM): recorre à varredura
+            raise LookupError(col)
+        return slice(int(starts[i]), int(stops[i]))
+
+    # -----------------------------
+    # Persistência
+    # -----------------------------
+    def save(self, path: str | Path) -> Path:
+        """Grava o índice em `.npz` de forma atômica."""
+        path = Path(path)
+        arrays: Dict[str, np.ndarray] = {
+            "n_rows": np.array(self.n_rows),
+            "fingerprint": np.array(json.dumps(self.fingerprint)),
+        }
+        if self.order is not None:
+            arrays["order"] = self.order
+        for col, (keys, starts, stops) in self._ranges.items():
+            arrays[f"{col}__keys"] = keys
+            arrays[f"{col}__starts"] = starts
+            arrays[f"{col}__stops"] = stops
+        if self._contas is not None:
+            keys, offsets, positions = self._contas
+            arrays["contas__keys"] = keys
+            arrays["contas__offsets"] = offsets
+            arrays["contas__positions"] = positions
+
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp.npz")
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> Optional['StatementIndex']:
+        """Lê um índice salvo com `save`, ou None se o arquivo não existir/for inválido."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                ranges = {
+                    col: (data[f"{col}__keys"], data[f"{col}__starts"], data[f"{col}__stops"])
+                    for col in cls.COMPANY_KEYS
+                    if f"{col}__keys" in data
+                }
+                contas = (
+                    (data["contas__keys"], data["contas__offsets"], data["contas__positions"])
+                    if "contas__keys" in data
+                    else None
+                )
+                return cls(
+                    ranges,
+                    contas,
+                    int(data["n_rows"]),
+                    fingerprint=json.loads(str(data["fingerprint"])),
+                    order=data["order"] if "order" in data else None,
+                )
+        except (OSError, ValueError, KeyError):
+            return None
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    @staticmethod
+    def _group_ranges(serie: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Intervalos [início, fim) de cada valor; início -1 se o valor não for contíguo."""
+        codes, uniques = pd.factorize(serie, sort=False)
+        n = len(codes)
+        pos = np.arange(n, dtype=np.int64)
+        valid = codes >= 0  # descarta valores ausentes (código -1)
+        codes, pos = codes[valid], pos[valid]
+        first = np.full(len(uniques), n, dtype=np.int64)
+        last = np.full(len(uniques), -1, dtype=np.int64)
+        np.minimum.at(first, codes, pos)
+        np.maximum.at(last, codes, pos)
+        counts = np.bincount(codes, minlength=len(uniques))
+
+        contiguous = (last - first + 1) == counts
+        starts = np.where(contiguous, first, -1)
+        stops = np.where(contiguous, last + 1, -1)
+        keys = np.asarray(uniques)
+        if keys.dtype == object:
+            keys = keys.astype(str)
+        return keys, starts, stops
+
+    @staticmethod
+    def _positions(serie: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Posições de cada valor em formato CSR (chaves, offsets, posições)."""
+        codes, uniques = pd.factorize(serie, sort=False)
+        positions = np.argsort(codes, kind="stable").astype(np.int64)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        # Linhas sem conta (código -1) ficam no início após o argsort: descarta
+        positions = positions[len(codes) - int(counts.sum()):]
+        keys = np.asarray(uniques).astype(str)
+        return keys, offsets, positions
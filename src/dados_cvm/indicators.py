@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Final, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .cube import StatementCube
+from .endpoints import StatementType
+from .read import CSVReader
+from .utils import concat_frames
+
+__all__ = ["Indicator", "IndicatorEngine", "IndicatorCache", "DEFAULT_INDICATORS"]
+
+# Termo de uma expressão: sinal opcional, demonstrativo e conta (ex.: "- BPA:1.01.04")
+_TERM_RE = re.compile(r"\s*([+-]?)\s*([A-Z_]+):([0-9.]+)\s*")
+
+# Termo já interpretado: (sinal, demonstrativo, conta)
+Term = Tuple[float, StatementType, str]
+
+
+def _parse(expr: str) -> Tuple[Term, ...]:
+    """Interpreta uma soma de contas (ex.: "BPP:2.01 + BPP:2.02")."""
+    terms: List[Term] = []
+    pos = 0
+    while pos < len(expr):
+        m = _TERM_RE.match(expr, pos)
+        if m is None or m.end() == pos or (terms and not m[1]):
+            raise ValueError(f"Expressão de indicador inválida: {expr!r}")
+        if m[2] not in StatementType.__members__:
+            raise ValueError(f"Demonstrativo desconhecido na expressão {expr!r}: {m[2]}")
+        terms.append((-1.0 if m[1] == "-" else 1.0, StatementType(m[2]), m[3]))
+        pos = m.end()
+    if not terms:
+        raise ValueError(f"Expressão de indicador vazia: {expr!r}")
+    return tuple(terms)
+
+
+@dataclass(frozen=True)
+class Indicator:
+    """Indicador definido como razão entre somas de contas.
+
+    Cada conta é escrita como `<DEMONSTRATIVO>:<CD_CONTA>` e pode ser somada ou
+    subtraída (ex.: "BPA:1.01 - BPA:1.01.04"). Sem denominador, o indicador é a
+    própria soma.
+
+    Args:
+        nome: Nome da coluna no resultado (ex.: "liquidez_corrente").
+        numerador: Expressão do numerador.
+        denominador: Expressão do denominador, ou None.
+    """
+
+    nome: str
+    numerador: str
+    denominador: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        # Valida as expressões na criação
+        self.terms()
+
+    def terms(self) -> Tuple[Tuple[Term, ...], Tuple[Term, ...]]:
+        """Termos do numerador e do denominador."""
+        return _parse(self.numerador), _parse(self.denominador) if self.denominador else ()
+
+
+# Contas do plano padronizado da CVM: 1 ativo total, 1.01 ativo circulante,
+# 2.01/2.02 passivo circulante/não circulante, 2.03 patrimônio líquido,
+# 3.01 receita líquida e 3.11 lucro líquido do período.
+DEFAULT_INDICATORS: Final[Tuple[Indicator, ...]] = (
+    Indicator("liquidez_corrente", "BPA:1.01", "BPP:2.01"),
+    Indicator("roe", "DRE:3.11", "BPP:2.03"),
+    Indicator("margem_liquida", "DRE:3.11", "DRE:3.01"),
+    Indicator("endividamento", "BPP:2.01 + BPP:2.02", "BPA:1"),
+)
+
+
+class IndicatorEngine:
+    """Calcula indicadores para todas as companhias e datas de uma só vez.
+
+    As contas usadas pelos indicadores de cada demonstrativo são reunidas em um único
+    `StatementCube` (companhia × DT_REFER × conta), o que alinha BPA, BPP e DRE por
+    CD_CVM/DT_REFER/CD_CONTA, aplica `ESCALA_MOEDA`, mantém a maior `VERSAO` e seleciona
+    o `ORDEM_EXERC`. Cada indicador vira uma operação entre matrizes companhias × datas,
+    sem laços por companhia.
+
+    Nos demonstrativos de período (ex.: DRE do ITR, com o trimestre e o acumulado do
+    ano), só as linhas com o `DT_INI_EXERC` mais antigo de cada companhia e data entram
+    no cálculo, ou seja, o acumulado do exercício.
+
+    Args:
+        indicadores: Indicadores a calcular. Padrão é `DEFAULT_INDICATORS`.
+        ordem_exerc: Exercício usado ("ÚLTIMO" ou "PENÚLTIMO"). Padrão é "ÚLTIMO". Se
+            None, não filtra (o cubo falha se restarem os dois exercícios na mesma data).
+
+    Raises:
+        ValueError: se não houver indicadores ou houver nomes repetidos.
+
+    Exemplo:
+        engine = IndicatorEngine()
+        frames = {st: client.load_statement(2024, st, Scope.CON, DocType.DFP) for st in engine.statements()}
+        df = engine.compute(frames)  # CD_CVM, DT_REFER, liquidez_corrente, roe, ...
+    """
+
+    KEY_COLUMNS: Final[tuple[str, ...]] = ("CD_CVM", "DT_REFER")
+    # Colunas lidas de cada demonstrativo (DT_INI_EXERC só nos de período)
+    COLUMNS: Final[tuple[str, ...]] = (
+        "CD_CVM", "DT_REFER", "VERSAO", "ESCALA_MOEDA", "ORDEM_EXERC", "CD_CONTA", "VL_CONTA",
+    )
+
+    def __init__(
+        self,
+        indicadores: Sequence[Indicator] = DEFAULT_INDICATORS,
+        ordem_exerc: Optional[str] = "ÚLTIMO",
+    ):
+        if not indicadores:
+            raise ValueError("Informe ao menos um indicador.")
+        nomes = [ind.nome for ind in indicadores]
+        if len(set(nomes)) != len(nomes):
+            raise ValueError(f"Indicadores com nomes repetidos: {nomes}")
+        self.indicadores: List[Indicator] = list(indicadores)
+        self.ordem_exerc = ordem_exerc
+        self._terms = {ind.nome: ind.terms() for ind in self.indicadores}
+
+    def statements(self) -> List[StatementType]:
+        """Demonstrativos usados pelos indicadores, na ordem em que aparecem."""
+        return list(self.contas())
+
+    def contas(self) -> Dict[StatementType, List[str]]:
+        """Contas usadas de cada demonstrativo."""
+        contas: Dict[StatementType, Dict[str, None]] = {}
+        for numerador, denominador in self._terms.values():
+            for _, statement, conta in numerador + denominador:
+                contas.setdefault(statement, {})[conta] = None
+        return {st: list(cs) for st, cs in contas.items()}
+
+    def columns(self, statement: StatementType) -> List[str]:
+        """Colunas a ler de um demonstrativo."""
+        period = "DT_INI_EXERC" in (CSVReader.get_default_date_cols(statement) or [])
+        return [*self.COLUMNS, "DT_INI_EXERC"] if period else list(self.COLUMNS)
+
+    def key(self) -> str:
+        """Hash da definição dos indicadores, usado na chave do cache de resultados."""
+        spec = {
+            "indicadores": [[ind.nome, ind.numerador, ind.denominador] for ind in self.indicadores],
+            "ordem_exerc": self.ordem_exerc,
+        }
+        return hashlib.sha256(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+
+    # -----------------------------
+    # Cálculo
+    # -----------------------------
+    def compute(self, frames: Mapping[StatementType, pd.DataFrame]) -> pd.DataFrame:
+        """Indicadores de todas as companhias e datas presentes nos demonstrativos.
+
+        Args:
+            frames: Demonstrativo -> DataFrame no formato longo (ex.: retorno de
+                `CVMClient.load_statement`). Basta conter as contas dos indicadores.
+
+        Returns:
+            pd.DataFrame: Uma linha por CD_CVM/DT_REFER com ao menos um indicador
+            calculado, ordenada por CD_CVM e DT_REFER. Divisões por zero viram NaN.
+
+        Raises:
+            KeyError: se faltar o DataFrame de um demonstrativo usado.
+        """
+        missing = [st.value for st in self.statements() if st not in frames]
+        if missing:
+            raise KeyError(f"Demonstrativos ausentes para os indicadores: {missing}")
+        cube = self._cube(frames)
+
+        values: Dict[str, np.ndarray] = {}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for nome, (numerador, denominador) in self._terms.items():
+                num = self._sum(cube, numerador)
+                if denominador:
+                    den = self._sum(cube, denominador)
+                    num = np.where(den != 0, num / den, np.nan)
+                values[nome] = num
+
+        # Matrizes companhias × datas -> formato longo, só com as células preenchidas
+        stacked = np.stack(list(values.values()), axis=-1)
+        c, d = np.nonzero(~np.isnan(stacked).all(axis=-1))
+        result = pd.DataFrame({"CD_CVM": cube.companies[c], "DT_REFER": cube.dates[d]})
+        for i, nome in enumerate(values):
+            result[nome] = stacked[c, d, i]
+        return result
+
+    def versions(self, frames: Mapping[StatementType, pd.DataFrame]) -> pd.DataFrame:
+        """Maior `VERSAO` de cada demonstrativo, CD_CVM e DT_REFER nas contas usadas."""
+        parts = []
+        for statement, contas in self.contas().items():
+            df = self._select(frames[statement], contas, statement)
+            v = (
+                df.groupby(list(self.KEY_COLUMNS), observed=True, sort=True)["VERSAO"]
+                .max()
+                .reset_index()
+            )
+            v.insert(0, "STATEMENT", statement.value)
+            parts.append(v)
+        return concat_frames(parts)
+
+    @staticmethod
+    def versions_digest(versions: pd.DataFrame) -> str:
+        """Hash da tabela de versões; muda quando algum documento é reapresentado."""
+        versions = versions.sort_values(["STATEMENT", *IndicatorEngine.KEY_COLUMNS], ignore_index=True)
+        hashed = pd.util.hash_pandas_object(versions.astype({"STATEMENT": str}), index=False)
+        return hashlib.sha256(hashed.to_numpy().tobytes()).hexdigest()
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    def _select(self, df: pd.DataFrame, contas: List[str], statement: StatementType) -> pd.DataFrame:
+        """Linhas das contas pedidas, do exercício escolhido e do período acumulado."""
+        mask = df["CD_CONTA"].isin(contas).to_numpy()
+        if self.ordem_exerc is not None and "ORDEM_EXERC" in df.columns:
+            mask &= (df["ORDEM_EXERC"] == self.ordem_exerc).to_numpy()
+        df = df[mask]
+        if "DT_INI_EXERC" in df.columns and len(df):
+            inicio = df.groupby(list(self.KEY_COLUMNS), observed=True)["DT_INI_EXERC"].transform("min")
+            df = df[(df["DT_INI_EXERC"] == inicio).to_numpy()]
+        return df
+
+    def _cube(self, frames: Mapping[StatementType, pd.DataFrame]) -> StatementCube:
+        """Cubo único com as contas de todos os demonstrativos (`<DEMONSTRATIVO>:<conta>`)."""
+        parts = []
+        for statement, contas in self.contas().items():
+            df = self._select(frames[statement], contas, statement)
+            cols = [c for c in ("CD_CVM", "DT_REFER", "VERSAO", "ESCALA_MOEDA", "VL_CONTA") if c in df.columns]
+            part = df[cols].copy()
+            part["CD_CONTA"] = statement.value + ":" + df["CD_CONTA"].astype(str)
+            parts.append(part)
+        return StatementCube.from_frame(concat_frames(parts), ordem_exerc=None)
+
+    @staticmethod
+    def _sum(cube: StatementCube, terms: Tuple[Term, ...]) -> np.ndarray:
+        """Soma com sinal das contas (NaN onde alguma conta falta)."""
+        total = np.zeros(cube.shape[:2], dtype=np.float64)
+        for sinal, statement, conta in terms:
+            try:
+                total = total + sinal * cube.conta(f"{statement.value}:{conta}")
+            except KeyError:
+                return np.full(cube.shape[:2], np.nan)
+        return total
+
+
+class IndicatorCache:
+    """Resultados de indicadores gravados em `.npz`, invalidados pela origem e pelas versões.
+
+    Cada arquivo guarda o resultado de um conjunto de indicadores (ver
+    `IndicatorEngine.key`) e, nos metadados, a impressão digital das origens e o hash
+    da tabela de versões (`IndicatorEngine.versions_digest`). Enquanto as origens não
+    mudam, o resultado é lido direto do disco, sem ler nenhum CSV. Se mudarem (ex.: um
+    ZIP baixado de novo), as contas precisam ser lidas para comparar as versões; se
+    forem as mesmas, evita-se apenas o cálculo e só os metadados são atualizados.
+    Os tipos das colunas-chave (ex.: CD_CVM int32) são preservados.
+
+    Args:
+        root: Diretório dos arquivos de resultado.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def path(self, name: str, key: str) -> Path:
+        """Arquivo do resultado (ex.: dfp_con_2024.<hash>.npz)."""
+        return self.root / f"{name}.{key[:16]}.npz"
+
+    @staticmethod
+    def load(path: str | Path) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """Resultado e metadados, ou None se o arquivo não existir/for inválido."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                df = pd.DataFrame({"CD_CVM": data["CD_CVM"], "DT_REFER": data["DT_REFER"]})
+                df = df.astype(meta.get("dtypes", {}))
+                for nome in meta["indicadores"]:
+                    df[nome] = data[f"ind__{nome}"]
+        except (OSError, ValueError, KeyError):
+            return None
+        return df, meta
+
+    @staticmethod
+    def save(path: str | Path, df: pd.DataFrame, meta: Dict[str, Any]) -> Path:
+        """Grava o resultado de forma atômica."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        indicadores = [c for c in df.columns if c not in IndicatorEngine.KEY_COLUMNS]
+        # O npz não guarda tipos do pandas (ex.: Int32); os originais vão nos metadados
+        dtypes = {col: str(df[col].dtype) for col in IndicatorEngine.KEY_COLUMNS}
+        arrays: Dict[str, np.ndarray] = {
+            "meta": np.array(json.dumps({**meta, "indicadores": indicadores, "dtypes": dtypes})),
+            "CD_CVM": df["CD_CVM"].to_numpy(dtype=np.int64),
+            "DT_REFER": df["DT_REFER"].to_numpy(dtype="datetime64[ns]"),
+        }
+        for nome in indicadores:
+            arrays[f"ind__{nome}"] = df[nome].to_numpy(dtype=np.float64)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp.npz")
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path)
+        return path
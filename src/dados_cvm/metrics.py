@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Final, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+__all__ = [
+    "Instrumentation",
+    "StageMetrics",
+    "Sink",
+    "LogSink",
+    "JsonLinesSink",
+    "PrometheusSink",
+    "DISABLED",
+]
+
+_T = TypeVar("_T")
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageMetrics:
+    """Medições de uma etapa do pipeline (download, extração, leitura, normalização).
+
+    Attributes:
+        stage: Nome da etapa (ex.: "download", "extract", "read_csv", "normalize").
+        labels: Identificação do item processado (ex.: {"doc_type": "dfp", "ano": "2024"}).
+        started_at: Início da etapa (epoch).
+        seconds: Duração da etapa (relógio de parede).
+        bytes: Bytes transferidos (download), gravados (extração) ou lidos (CSV).
+        rows: Linhas produzidas pela etapa.
+        retries: Tentativas repetidas após falha.
+        peak_memory: Pico de memória alocada durante a etapa, acima do início dela, em
+            bytes. Só é medido com `Instrumentation(track_memory=True)`.
+        error: Tipo da exceção que encerrou a etapa, se houver.
+    """
+
+    stage: str
+    labels: Dict[str, str] = field(default_factory=dict)
+    started_at: float = 0.0
+    seconds: float = 0.0
+    bytes: int = 0
+    rows: int = 0
+    retries: int = 0
+    peak_memory: Optional[int] = None
+    error: Optional[str] = None
+
+    def add(self, *, bytes: int = 0, rows: int = 0, retries: int = 0) -> None:
+        """Soma contadores à etapa (pode ser chamado de várias threads)."""
+        with _COUNTER_LOCK:
+            self.bytes += bytes
+            self.rows += rows
+            self.retries += retries
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "labels": dict(self.labels),
+            "started_at": self.started_at,
+            "seconds": self.seconds,
+            "bytes": self.bytes,
+            "rows": self.rows,
+            "retries": self.retries,
+            "peak_memory": self.peak_memory,
+            "error": self.error,
+        }
+
+
+_COUNTER_LOCK = threading.Lock()
+
+# Destino das medições: qualquer callable que receba um StageMetrics (ex.: um hook)
+Sink = Callable[[StageMetrics], None]
+
+
+class _NullStage:
+    """Etapa usada quando a instrumentação está desligada: não mede nada."""
+
+    __slots__ = ()
+
+    def add(self, *, bytes: int = 0, rows: int = 0, retries: int = 0) -> None:
+        pass
+
+    def __enter__(self) -> '_NullStage':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+_NULL_STAGE: Final[_NullStage] = _NullStage()
+
+
+class _Stage:
+    """Context manager de uma etapa ativa; ao sair, emite as medições para os sinks."""
+
+    __slots__ = ("_instr", "metrics", "_start", "_mem_base", "_mem_peak")
+
+    def __init__(self, instr: 'Instrumentation', metrics: StageMetrics):
+        self._instr = instr
+        self.metrics = metrics
+        self._start = 0.0
+        self._mem_base = 0
+        self._mem_peak = 0
+
+    def add(self, *, bytes: int = 0, rows: int = 0, retries: int = 0) -> None:
+        self.metrics.add(bytes=bytes, rows=rows, retries=retries)
+
+    def __enter__(self) -> '_Stage':
+        if self._instr.track_memory:
+            self._instr._memory_enter(self)
+        self.metrics.started_at = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.metrics.seconds = time.perf_counter() - self._start
+        # GeneratorExit é o consumidor encerrando um `iterate` antes do fim (ex.: `break`)
+        if exc_type is not None and not issubclass(exc_type, GeneratorExit):
+            self.metrics.error = exc_type.__name__
+        if self._instr.track_memory:
+            self._instr._memory_exit(self)
+        self._instr.emit(self.metrics)
+
+
+class Instrumentation:
+    """Coleta tempo, bytes, linhas, retries e pico de memória por etapa do pipeline.
+
+    Cada etapa instrumentada (download, extração, leitura do CSV, normalização) gera
+    um `StageMetrics` ao terminar, entregue a todos os sinks. Um sink é qualquer
+    callable que receba o `StageMetrics`: além de `LogSink`, `JsonLinesSink` e
+    `PrometheusSink`, uma função comum serve de hook.
+
+    Sem sinks a instrumentação fica desligada: `stage()` devolve sempre o mesmo
+    objeto vazio e nenhuma medição é feita.
+
+    Args:
+        sinks: Destinos das medições.
+        track_memory: Se True, mede o pico de memória de cada etapa com `tracemalloc`.
+            O `tracemalloc` é global ao processo (etapas simultâneas em threads se
+            misturam) e deixa o código sensivelmente mais lento; use para diagnóstico.
+
+    Exemplo:
+        instr = Instrumentation([LogSink(), JsonLinesSink("metricas.jsonl")])
+        client = CVMClient(data_dir="./arquivos", instrumentation=instr)
+
+        with instr.stage("minha_etapa", ano=2024) as st:
+            ...
+            st.add(rows=len(df))
+    """
+
+    def __init__(self, sinks: Iterable[Sink] = (), track_memory: bool = False):
+        self._sinks: List[Sink] = list(sinks)
+        self.track_memory = track_memory
+        self._local = threading.local()
+        self._tracing_lock = threading.Lock()
+        self._tracing_refs = 0
+        self._started_tracing = False
+
+    @property
+    def enabled(self) -> bool:
+        """True se houver algum sink (caso contrário nada é medido)."""
+        return bool(self._sinks)
+
+    @property
+    def sinks(self) -> Tuple[Sink, ...]:
+        return tuple(self._sinks)
+
+    def add_sink(self, sink: Sink) -> None:
+        """Registra mais um destino para as medições."""
+        self._sinks.append(sink)
+
+    def stage(self, name: str, **labels: Any) -> Any:
+        """Context manager que mede uma etapa; os contadores são somados com `add()`."""
+        if not self._sinks:
+            return _NULL_STAGE
+        return _Stage(self, StageMetrics(stage=name, labels={k: str(v) for k, v in labels.items()}))
+
+    def iterate(self, stage: Any, items: Iterable[_T], count: Callable[[_T], int] = len) -> Iterator[_T]:
+        """Mede uma etapa que produz chunks: soma as linhas de cada item entregue.
+
+        A etapa termina quando o iterador se esgota (ou é fechado). O tempo medido
+        inclui o tempo em que o consumidor processa cada chunk.
+        """
+        if stage is _NULL_STAGE:
+            return iter(items)
+
+        def _gen() -> Iterator[_T]:
+            with stage as st:
+                for item in items:
+                    st.add(rows=count(item))
+                    yield item
+
+        return _gen()
+
+    def emit(self, metrics: StageMetrics) -> None:
+        """Entrega as medições aos sinks; a falha de um sink não interrompe o pipeline."""
+        for sink in self._sinks:
+            try:
+                sink(metrics)
+            except Exception:
+                _logger.exception("Falha no sink de métricas %r", sink)
+
+    # -----------------------------
+    # Memória (tracemalloc)
+    # -----------------------------
+    def _stack(self) -> List[_Stage]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _memory_enter(self, stage: _Stage) -> None:
+        with self._tracing_lock:
+            if self._tracing_refs == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            self._tracing_refs += 1
+        current, peak = tracemalloc.get_traced_memory()
+        stack = self._stack()
+        # O pico acumulado até aqui pertence à etapa externa, antes do reset
+        if stack:
+            stack[-1]._mem_peak = max(stack[-1]._mem_peak, peak)
+        tracemalloc.reset_peak()
+        stage._mem_base = stage._mem_peak = current
+        stack.append(stage)
+
+    def _memory_exit(self, stage: _Stage) -> None:
+        _, peak = tracemalloc.get_traced_memory()
+        stage._mem_peak = max(stage._mem_peak, peak)
+        stage.metrics.peak_memory = stage._mem_peak - stage._mem_base
+        stack = self._stack()
+        if stage in stack:
+            stack.remove(stage)
+        if stack:
+            stack[-1]._mem_peak = max(stack[-1]._mem_peak, stage._mem_peak)
+        with self._tracing_lock:
+            self._tracing_refs -= 1
+            if self._tracing_refs == 0 and self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+
+class _DisabledInstrumentation(Instrumentation):
+    """Instrumentação desligada e imutável, compartilhada por todos os clientes."""
+
+    @property  # type: ignore[override]
+    def track_memory(self) -> bool:
+        return False
+
+    @track_memory.setter
+    def track_memory(self, value: bool) -> None:
+        if value:
+            raise RuntimeError("DISABLED não pode ser alterada; crie uma Instrumentation(track_memory=True).")
+
+    def add_sink(self, sink: Sink) -> None:
+        raise RuntimeError("DISABLED não pode ser alterada; crie uma Instrumentation([sink]).")
+
+
+# Instância padrão (sem sinks) usada quando nenhuma instrumentação é informada
+DISABLED: Final[Instrumentation] = _DisabledInstrumentation()
+
+
+# -----------------------------
+# Sinks
+# -----------------------------
+class LogSink:
+    """Registra cada etapa no `logging`, com as medições em `extra={"metrics": ...}`.
+
+    Args:
+        logger: Logger a usar. Padrão é `logging.getLogger("dados_cvm.metrics")`.
+        level: Nível das mensagens. Padrão é INFO.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.logger = logger or _logger
+        self.level = level
+
+    def __call__(self, metrics: StageMetrics) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        labels = "".join(f" {k}={v}" for k, v in metrics.labels.items())
+        memory = f" peak_memory={metrics.peak_memory}" if metrics.peak_memory is not None else ""
+        error = f" error={metrics.error}" if metrics.error else ""
+        self.logger.log(
+            self.level,
+            "%s%s seconds=%.3f bytes=%d rows=%d retries=%d%s%s",
+            metrics.stage,
+            labels,
+            metrics.seconds,
+            metrics.bytes,
+            metrics.rows,
+            metrics.retries,
+            memory,
+            error,
+            extra={"metrics": metrics.to_dict()},
+        )
+
+
+class JsonLinesSink:
+    """Acrescenta cada etapa como uma linha JSON ao arquivo informado.
+
+    Args:
+        path: Arquivo de saída (criado se não existir).
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics: StageMetrics) -> None:
+        line = json.dumps(metrics.to_dict(), ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+
+
+class PrometheusSink:
+    """Mantém totais por etapa/labels e os grava no formato texto do Prometheus.
+
+    O arquivo é regravado atomicamente a cada etapa e pode ser lido pelo textfile
+    collector do node_exporter. Métricas geradas (com o prefixo `prefix`):
+    `_stage_runs_total`, `_stage_errors_total`, `_stage_seconds_total`,
+    `_stage_bytes_total`, `_stage_rows_total`, `_stage_retries_total`,
+    `_stage_last_seconds` e `_stage_peak_memory_bytes` (maior pico observado).
+
+    Os labels de cada etapa viram labels das métricas; evite labels de alta
+    cardinalidade em execuções longas.
+
+    Args:
+        path: Arquivo .prom de saída.
+        prefix: Prefixo dos nomes das métricas. Padrão é "dados_cvm".
+    """
+
+    _COUNTERS: Final[Tuple[Tuple[str, str], ...]] = (
+        ("runs_total", "Execuções da etapa."),
+        ("errors_total", "Execuções da etapa encerradas com erro."),
+        ("seconds_total", "Tempo total gasto na etapa, em segundos."),
+        ("bytes_total", "Bytes transferidos, gravados ou lidos pela etapa."),
+        ("rows_total", "Linhas produzidas pela etapa."),
+        ("retries_total", "Tentativas repetidas após falha."),
+    )
+    _GAUGES: Final[Tuple[Tuple[str, str], ...]] = (
+        ("last_seconds", "Duração da última execução da etapa, em segundos."),
+        ("peak_memory_bytes", "Maior pico de memória alocada pela etapa, em bytes."),
+    )
+
+    def __init__(self, path: str | Path, prefix: str = "dados_cvm"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Dict[str, float]] = {}
+
+    def __call__(self, metrics: StageMetrics) -> None:
+        key = (metrics.stage, tuple(sorted(metrics.labels.items())))
+        with self._lock:
+            s = self._series.setdefault(key, {name: 0.0 for name, _ in self._COUNTERS})
+            s["runs_total"] += 1
+            s["errors_total"] += 1 if metrics.error else 0
+            s["seconds_total"] += metrics.seconds
+            s["bytes_total"] += metrics.bytes
+            s["rows_total"] += metrics.rows
+            s["retries_total"] += metrics.retries
+            s["last_seconds"] = metrics.seconds
+            if metrics.peak_memory is not None:
+                s["peak_memory_bytes"] = max(s.get("peak_memory_bytes", 0.0), metrics.peak_memory)
+            self._write()
+
+    def render(self) -> str:
+        """Conteúdo atual no formato texto do Prometheus."""
+        lines: List[str] = []
+        for name, help_text in self._COUNTERS + self._GAUGES:
+            metric = f"{self.prefix}_stage_{name}"
+            kind = "counter" if name.endswith("_total") else "gauge"
+            samples = [
+                f"{metric}{{{self._labels(stage, labels)}}} {series[name]:g}"
+                for (stage, labels), series in self._series.items()
+                if name in series
+            ]
+            if samples:
+                lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}", *samples]
+        return "\n".join(lines) + "\n"
+
+    def _write(self) -> None:
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    @staticmethod
+    def _labels(stage: str, labels: Tuple[Tuple[str, str], ...]) -> str:
+        def esc(value: str) -> str:
+            return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+        pairs = [("stage", stage), *labels]
+        return ",".join(f'{k}="{esc(v)}"' for k, v in pairs)
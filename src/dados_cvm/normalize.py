@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable, List, Optional
+from functools import lru_cache
+from typing import Final, Iterable, List, Optional, Tuple
 
 import pandas as pd
 
 __all__ = [
+    "CVM_DATE_FORMAT",
     "to_snake_case",
     "normalize_columns",
     "coerce_numeric",
@@ -14,10 +16,14 @@ __all__ = [
 ]
 
 
+# Formato das datas nos arquivos da CVM (ex.: 2024-12-31)
+CVM_DATE_FORMAT: Final[str] = "%Y-%m-%d"
+
 _WHITESPACE_RE = re.compile(r"\s+")
 _NON_ALNUM_RE = re.compile(r"[^0-9a-zA-Z_]")
 
 
+@lru_cache(maxsize=4096)
 def to_snake_case(name: str) -> str:
     """Converte um nome para snake_case básico, removendo acentos/símbolos."""
     # Normalização simples sem remover acentos de forma sofisticada (evita deps extras)
@@ -36,17 +42,26 @@ def normalize_columns(df: pd.DataFrame, columns_map: Optional[dict] = None) -> p
 
     Se `columns_map` for fornecido, aplica substituições específicas após snake_case.
     """
-    new_cols = {c: to_snake_case(c) for c in df.columns}
-    df = df.rename(columns=new_cols)
+    new_cols = _snake_columns(tuple(df.columns))
     if columns_map:
-        df = df.rename(columns=columns_map)
-    return df
+        new_cols = [columns_map.get(c, c) for c in new_cols]
+    # Só troca os rótulos: os dados não são copiados
+    return df.set_axis(new_cols, axis=1, copy=False)
+
+
+@lru_cache(maxsize=256)
+def _snake_columns(columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Nomes em snake_case de um cabeçalho; memoizado, pois os chunks repetem o cabeçalho."""
+    return tuple(to_snake_case(c) for c in columns)
 
 
 def coerce_numeric(df: pd.DataFrame, cols: Iterable[str]) -> pd.DataFrame:
-    """Converte colunas para numérico com `pd.to_numeric(errors='coerce')`."""
+    """Converte colunas para numérico com `pd.to_numeric(errors='coerce')`.
+
+    Colunas que já são numéricas (ex.: tipadas pelo esquema do `CSVReader`) são mantidas.
+    """
     for c in cols:
-        if c in df.columns:
+        if c in df.columns and not pd.api.types.is_numeric_dtype(df[c]):
             df[c] = pd.to_numeric(df[c], errors="coerce")
     return df
 
@@ -55,9 +70,11 @@ def parse_dates(df: pd.DataFrame, cols: Iterable[str], dayfirst: bool = False, f
     """Converte colunas para datetime com `pd.to_datetime`.
 
     Define `errors='coerce'` para evitar falhas e resultar em NaT em casos inválidos.
+    Com `format` (ex.: `CVM_DATE_FORMAT`) o pandas não precisa inferir o formato.
+    Colunas que já são datetime são mantidas.
     """
     for c in cols:
-        if c in df.columns:
+        if c in df.columns and not pd.api.types.is_datetime64_any_dtype(df[c]):
             df[c] = pd.to_datetime(df[c], errors="coerce", dayfirst=dayfirst, format=format)
     return df
 
@@ -68,15 +85,22 @@ def standardize_dataframe(
     date_cols: Optional[Iterable[str]] = None,
     numeric_cols: Optional[Iterable[str]] = None,
     columns_map: Optional[dict] = None,
+    date_format: Optional[str] = None,
 ) -> pd.DataFrame:
     """Pipeline simples: renomeia colunas → datas → numéricos.
 
+    Em DataFrames lidos pelo `CSVReader` as datas e os valores já vêm tipados pelo
+    esquema do demonstrativo, e a etapa se resume a renomear as colunas.
+
+    Sem `date_format` o pandas infere o formato das datas; para arquivos da CVM,
+    passe `CVM_DATE_FORMAT`.
+
     Exemplo de uso:
         df = standardize_dataframe(df, date_cols=["dt_referencia"], numeric_cols=["vl_conta"]) 
     """
     df = normalize_columns(df, columns_map=columns_map)
     if date_cols:
-        df = parse_dates(df, date_cols)
+        df = parse_dates(df, date_cols, format=date_format)
     if numeric_cols:
         df = coerce_numeric(df, numeric_cols)
     return df
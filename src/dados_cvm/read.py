@@ -1,32 +1,192 @@
 from __future__ import annotations
 
+import importlib
+import importlib.util
+import zipfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, Optional
+from typing import Any, Dict, Final, Iterable, Iterator, List, Literal, Optional
 
+import numpy as np
 import pandas as pd
 
-from .endpoints import StatementType
+from .endpoints import DocType, StatementType
+from .metrics import DISABLED, Instrumentation
+from .normalize import CVM_DATE_FORMAT
 
-__all__ = ["CSVReader"]
+__all__ = ["CSVReader", "CSVEngine", "Backend"]
 
+CSVEngine = Literal["c", "pyarrow", "python"]
+Backend = Literal["pandas", "arrow", "polars"]
 
-# Presets simples de dtypes por StatementType.
-# Observação: os esquemas completos variam; mantenha flexível e sobrescrevível via parâmetro.
-_COMMON_DTYPES: Dict[str, str] = {
-    "cnpj_cia": "string",
-    "dt_referencia": "string",  # será convertido depois para datetime, se desejado
-    "vl_conta": "float64",
+_ENGINES: Final[tuple[str, ...]] = ("c", "pyarrow", "python")
+_BACKENDS: Final[tuple[str, ...]] = ("pandas", "arrow", "polars")
+
+
+# Esquemas dos demonstrativos (cabeçalhos oficiais da CVM, em maiúsculas).
+# Colunas de baixa cardinalidade viram `category`, que armazena cada valor distinto
+# uma única vez; códigos inteiros usam o menor tipo que os comporta, na versão
+# anulável (Int16/Int32) para que um campo em branco não interrompa a leitura.
+_BASE_DTYPES: Dict[str, str] = {
+    "CNPJ_CIA": "category",
+    "VERSAO": "Int16",
+    "DENOM_CIA": "category",
+    "CD_CVM": "Int32",
+    "GRUPO_DFP": "category",
+    "MOEDA": "category",
+    "ESCALA_MOEDA": "category",
+    "ORDEM_EXERC": "category",
+    "CD_CONTA": "category",
+    "DS_CONTA": "category",
+    "VL_CONTA": "float64",
+    "ST_CONTA_FIXA": "category",
 }
 
+# DMPL traz a coluna do patrimônio líquido a que o valor se refere
+_DMPL_DTYPES: Dict[str, str] = {**_BASE_DTYPES, "COLUNA_DF": "category"}
+
 _DTYPES_BY_STATEMENT: Dict[StatementType, Dict[str, str]] = {
-    StatementType.BPA: _COMMON_DTYPES,
-    StatementType.BPP: _COMMON_DTYPES,
-    StatementType.DRE: _COMMON_DTYPES,
-    StatementType.DFC_MD: _COMMON_DTYPES,
-    StatementType.DFC_MI: _COMMON_DTYPES,
-    StatementType.DMPL: _COMMON_DTYPES,
-    StatementType.DRA: _COMMON_DTYPES,
-    StatementType.DVA: _COMMON_DTYPES,
+    StatementType.BPA: _BASE_DTYPES,
+    StatementType.BPP: _BASE_DTYPES,
+    StatementType.DRE: _BASE_DTYPES,
+    StatementType.DFC_MD: _BASE_DTYPES,
+    StatementType.DFC_MI: _BASE_DTYPES,
+    StatementType.DMPL: _DMPL_DTYPES,
+    StatementType.DRA: _BASE_DTYPES,
+    StatementType.DVA: _BASE_DTYPES,
+}
+
+# Inteiros anuláveis deixam o parser do pandas cerca de 2x mais lento nessas colunas;
+# a leitura usa o tipo numpy equivalente e converte o resultado (ver `read_csv`).
+_NULLABLE_INTS: Final[Dict[str, str]] = {"Int16": "int16", "Int32": "int32"}
+
+# Datas no formato ISO usado pela CVM. Balanços (BPA/BPP) são posições em uma data e
+# não têm DT_INI_EXERC; os demais demonstrativos cobrem um período.
+_DATE_FORMAT: Final[str] = CVM_DATE_FORMAT
+_POSITION_DATES: List[str] = ["DT_REFER", "DT_FIM_EXERC"]
+_PERIOD_DATES: List[str] = ["DT_REFER", "DT_INI_EXERC", "DT_FIM_EXERC"]
+
+_DATE_COLS_BY_STATEMENT: Dict[StatementType, List[str]] = {
+    StatementType.BPA: _POSITION_DATES,
+    StatementType.BPP: _POSITION_DATES,
+    StatementType.DRE: _PERIOD_DATES,
+    StatementType.DFC_MD: _PERIOD_DATES,
+    StatementType.DFC_MI: _PERIOD_DATES,
+    StatementType.DMPL: _PERIOD_DATES,
+    StatementType.DRA: _PERIOD_DATES,
+    StatementType.DVA: _PERIOD_DATES,
+}
+
+# Esquemas dos demais arquivos, por tipo de documento. Cada esquema reúne as colunas
+# de todas as tabelas do tipo (colunas ausentes no arquivo lido são ignoradas).
+# O CSV de índice dos ZIPs (ex.: fca_cia_aberta_2024.csv) tem uma linha por documento
+# entregue; as tabelas do FCA/FRE usam cabeçalhos em CamelCase.
+_INDEX_DTYPES: Dict[str, str] = {
+    "CNPJ_CIA": "category",
+    "VERSAO": "Int16",
+    "DENOM_CIA": "category",
+    "CD_CVM": "Int32",
+    "CATEG_DOC": "category",
+    "ID_DOC": "Int32",
+}
+_INDEX_DATES: List[str] = ["DT_REFER", "DT_RECEB"]
+
+_FORM_DTYPES: Dict[str, str] = {
+    "CNPJ_Companhia": "category",
+    "Versao": "Int16",
+    "ID_Documento": "Int32",
+    "Nome_Companhia": "category",
+    "Nome_Empresarial": "category",
+    "Codigo_CVM": "Int32",
+    "Categoria_Registro_CVM": "category",
+    "Situacao_Registro_CVM": "category",
+    "Pais_Origem": "category",
+    "Setor_Atividade": "category",
+    "Situacao_Emissor": "category",
+    "Especie_Controle_Acionario": "category",
+    "Valor_Mobiliario": "category",
+    "Codigo_Negociacao": "category",
+    "Mercado": "category",
+    "Segmento": "category",
+    "Sigla_Entidade_Administradora": "category",
+    "Municipio": "category",
+    "Sigla_UF": "category",
+    "Pais": "category",
+}
+_FORM_DATES: List[str] = [
+    "Data_Referencia",
+    "Data_Constituicao",
+    "Data_Registro_CVM",
+    "Data_Situacao_Registro_CVM",
+    "Data_Situacao_Emissor",
+    "Data_Inicio_Negociacao",
+    "Data_Fim_Negociacao",
+    "Data_Inicio_Listagem",
+    "Data_Fim_Listagem",
+]
+
+_IPE_DTYPES: Dict[str, str] = {
+    "CNPJ_Companhia": "category",
+    "Nome_Companhia": "category",
+    "Codigo_CVM": "Int32",
+    "Categoria": "category",
+    "Tipo": "category",
+    "Especie": "category",
+    "Tipo_Apresentacao": "category",
+    "Versao": "Int16",
+}
+_IPE_DATES: List[str] = ["Data_Referencia", "Data_Entrega"]
+
+# Telefones e CEPs são textos (zeros à esquerda)
+_CAD_DTYPES: Dict[str, str] = {
+    "CNPJ_CIA": "category",
+    "CD_CVM": "Int32",
+    "MOTIVO_CANCEL": "category",
+    "SIT": "category",
+    "SETOR_ATIV": "category",
+    "TP_MERC": "category",
+    "CATEG_REG": "category",
+    "SIT_EMISSOR": "category",
+    "CONTROLE_ACIONARIO": "category",
+    "TP_ENDER": "category",
+    "MUN": "category",
+    "UF": "category",
+    "PAIS": "category",
+    "CEP": "string",
+    "DDD_TEL": "string",
+    "TEL": "string",
+    "DDD_FAX": "string",
+    "FAX": "string",
+    "TP_RESP": "category",
+    "CNPJ_AUDITOR": "category",
+    "AUDITOR": "category",
+}
+_CAD_DATES: List[str] = [
+    "DT_REG",
+    "DT_CONST",
+    "DT_CANCEL",
+    "DT_INI_SIT",
+    "DT_INI_CATEG",
+    "DT_INI_SIT_EMISSOR",
+    "DT_INI_RESP",
+]
+
+_DTYPES_BY_DOC_TYPE: Dict[DocType, Dict[str, str]] = {
+    DocType.DFP: _INDEX_DTYPES,
+    DocType.ITR: _INDEX_DTYPES,
+    DocType.FCA: {**_INDEX_DTYPES, **_FORM_DTYPES},
+    DocType.FRE: {**_INDEX_DTYPES, **_FORM_DTYPES},
+    DocType.IPE: _IPE_DTYPES,
+    DocType.CAD: _CAD_DTYPES,
+}
+
+_DATE_COLS_BY_DOC_TYPE: Dict[DocType, List[str]] = {
+    DocType.DFP: _INDEX_DATES,
+    DocType.ITR: _INDEX_DATES,
+    DocType.FCA: _INDEX_DATES + _FORM_DATES,
+    DocType.FRE: _INDEX_DATES + _FORM_DATES,
+    DocType.IPE: _IPE_DATES,
+    DocType.CAD: _CAD_DATES,
 }
 
 
@@ -39,6 +199,25 @@ class CSVReader:
             return None
         return _DTYPES_BY_STATEMENT.get(statement)
 
+    @staticmethod
+    def get_default_date_cols(statement: Optional[StatementType]) -> Optional[List[str]]:
+        if statement is None:
+            return None
+        return _DATE_COLS_BY_STATEMENT.get(statement)
+
+    @staticmethod
+    def get_dataset_dtypes(doc_type: Optional[DocType]) -> Optional[Dict[str, str]]:
+        """Esquema dos arquivos que não são demonstrativos (índices, FCA, FRE, IPE, cadastro)."""
+        if doc_type is None:
+            return None
+        return _DTYPES_BY_DOC_TYPE.get(doc_type)
+
+    @staticmethod
+    def get_dataset_date_cols(doc_type: Optional[DocType]) -> Optional[List[str]]:
+        if doc_type is None:
+            return None
+        return _DATE_COLS_BY_DOC_TYPE.get(doc_type)
+
     @staticmethod
     def read_csv(
         path: str | Path,
@@ -49,39 +228,291 @@ class CSVReader:
         encoding: Optional[str] = "latin1",
         sep: str = ",",
         statement: Optional[StatementType] = None,
-    ) -> pd.DataFrame | Iterator[pd.DataFrame]:
+        doc_type: Optional[DocType] = None,
+        member: Optional[str] = None,
+        parse_dates: Optional[Iterable[str]] = None,
+        engine: CSVEngine = "c",
+        backend: Backend = "pandas",
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> Any:
         """Lê um CSV com pandas, suportando chunks e dtypes presets.
 
+        Se `member` for informado, `path` é tratado como um arquivo ZIP e o CSV é lido
+        diretamente de dentro dele (`zipfile.ZipFile.open`), sem extração para o disco.
+
         Args:
-            path: caminho do arquivo CSV.
+            path: caminho do arquivo CSV (ou do ZIP, quando `member` for informado).
             dtypes: mapeamento de colunas -> dtype pandas (sobrepõe preset).
             chunksize: se definido, retorna um iterador de DataFrames.
             usecols: colunas a carregar (otimiza memória e tempo).
             encoding: encoding do arquivo (default: utf-8).
             sep: separador (default: ',').
-            statement: se informado, usa presets básicos de dtypes.
+            statement: se informado, usa os esquemas de dtypes e de datas do demonstrativo.
+            doc_type: sem `statement`, usa o esquema do tipo de documento (CSV de índice,
+                tabelas do FCA/FRE, IPE ou cadastro).
+            member: nome do CSV dentro do ZIP indicado em `path`.
+            parse_dates: colunas de data (formato %Y-%m-%d) convertidas durante a leitura
+                (sobrepõe o preset do statement).
+            engine: parser: "c" (padrão), "pyarrow" (leitor CSV multithread do Arrow) ou
+                "python". Sem o `pyarrow` instalado, "pyarrow" recai para "c".
+            backend: tipo do resultado: "pandas" (padrão), "arrow" (`pyarrow.Table`, lido
+                pelo leitor CSV multithread do Arrow) ou "polars" (`polars.DataFrame`).
+            instrumentation: Recebe as medições da etapa "read_csv" (bytes do CSV e linhas
+                lidas). Com `chunksize`, a etapa termina quando o iterador se esgota.
 
         Returns:
-            DataFrame completo ou Iterator[DataFrame] quando chunksize for usado.
+            DataFrame completo ou Iterator[DataFrame] quando chunksize for usado (ou os
+            equivalentes em Arrow/polars, conforme `backend`).
+
+        Raises:
+            FileNotFoundError: se o arquivo (ou o membro dentro do ZIP) não existir.
+            ImportError: se o backend pedido exigir um pacote não instalado.
+            ValueError: se engine/backend forem desconhecidos.
         """
+        if engine not in _ENGINES:
+            raise ValueError(f"Engine inválida: {engine!r}. Use um de {_ENGINES}.")
+        if backend not in _BACKENDS:
+            raise ValueError(f"Backend inválido: {backend!r}. Use um de {_BACKENDS}.")
+
         path = Path(path)
         if not path.exists():
-            raise FileNotFoundError(f"Arquivo CSV não encontrado: {path}")
+            raise FileNotFoundError(f"Arquivo {'ZIP' if member else 'CSV'} não encontrado: {path}")
+        size = None
+        if member is not None:
+            with zipfile.ZipFile(path, "r") as zf:
+                if member not in zf.NameToInfo:
+                    raise FileNotFoundError(f"Arquivo {member} não encontrado dentro de {path}")
+                size = zf.NameToInfo[member].file_size
 
-        # Define dtypes padrão por statement, permitindo override pelo usuário
-        final_dtypes = dict(CSVReader.get_default_dtypes(statement) or {})
+        # Define dtypes padrão por statement (ou tipo de documento), permitindo override pelo usuário
+        if statement is not None:
+            default_dtypes = CSVReader.get_default_dtypes(statement)
+            default_dates = CSVReader.get_default_date_cols(statement)
+        else:
+            default_dtypes = CSVReader.get_dataset_dtypes(doc_type)
+            default_dates = CSVReader.get_dataset_date_cols(doc_type)
+        final_dtypes = dict(default_dtypes or {})
         if dtypes:
             final_dtypes.update(dtypes)
 
-        read_kwargs = dict(
-            dtype=final_dtypes if final_dtypes else None,
-            usecols=list(usecols) if usecols is not None else None,
+        cols = list(usecols) if usecols is not None else None
+        date_cols = list(parse_dates) if parse_dates is not None else default_dates
+        if date_cols:
+            # Só converte datas que existem no arquivo/seleção e que o usuário não tipou
+            available = cols if cols is not None else CSVReader._read_header(path, member, encoding, sep)
+            date_cols = [c for c in date_cols if c in available and c not in (dtypes or {})]
+
+        # O parser do pandas com engine="pyarrow" infere o tipo das categorias (ex.: o
+        # CD_CONTA "1.10" viraria o float 1.1); o leitor do Arrow recebe os tipos
+        # explícitos do esquema e também suporta leitura em chunks.
+        use_arrow = backend != "pandas" or (engine == "pyarrow" and _has_module("pyarrow"))
+        if engine == "pyarrow" and not use_arrow:
+            engine = "c"
+
+        instr = instrumentation or DISABLED
+        stage = instr.stage(
+            "read_csv", file=member or path.name, engine="pyarrow" if use_arrow else engine, backend=backend
+        )
+        if instr.enabled:
+            stage.add(bytes=size if size is not None else path.stat().st_size)
+
+        if use_arrow:
+            if chunksize is not None:
+                return instr.iterate(
+                    stage,
+                    CSVReader._read_arrow(
+                        path, member, chunksize, cols, final_dtypes, date_cols or [], encoding, sep, backend
+                    ),
+                )
+            with stage:
+                result = CSVReader._read_arrow(
+                    path, member, None, cols, final_dtypes, date_cols or [], encoding, sep, backend
+                )
+                stage.add(rows=len(result))
+            return result
+
+        # Inteiros anuláveis: lê com o tipo numpy e converte; se houver campos em branco
+        # a leitura completa é refeita com os tipos anuláveis, e os chunks (que não podem
+        # ser relidos) passam por float64
+        nullable = {c: t for c, t in final_dtypes.items() if t in _NULLABLE_INTS}
+        fast = {c: "float64" if chunksize is not None else _NULLABLE_INTS[t] for c, t in nullable.items()}
+        read_kwargs: Dict[str, Any] = dict(
+            dtype={**final_dtypes, **fast} if final_dtypes else None,
+            usecols=cols,
             encoding=encoding,
             sep=sep,
-            low_memory=False,
+            engine=engine,
         )
+        if engine == "c":
+            read_kwargs["low_memory"] = False
+        if date_cols:
+            read_kwargs.update(parse_dates=date_cols, date_format=_DATE_FORMAT)
+
+        def _nullable(df: pd.DataFrame) -> pd.DataFrame:
+            present = {c: t for c, t in nullable.items() if c in df.columns}
+            return df.astype(present) if present else df
+
+        if chunksize is None:
+            with stage:
+                try:
+                    with CSVReader._open(path, member) as src:
+                        df = pd.read_csv(src, **read_kwargs)
+                except ValueError:
+                    if not nullable:
+                        raise
+                    with CSVReader._open(path, member) as src:
+                        df = pd.read_csv(src, **{**read_kwargs, "dtype": final_dtypes})
+                df = _nullable(df)
+                stage.add(rows=len(df))
+            return df
+
+        def _iter_chunks() -> Iterator[pd.DataFrame]:
+            # O arquivo (ou o ZIP) permanece aberto enquanto o iterador for consumido
+            with CSVReader._open(path, member) as src, pd.read_csv(
+                src, chunksize=chunksize, **read_kwargs
+            ) as reader:
+                for chunk in reader:
+                    yield _nullable(chunk)
+
+        return instr.iterate(stage, _iter_chunks())
+
+    @staticmethod
+    def arrow_schema(
+        dtypes: Dict[str, str],
+        date_cols: Iterable[str] = (),
+    ) -> Dict[str, Any]:
+        """Converte um esquema de dtypes do pandas para tipos do Arrow.
+
+        `category` vira `dictionary<int32, string>` e as colunas de data viram
+        `timestamp[ns]`, mantendo o mesmo layout compacto dos DataFrames.
+        """
+        import pyarrow as pa
+
+        types: Dict[str, Any] = {}
+        for col, dtype in dtypes.items():
+            if dtype == "category":
+                types[col] = pa.dictionary(pa.int32(), pa.string())
+            elif dtype == "string":
+                types[col] = pa.string()
+            else:
+                pd_dtype = pd.api.types.pandas_dtype(dtype)
+                types[col] = pa.from_numpy_dtype(getattr(pd_dtype, "numpy_dtype", pd_dtype))
+        for col in date_cols:
+            types[col] = pa.timestamp("ns")
+        return types
+
+    @staticmethod
+    def to_backend(table: Any, backend: Backend) -> Any:
+        """Converte uma `pyarrow.Table` para o backend pedido."""
+        if backend == "arrow":
+            return table
+        if backend == "polars":
+            pl = _import_optional("polars", "backend='polars'")
+            return pl.from_arrow(table)
+        return table.to_pandas(types_mapper=CSVReader.pandas_types_mapper)
+
+    @staticmethod
+    def pandas_types_mapper(arrow_type: Any) -> Optional[Any]:
+        """`types_mapper` de `Table.to_pandas`: inteiros do esquema viram Int16/Int32.
+
+        Mantém os mesmos tipos anuláveis da leitura com pandas; os demais tipos seguem
+        a conversão padrão do Arrow.
+        """
+        import pyarrow as pa
+
+        if arrow_type == pa.int16():
+            return pd.Int16Dtype()
+        if arrow_type == pa.int32():
+            return pd.Int32Dtype()
+        return None
+
+    @staticmethod
+    def _read_arrow(
+        path: Path,
+        member: Optional[str],
+        chunksize: Optional[int],
+        cols: Optional[List[str]],
+        dtypes: Dict[str, str],
+        date_cols: List[str],
+        encoding: Optional[str],
+        sep: str,
+        backend: Backend,
+    ) -> Any:
+        """Lê com o leitor CSV do Arrow (multithread) e converte para o backend."""
+        _import_optional("pyarrow", f"backend={backend!r}")
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        read_options = pa_csv.ReadOptions(encoding=encoding or "utf8")
+        parse_options = pa_csv.ParseOptions(delimiter=sep)
+        convert_options = pa_csv.ConvertOptions(
+            column_types=CSVReader.arrow_schema(dtypes, date_cols),
+            include_columns=cols,
+        )
+
+        if chunksize is None:
+            with CSVReader._open(path, member) as src:
+                table = pa_csv.read_csv(
+                    src,
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options,
+                )
+            return CSVReader.to_backend(table, backend)
+
+        def _iter_chunks() -> Iterator[Any]:
+            # Reagrupa os blocos do leitor em tabelas de exatamente `chunksize` linhas
+            pending: List[Any] = []
+            pending_rows = 0
+            with CSVReader._open(path, member) as src:
+                reader = pa_csv.open_csv(
+                    src,
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options,
+                )
+                for batch in reader:
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    while pending_rows >= chunksize:
+                        table = pa.Table.from_batches(pending)
+                        yield CSVReader.to_backend(table.slice(0, chunksize), backend)
+                        rest = table.slice(chunksize)
+                        pending = rest.to_batches()
+                        pending_rows = rest.num_rows
+            if pending_rows:
+                yield CSVReader.to_backend(pa.Table.from_batches(pending), backend)
+
+        return _iter_chunks()
+
+    @staticmethod
+    @contextmanager
+    def _open(path: Path, member: Optional[str]) -> Iterator[Any]:
+        """Abre a origem da leitura: o próprio caminho, ou o membro do ZIP em streaming."""
+        if member is None:
+            yield path
+            return
+        with zipfile.ZipFile(path, "r") as zf, zf.open(member, "r") as fh:
+            yield fh
+
+    @staticmethod
+    def _read_header(
+        path: Path,
+        member: Optional[str],
+        encoding: Optional[str],
+        sep: str,
+    ) -> List[str]:
+        """Lê apenas a linha de cabeçalho do CSV (ou do membro do ZIP)."""
+        with CSVReader._open(path, member) as src:
+            return list(pd.read_csv(src, nrows=0, encoding=encoding, sep=sep).columns)
+
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
 
-        if chunksize is not None:
-            return pd.read_csv(path, chunksize=chunksize, **read_kwargs)
-        return pd.read_csv(path, **read_kwargs)
 
+def _import_optional(name: str, feature: str) -> Any:
+    """Importa uma dependência opcional com mensagem de erro explicativa."""
+    if not _has_module(name):
+        raise ImportError(f"{feature} requer o pacote opcional '{name}' (pip install {name}).")
+    return importlib.import_module(name)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Final, List, Optional
+
+import pandas as pd
+
+from .endpoints import DocType
+
+__all__ = ["SyncManifest", "SyncResult", "SyncReport"]
+
+# Colunas que identificam uma versão entregue de um documento
+KEY_COLUMNS: Final[tuple[str, ...]] = ("CD_CVM", "DT_REFER", "VERSAO")
+
+
+class SyncManifest:
+    """Manifesto do `CVMClient.sync`: o que foi baixado e extraído em cada ZIP.
+
+    Para cada par tipo/ano guarda URL, ETag, Last-Modified, tamanho e sha256 do ZIP;
+    para cada CSV extraído, o tamanho e o CRC32 registrados no ZIP; e as chaves
+    `(CD_CVM, DT_REFER, VERSAO)` já vistas, usadas para reportar apenas as novas.
+
+    O arquivo é um JSON gravado de forma atômica. Um manifesto ausente ou corrompido
+    equivale a um manifesto vazio (tudo é considerado novo).
+
+    Args:
+        path: Caminho do arquivo JSON do manifesto.
+    """
+
+    VERSION: Final[int] = 1
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._zips: Dict[str, Dict[str, Any]] = self._load()
+
+    @staticmethod
+    def key(doc_type: DocType, ano: int) -> str:
+        """Chave do par tipo/ano (ex.: 'itr/2024')."""
+        return f"{doc_type.value}/{ano}"
+
+    def get(self, doc_type: DocType, ano: int) -> Optional[Dict[str, Any]]:
+        """Registro do ZIP, ou None se ele nunca foi sincronizado."""
+        with self._lock:
+            return self._zips.get(self.key(doc_type, ano))
+
+    def update(self, doc_type: DocType, ano: int, record: Dict[str, Any]) -> None:
+        """Substitui o registro do ZIP (gravado no disco só em `save`)."""
+        with self._lock:
+            self._zips[self.key(doc_type, ano)] = {**record, "synced_at": time.time()}
+
+    def save(self) -> None:
+        """Grava o manifesto de forma atômica."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            payload = {"version": self.VERSION, "zips": self._zips}
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+    # -----------------------------
+    # Chaves (CD_CVM, DT_REFER, VERSAO)
+    # -----------------------------
+    @staticmethod
+    def keys_to_record(keys: pd.DataFrame) -> Dict[str, list]:
+        """Serializa as chaves em formato colunar (uma lista por coluna)."""
+        return {c: keys[c].tolist() for c in KEY_COLUMNS}
+
+    @staticmethod
+    def keys_from_record(record: Optional[Dict[str, list]]) -> pd.DataFrame:
+        """Reconstrói o DataFrame de chaves gravado com `keys_to_record`."""
+        if not record:
+            return _empty_keys()
+        return _typed_keys(pd.DataFrame({c: record[c] for c in KEY_COLUMNS}))
+
+    @staticmethod
+    def read_keys(zip_path: str | Path, index_member: Optional[str]) -> pd.DataFrame:
+        """Lê as chaves distintas `(CD_CVM, DT_REFER, VERSAO)` de um ZIP da CVM.
+
+        Usa o CSV de índice do ZIP (ex.: itr_cia_aberta_2024.csv), que tem uma linha por
+        documento entregue. Se ele não existir, as chaves são lidas de todos os CSVs.
+        """
+        frames: List[pd.DataFrame] = []
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            names = zf.namelist()
+            if index_member in names:
+                names = [index_member]
+            for name in names:
+                if not name.lower().endswith(".csv"):
+                    continue
+                with zf.open(name) as fh:
+                    try:
+                        df = pd.read_csv(fh, sep=";", encoding="latin1", usecols=list(KEY_COLUMNS))
+                    except ValueError:
+                        continue  # CSV sem as colunas-chave
+                frames.append(df.drop_duplicates())
+        if not frames:
+            return _empty_keys()
+        return _typed_keys(pd.concat(frames, ignore_index=True).drop_duplicates(ignore_index=True))
+
+    @staticmethod
+    def new_keys(current: pd.DataFrame, previous: pd.DataFrame) -> pd.DataFrame:
+        """Chaves de `current` que não estavam em `previous` (anti-join vetorizado)."""
+        if previous.empty:
+            return current.reset_index(drop=True)
+        merged = current.merge(previous, on=list(KEY_COLUMNS), how="left", indicator=True)
+        return merged.loc[merged["_merge"] == "left_only", list(KEY_COLUMNS)].reset_index(drop=True)
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+        if payload.get("version") != self.VERSION:
+            return {}
+        return dict(payload.get("zips", {}))
+
+
+@dataclass
+class SyncResult:
+    """Resultado de um par `(ano, doc_type)` em `CVMClient.sync`.
+
+    Attributes:
+        changed: True se o ZIP é novo ou mudou desde a última sincronização.
+        extracted: CSVs (re)extraídos para `path_data_dir` nesta sincronização.
+        new_keys: Chaves `(CD_CVM, DT_REFER, VERSAO)` que não existiam antes.
+        error: Exceção que impediu a sincronização do item, se houver.
+    """
+
+    ano: int
+    doc_type: DocType
+    changed: bool = False
+    zip_path: Optional[Path] = None
+    extracted: List[str] = field(default_factory=list)
+    new_keys: pd.DataFrame = field(default_factory=lambda: _empty_keys())
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class SyncReport:
+    """Resultado de `CVMClient.sync`: um `SyncResult` por par, na ordem pedida."""
+
+    results: List[SyncResult]
+
+    @property
+    def changed(self) -> List[SyncResult]:
+        """Itens cujo ZIP mudou."""
+        return [r for r in self.results if r.ok and r.changed]
+
+    @property
+    def errors(self) -> List[SyncResult]:
+        """Itens que falharam."""
+        return [r for r in self.results if not r.ok]
+
+    def new_keys(self) -> pd.DataFrame:
+        """Todas as chaves novas, com as colunas `DOC_TYPE` e `ANO` do ZIP de origem."""
+        frames = [
+            r.new_keys.assign(DOC_TYPE=r.doc_type.value, ANO=r.ano)
+            for r in self.results
+            if r.ok and not r.new_keys.empty
+        ]
+        if not frames:
+            return _empty_keys().assign(DOC_TYPE=pd.Series(dtype=object), ANO=pd.Series(dtype="int64"))
+        return pd.concat(frames, ignore_index=True)
+
+
+def _typed_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """Tipos estáveis para comparar chaves lidas do CSV com as gravadas no manifesto.
+
+    Linhas com alguma chave em branco são descartadas antes da conversão: não
+    identificam uma entrega e, convertidas, virariam chaves "nan" reportadas
+    como novas a cada sincronização.
+    """
+    df = df.dropna(subset=list(KEY_COLUMNS), ignore_index=True)
+    return df.astype({"CD_CVM": "int64", "DT_REFER": str, "VERSAO": "int64"})
+
+
+def _empty_keys() -> pd.DataFrame:
+    return _typed_keys(pd.DataFrame({c: [] for c in KEY_COLUMNS}))
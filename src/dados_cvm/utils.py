@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+__all__ = [
+    "Filters",
+    "build_mask",
+    "filters_to_arrow",
+    "concat_frames",
+    "source_fingerprint",
+]
+
+# Filtros de igualdade por coluna: valor escalar (==) ou coleção de valores (isin).
+# Ex.: {"CD_CVM": [9512, 4170], "ORDEM_EXERC": "ÚLTIMO"}
+Filters = Mapping[str, Any]
+
+
+def _as_values(value: Any) -> Optional[List[Any]]:
+    """Retorna a lista de valores se o filtro for uma coleção, ou None se for escalar."""
+    if isinstance(value, (list, tuple, set, frozenset, np.ndarray, pd.Index, pd.Series)):
+        return list(value)
+    return None
+
+
+def build_mask(df: pd.DataFrame, filters: Optional[Filters]) -> Optional[np.ndarray]:
+    """Combina os filtros em uma única máscara booleana.
+
+    Args:
+        df: DataFrame a ser filtrado.
+        filters: Mapeamento coluna -> valor (==) ou coleção de valores (isin).
+
+    Returns:
+        Array booleano com uma posição por linha, ou None se não houver filtros.
+
+    Raises:
+        KeyError: se alguma coluna filtrada não existir no DataFrame.
+    """
+    if not filters:
+        return None
+    mask = np.ones(len(df), dtype=bool)
+    for col, value in filters.items():
+        values = _as_values(value)
+        if values is not None:
+            mask &= df[col].isin(values).to_numpy()
+        else:
+            mask &= (df[col] == value).to_numpy()
+    return mask
+
+
+def filters_to_arrow(filters: Optional[Filters]) -> Optional[List[tuple]]:
+    """Converte os filtros para o formato aceito por `pyarrow`/`pd.read_parquet(filters=...)`."""
+    if not filters:
+        return None
+    expr = []
+    for col, value in filters.items():
+        values = _as_values(value)
+        expr.append((col, "in", values) if values is not None else (col, "==", value))
+    return expr
+
+
+def concat_frames(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """Concatena DataFrames preservando colunas `category`.
+
+    `pd.concat` transforma em `object` as colunas categóricas cujas categorias diferem
+    entre as partes (caso comum entre chunks e anos). Aqui as categorias são unidas
+    antes, mantendo o layout compacto no resultado.
+    """
+    frames = [f for f in frames if f is not None]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+
+    cat_cols = [
+        c
+        for c in frames[0].columns
+        if all(c in f.columns and isinstance(f[c].dtype, pd.CategoricalDtype) for f in frames)
+    ]
+    if cat_cols:
+        unified: Dict[str, pd.CategoricalDtype] = {
+            c: pd.CategoricalDtype(union_categoricals([f[c] for f in frames]).categories)
+            for c in cat_cols
+        }
+        frames = [f.astype(unified) for f in frames]
+    return pd.concat(frames, ignore_index=True)
+
+
+
+def source_fingerprint(source: str | Path, member: Optional[str] = None) -> Dict[str, object]:
+    """Impressão digital de um CSV usada para invalidar dados derivados (cache, índices).
+
+    Para um CSV no disco usa tamanho e mtime; para um membro de ZIP usa o CRC32 e o
+    tamanho descompactado registrados no próprio ZIP, que não mudam se o mesmo
+    conteúdo for baixado de novo.
+    """
+    source = Path(source)
+    if member is None:
+        st = source.stat()
+        return {"file": source.name, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    with zipfile.ZipFile(source, "r") as zf:
+        info = zf.getinfo(member)
+    return {"file": member, "size": info.file_size, "crc32": info.CRC}
@@ -0,0 +1,50 @@
+"""Fixtures compartilhadas: arquivos sintéticos no layout da CVM (ver `benchmarks.fixtures`)."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import pytest
+
+from benchmarks.fixtures import make_tree, make_zip
+from benchmarks.server import LocalCVMServer
+from dados_cvm.client import CVMClient
+from dados_cvm.endpoints import UrlBuilder
+from dados_cvm.extract import ZipExtractor
+
+
+@pytest.fixture
+def make_data(tmp_path: Path) -> Callable[..., Path]:
+    """Gera um ZIP sintético em `tmp_path / "data"` e extrai os CSVs ao lado dele; retorna o ZIP."""
+
+    def _make(doc_type: str, ano: int, rows: int, statements: Tuple[str, ...] = ("BPA", "DRE"), seed: int = 0) -> Path:
+        zip_path = make_zip(tmp_path / "data", doc_type, ano, rows, statements=statements, seed=seed)
+        ZipExtractor.extract_all(zip_path, tmp_path / "data")
+        return zip_path
+
+    return _make
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> CVMClient:
+    """Cliente apontando para `tmp_path / "data"`."""
+    with CVMClient(data_dir=tmp_path / "data") as c:
+        yield c
+
+
+@pytest.fixture
+def server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Callable[..., LocalCVMServer]:
+    """Publica ZIPs sintéticos em um `LocalCVMServer` e aponta o `UrlBuilder` para ele."""
+    servers = []
+
+    def _serve(doc_type: str, anos: List[int], rows: int, **kwargs) -> LocalCVMServer:
+        make_tree(tmp_path / "www", anos, [doc_type], rows, **kwargs)
+        if not servers:
+            srv = LocalCVMServer(tmp_path / "www").__enter__()
+            servers.append(srv)
+            monkeypatch.setattr(UrlBuilder, "BASE_URL", srv.base_url)
+        return servers[0]
+
+    yield _serve
+    for srv in servers:
+        srv.__exit__(None, None, None)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from dados_cvm.endpoints import DocType, Scope, StatementType
+
+pytestmark = pytest.mark.filterwarnings("ignore:Parsing dates")
+
+FUNCS = ["sum", "count", "min", "max", "mean"]
+
+
+def _em_memoria(client, anos, latest_only=False):
+    df = pd.concat(
+        [client.load_statement(ano, StatementType.DRE, Scope.CON, DocType.ITR, latest_only=latest_only) for ano in anos],
+        ignore_index=True,
+    )
+    return df
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_aggregate_igual_ao_groupby(make_data, client, processes):
+    for ano in (2023, 2024):
+        make_data("itr", ano, 3_000, statements=("DRE",), seed=ano)
+    result = client.aggregate(
+        StatementType.DRE, Scope.CON, DocType.ITR, [2023, 2024],
+        by=["CD_CVM", "CD_CONTA"], agg={"VL_CONTA": [*FUNCS, "latest"]},
+        chunksize=700, processes=processes,
+    )
+
+    df = _em_memoria(client, [2023, 2024])
+    grouped = df.groupby(["CD_CVM", "CD_CONTA"], observed=True)["VL_CONTA"]
+    expected = grouped.agg(FUNCS).add_prefix("VL_CONTA_")
+    latest = df.sort_values(["DT_REFER", "VERSAO"], kind="stable").groupby(["CD_CVM", "CD_CONTA"], observed=True)
+    expected["VL_CONTA_latest"] = latest["VL_CONTA"].last()
+
+    result = result.sort_index()
+    expected = expected.sort_index()
+    pd.testing.assert_index_equal(result.index.to_flat_index(), expected.index.to_flat_index(), exact=False)
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True), expected.reset_index(drop=True), check_dtype=False, rtol=1e-9
+    )
+
+
+def test_aggregate_latest_only_e_filtros(make_data, client):
+    make_data("itr", 2024, 3_000, statements=("DRE",))
+    filters = {"CD_CONTA": "3.01", "ORDEM_EXERC": "ÚLTIMO"}
+    result = client.aggregate(
+        StatementType.DRE, Scope.CON, DocType.ITR, [2024],
+        by=["CD_CVM"], agg={"VL_CONTA": ["sum"]}, filters=filters, latest_only=True, chunksize=500,
+    )
+
+    df = _em_memoria(client, [2024], latest_only=True)
+    df = df[(df["CD_CONTA"] == "3.01") & (df["ORDEM_EXERC"] == "ÚLTIMO")]
+    expected = df.groupby("CD_CVM", observed=True)["VL_CONTA"].sum()
+    pd.testing.assert_series_equal(
+        result["VL_CONTA_sum"].sort_index(), expected.sort_index(), check_names=False, check_index_type=False
+    )
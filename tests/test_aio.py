@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import zipfile
+
+import pytest
+
+from dados_cvm import aio
+from dados_cvm.download import RateLimiter, ZipDownloader
+from dados_cvm.endpoints import DocType
+
+httpx = pytest.importorskip("httpx")
+from dados_cvm.aio import AsyncCVMClient  # noqa: E402
+
+
+def _zip_bytes(size: int = 0) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("dfp_cia_aberta_2024.csv", "CD_CVM\n1\n")
+        if size:
+            zf.writestr("dados.bin", os.urandom(size))
+    return buf.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def _sem_espera(monkeypatch):
+    monkeypatch.setattr(ZipDownloader, "BACKOFF_SECONDS", 0.0)
+    monkeypatch.setattr(ZipDownloader, "MAX_RETRY_AFTER_SECONDS", 0.0)
+
+
+def _run(tmp_path, handler, **kwargs):
+    calls = []
+
+    def _handler(request):
+        calls.append(request)
+        return handler(request, len(calls))
+
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http:
+            async with AsyncCVMClient(
+                data_dir=tmp_path / "data", http_client=http, rate_limiter=RateLimiter(None), **kwargs
+            ) as client:
+                first = await client.get_zip(2024, DocType.DFP, extrair=False)
+                second = await client.get_zip(2024, DocType.DFP, extrair=False)
+                return first, second
+
+    return calls, main
+
+
+def test_conteudo_que_nao_e_zip_nao_e_repetido(tmp_path):
+    calls, main = _run(
+        tmp_path, lambda req, n: httpx.Response(200, headers={"Content-Type": "text/html"}, content=b"<html>")
+    )
+    with pytest.raises(ValueError):
+        asyncio.run(main())
+    assert len(calls) == 1
+    assert not list((tmp_path / "data").glob("*.part"))
+
+
+def test_zip_corrompido_e_repetido(tmp_path):
+    body = _zip_bytes()
+
+    def handler(req, n):
+        content = b"PK" + b"\0" * 100 if n == 1 else body
+        return httpx.Response(200, headers={"Content-Type": "application/zip"}, content=content)
+
+    calls, main = _run(tmp_path, handler)
+    first, _ = asyncio.run(main())
+    assert first.read_bytes() == body
+    assert len(calls) == 2
+    assert not list((tmp_path / "data").glob("*.part"))
+
+
+def test_download_maior_que_o_buffer(tmp_path, monkeypatch):
+    monkeypatch.setattr(aio, "_WRITE_BUFFER_BYTES", 64 * 1024)
+    body = _zip_bytes(size=3 * ZipDownloader.CHUNK_SIZE)
+    writes = []
+    original = aio._write_chunks
+
+    def _write_chunks(fh, digest, chunks):
+        writes.append(len(chunks))
+        original(fh, digest, chunks)
+
+    monkeypatch.setattr(aio, "_write_chunks", _write_chunks)
+
+    calls, main = _run(
+        tmp_path, lambda req, n: httpx.Response(200, headers={"Content-Type": "application/zip"}, content=body)
+    )
+    first, _ = asyncio.run(main())
+    assert first.read_bytes() == body
+    assert len(writes) > 1
+
+
+def test_retry_after_e_reaproveitamento_sem_cache(tmp_path):
+    body = _zip_bytes()
+
+    def handler(req, n):
+        if n == 1:
+            return httpx.Response(503, headers={"Retry-After": "1"})
+        return httpx.Response(200, headers={"Content-Type": "application/zip"}, content=body)
+
+    calls, main = _run(tmp_path, handler)
+    first, second = asyncio.run(main())
+    assert first == second and first.read_bytes() == body
+    # Uma falha 503, um download; a segunda chamada reaproveita o ZIP em disco
+    assert len(calls) == 2
+
+
+def test_cache_revalidado(tmp_path):
+    body = _zip_bytes()
+
+    def handler(req, n):
+        if req.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, headers={"Content-Type": "application/zip", "ETag": '"v1"'}, content=body)
+
+    calls, main = _run(tmp_path, handler, cache_dir=tmp_path / "cache", cache_max_age=0)
+    first, second = asyncio.run(main())
+    assert first == second and first.read_bytes() == body
+    assert [c.headers.get("If-None-Match") for c in calls] == [None, '"v1"']
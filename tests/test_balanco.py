@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from dados_cvm.balanco import Balanco
+from dados_cvm.endpoints import DocType, Scope, StatementType
+
+_BPA = (2024, StatementType.BPA, Scope.CON, DocType.ITR)
+
+
+@pytest.fixture
+def bpa(make_data, client):
+    make_data("itr", 2024, 5_000, statements=("BPA",))
+    return client.load_statement(*_BPA)
+
+
+def _ansioso(df: pd.DataFrame, cd_cvm: int, conta: str) -> pd.DataFrame:
+    """Mesmos filtros do teste aplicados um a um, como fazia o Balanco original."""
+    df = df[df["CD_CVM"] == cd_cvm]
+    df = df[df["DT_REFER"] >= pd.Timestamp("2024-06-30")]
+    df = df[df["ORDEM_EXERC"] == "ÚLTIMO"]
+    return df[df["CD_CONTA"] == conta]
+
+
+def _filtrar(balanco: Balanco, cd_cvm: int, conta: str) -> Balanco:
+    return (
+        balanco.filtrar_por_cd_cvm(cd_cvm)
+        .filtrar_por_data_referencia("30/06/2024")
+        .filtrar_por_exercicio("ÚLTIMO")
+        .filtrar_por_conta(conta)
+    )
+
+
+def test_filtros_preguicosos_iguais_aos_ansiosos(bpa, client):
+    cd_cvm = int(bpa["CD_CVM"].iloc[len(bpa) // 2])
+    esperado = _ansioso(bpa, cd_cvm, "1.01").reset_index(drop=True)
+    assert len(esperado) > 0
+
+    original = bpa.copy()
+    balancos = {
+        "df": Balanco(bpa),
+        "from_client": Balanco.from_client(client, [2024], *_BPA[1:]),
+        "indice": client.load_balanco(*_BPA),
+    }
+    for nome, balanco in balancos.items():
+        result = _filtrar(balanco, cd_cvm, "1.01").get_dataframe()
+        pd.testing.assert_frame_equal(result.reset_index(drop=True), esperado, check_categorical=False, obj=nome)
+    pd.testing.assert_frame_equal(bpa, original)  # o DataFrame original não é alterado
+
+
+def test_novo_filtro_descarta_o_resultado(bpa):
+    cd_cvm = int(bpa["CD_CVM"].iloc[0])
+    balanco = Balanco(bpa).filtrar_por_cd_cvm(cd_cvm)
+    empresa = balanco.get_dataframe()
+    assert balanco.get_dataframe() is empresa  # resultado guardado
+
+    ultimo = balanco.filtrar_por_exercicio("ÚLTIMO").get_dataframe()
+    pd.testing.assert_frame_equal(ultimo, empresa[empresa["ORDEM_EXERC"] == "ÚLTIMO"])
+    assert Balanco(bpa).get_dataframe() is bpa  # sem filtros, sem cópia
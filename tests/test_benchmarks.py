@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from benchmarks.run import measure
+from dados_cvm.endpoints import DocType, Scope, StatementType
+
+
+def test_fixture_servida_pelo_servidor_local(server, client):
+    server("dfp", [2024], 1_000, statements=("BPA",))
+    client.get_zip(2024, DocType.DFP, streaming=True)
+
+    extraido = client.load_statement(2024, StatementType.BPA, Scope.CON, DocType.DFP)
+    do_zip = client.load_statement(2024, StatementType.BPA, Scope.CON, DocType.DFP, from_zip=True)
+    assert len(extraido) == 1_000
+    assert extraido["VERSAO"].nunique() > 1  # reapresentações
+    pd.testing.assert_frame_equal(extraido, do_zip)
+
+
+def test_measure_inclui_pool_do_arrow():
+    pa = pytest.importorskip("pyarrow")
+    result = measure(lambda: pa.array(range(1_000_000)), repeat=1)
+
+    assert set(result) == {"seconds", "mean_seconds", "peak_mb", "arrow_peak_mb"}
+    # ~7.6 MiB de int64 no pool nativo, fora do alcance do tracemalloc
+    assert result["arrow_peak_mb"] > 5
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+import requests
+
+from dados_cvm.client import CVMClient
+from dados_cvm.endpoints import DocType
+
+_WWW = "www/dados/CIA_ABERTA/DOC/DFP/DADOS"
+
+
+@pytest.fixture
+def requisicoes(monkeypatch):
+    """Registra (método, If-None-Match, status) de cada requisição HTTP feita pelo cliente."""
+    calls = []
+    send = requests.Session.send
+
+    def _send(self, request, **kwargs):
+        response = send(self, request, **kwargs)
+        calls.append((request.method, request.headers.get("If-None-Match"), response.status_code))
+        return response
+
+    monkeypatch.setattr(requests.Session, "send", _send)
+    return calls
+
+
+def _client(tmp_path, **kwargs) -> CVMClient:
+    return CVMClient(data_dir=tmp_path / "data", cache_dir=tmp_path / "cache", **kwargs)
+
+
+def test_acerto_no_cache_nao_acessa_a_rede(tmp_path, server, requisicoes):
+    server("dfp", [2024], 1_000, statements=("BPA",))
+    remote = (tmp_path / _WWW / "dfp_cia_aberta_2024.zip").read_bytes()
+
+    with _client(tmp_path) as client:
+        first = client.get_zip(2024, DocType.DFP, extrair=False, streaming=True)
+        antes = len(requisicoes)
+        assert antes > 0
+        second = client.get_zip(2024, DocType.DFP, extrair=False)
+
+    assert len(requisicoes) == antes
+    assert first.read_bytes() == second.getvalue() == remote
+
+
+def test_revalidacao_com_304(tmp_path, server, requisicoes):
+    server("dfp", [2024], 1_000, statements=("BPA",))
+
+    with _client(tmp_path, cache_max_age=0) as client:
+        first = client.get_zip(2024, DocType.DFP, extrair=False, streaming=True)
+        entry = client.cache.lookup(DocType.DFP, 2024)
+        fetched_at = entry.fetched_at
+        requisicoes.clear()
+
+        second = client.get_zip(2024, DocType.DFP, extrair=False, streaming=True)
+
+    # Uma requisição condicional com o ETag gravado, respondida com 304
+    assert requisicoes == [("GET", entry.etag, 304)]
+    assert second == first
+    assert client.cache.lookup(DocType.DFP, 2024).fetched_at > fetched_at
+
+
+def test_remocao_lru_por_tamanho(tmp_path, server):
+    server("dfp", [2023, 2024, 2025], 1_000, statements=("BPA",))
+    size = {ano: (tmp_path / _WWW / f"dfp_cia_aberta_{ano}.zip").stat().st_size for ano in (2023, 2024, 2025)}
+
+    # Cabem 2023 e 2025, mas não os três
+    with _client(tmp_path, cache_max_bytes=size[2023] + size[2025] + size[2024] // 2) as client:
+        client.get_zip(2023, DocType.DFP, extrair=False, streaming=True)
+        client.get_zip(2024, DocType.DFP, extrair=False, streaming=True)
+        client.get_zip(2023, DocType.DFP, extrair=False, streaming=True)  # 2024 passa a ser o menos usado
+        client.get_zip(2025, DocType.DFP, extrair=False, streaming=True)
+        cache = client.cache
+
+    assert cache.lookup(DocType.DFP, 2024) is None
+    assert cache.lookup(DocType.DFP, 2023) is not None
+    assert cache.lookup(DocType.DFP, 2025) is not None
+    assert cache.total_bytes <= cache.max_bytes
+    assert len(list((tmp_path / "cache").rglob("*.zip"))) == 2
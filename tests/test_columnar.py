@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dados_cvm.client import CVMClient
+from dados_cvm.endpoints import DocType, Scope, StatementType
+from dados_cvm.read import CSVReader
+
+pa = pytest.importorskip("pyarrow")
+
+_BPA = (2024, StatementType.BPA, Scope.CON, DocType.DFP)
+
+
+@pytest.fixture
+def columnar_client(tmp_path):
+    def _client(fmt: str) -> CVMClient:
+        return CVMClient(data_dir=tmp_path / "data", columnar_dir=tmp_path / fmt, columnar_format=fmt)
+
+    return _client
+
+
+@pytest.fixture
+def leituras_csv(monkeypatch):
+    """Conta as leituras de CSV (cada uma é uma conversão para o cache colunar)."""
+    calls = []
+    read_csv = CSVReader.read_csv
+
+    def _read_csv(*args, **kwargs):
+        calls.append(args[0])
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(CSVReader, "read_csv", _read_csv)
+    return calls
+
+
+def test_particao_invalidada_quando_o_csv_muda(make_data, columnar_client, leituras_csv, tmp_path):
+    make_data("dfp", 2024, 2_000, statements=("BPA",))
+    csv = tmp_path / "data" / "dfp_cia_aberta_BPA_con_2024.csv"
+    with columnar_client("parquet") as client:
+        first = client.load_statement(*_BPA)
+        client.load_statement(*_BPA)
+        assert len(leituras_csv) == 1  # a segunda leitura vem do Parquet
+
+        # Mesmo conteúdo, outra data de modificação: converte de novo
+        st = csv.stat()
+        os.utime(csv, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        pd.testing.assert_frame_equal(client.load_statement(*_BPA), first)
+        assert len(leituras_csv) == 2
+
+        # Outro tamanho (uma linha a menos): converte de novo e reflete a mudança
+        linhas = csv.read_bytes().splitlines(keepends=True)
+        csv.write_bytes(b"".join(linhas[:-1]))
+        assert len(client.load_statement(*_BPA)) == len(first) - 1
+        assert len(leituras_csv) == 3
+
+
+def test_projecao_de_colunas(make_data, columnar_client, client):
+    make_data("dfp", 2024, 2_000, statements=("BPA",))
+    cols = ["CD_CVM", "CD_CONTA", "VL_CONTA"]
+    esperado = client.load_statement(*_BPA)[cols]
+    for fmt in ("parquet", "feather", "arrow"):
+        with columnar_client(fmt) as c:
+            c.load_statement(*_BPA)
+            result = c.load_statement(*_BPA, cols=cols)
+            assert list(result.columns) == cols
+            pd.testing.assert_frame_equal(result, esperado, check_categorical=False)
+
+
+def test_filtros_empurrados_para_o_parquet(make_data, columnar_client, client, monkeypatch):
+    make_data("dfp", 2024, 5_000, statements=("BPA",))
+    df = client.load_statement(*_BPA)
+    cd_cvm = int(df["CD_CVM"].iloc[0])
+    esperado = df[(df["CD_CVM"] == cd_cvm).to_numpy()].reset_index(drop=True)
+
+    lidas = []
+    read_parquet = pd.read_parquet
+
+    def _read_parquet(*args, **kwargs):
+        result = read_parquet(*args, **kwargs)
+        lidas.append((kwargs.get("filters"), len(result)))
+        return result
+
+    monkeypatch.setattr(pd, "read_parquet", _read_parquet)
+    with columnar_client("parquet") as c:
+        c.load_statement(*_BPA)
+        result = c.load_statement(*_BPA, filters={"CD_CVM": cd_cvm})
+
+    # O leitor Parquet já devolve só as linhas da companhia
+    assert lidas[-1] == ([("CD_CVM", "==", cd_cvm)], len(esperado))
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), esperado, check_categorical=False)
+
+
+def test_load_balanco_arrow_retorna_views_do_arquivo(make_data, columnar_client):
+    make_data("dfp", 2024, 20_000, statements=("BPA",))
+    with columnar_client("arrow") as client:
+        client.load_balanco(*_BPA)  # grava a partição e o índice
+        antes = pa.total_allocated_bytes()
+        balanco = client.load_balanco(*_BPA)
+        # Os buffers vêm do arquivo mapeado, não do pool de memória do Arrow
+        assert pa.total_allocated_bytes() - antes < 2**16
+
+    df = balanco.get_dataframe()
+    valores = df["VL_CONTA"].to_numpy()
+    assert not valores.flags.writeable  # view somente leitura, sem cópia
+
+    cd_cvm = int(df["CD_CVM"].iloc[len(df) // 2])
+    empresa = balanco.filtrar_por_cd_cvm(cd_cvm).get_dataframe()
+    assert len(empresa) and (empresa["CD_CVM"] == cd_cvm).all()
+    assert np.shares_memory(empresa["VL_CONTA"].to_numpy(), valores)
+
+
+def test_formatos_arrow_e_parquet_iguais(make_data, columnar_client, client):
+    make_data("dfp", 2024, 5_000, statements=("BPA",))
+    esperado = client.load_balanco(*_BPA).get_dataframe()
+    for fmt in ("arrow", "parquet"):
+        with columnar_client(fmt) as c:
+            c.load_balanco(*_BPA)
+            pd.testing.assert_frame_equal(c.load_balanco(*_BPA).get_dataframe(), esperado)
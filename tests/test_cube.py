@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dados_cvm.cube import StatementCube
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_cubo_descarta_linhas_sem_chave(sparse):
+    df = pd.DataFrame({
+        "CD_CVM": pd.array([1, 1, None, 2, 2], dtype="Int32"),
+        "DT_REFER": pd.to_datetime(["2024-12-31", "2024-12-31", "2024-12-31", None, "2024-12-31"]),
+        "CD_CONTA": ["1", "1.01", "1", "1", None],
+        "VERSAO": [1, 1, 1, 1, 1],
+        "VL_CONTA": [10.0, 4.0, 99.0, 99.0, 99.0],
+    })
+    cube = StatementCube.from_frame(df, scale=False, sparse=sparse)
+
+    assert cube.shape == (1, 1, 2)
+    assert list(cube.companies) == [1]
+    assert list(cube.contas) == ["1", "1.01"]
+    np.testing.assert_array_equal(cube.values, [[[10.0, 4.0]]])
+
+
+def test_cubo_versao_em_branco_perde_para_versao_informada():
+    df = pd.DataFrame({
+        "CD_CVM": pd.array([1, 1], dtype="Int32"),
+        "DT_REFER": pd.to_datetime(["2024-12-31", "2024-12-31"]),
+        "CD_CONTA": ["1", "1"],
+        "VERSAO": pd.array([2, None], dtype="Int16"),
+        "VL_CONTA": [20.0, 10.0],
+    })
+    cube = StatementCube.from_frame(df, scale=False)
+
+    np.testing.assert_array_equal(cube.values, [[[20.0]]])
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+import zipfile
+
+import pandas as pd
+import pytest
+
+from dados_cvm.client import CVMClient
+from dados_cvm.endpoints import DocType, FCATable, UrlBuilder
+
+_VALOR_MOBILIARIO = (
+    "CNPJ_Companhia;Data_Referencia;Versao;ID_Documento;Nome_Empresarial;Codigo_CVM;"
+    "Valor_Mobiliario;Codigo_Negociacao;Mercado;Segmento\n"
+    "00.000.000/0001-00;2024-01-01;1;100;CIA A;1000;Ações Ordinárias;AAAA3;Bolsa;Novo Mercado\n"
+    "00.000.000/0001-00;2024-01-01;1;100;CIA A;1000;Ações Preferenciais;AAAA4;Bolsa;Novo Mercado\n"
+    "11.111.111/0001-11;2024-01-01;2;101;CIA B;2000;Ações Ordinárias;BBBB3;Bolsa;\n"
+)
+_INDICE = (
+    "CNPJ_CIA;DT_REFER;VERSAO;DENOM_CIA;CD_CVM;CATEG_DOC;ID_DOC;DT_RECEB;LINK_DOC\n"
+    "00.000.000/0001-00;2024-01-01;1;CIA A;1000;FCA;100;2024-05-31;http://x/100\n"
+    "11.111.111/0001-11;2024-01-01;2;CIA B;2000;FCA;101;2024-06-10;http://x/101\n"
+)
+_IPE = (
+    "CNPJ_Companhia;Nome_Companhia;Codigo_CVM;Data_Referencia;Categoria;Tipo;Especie;Assunto;"
+    "Data_Entrega;Tipo_Apresentacao;Protocolo_Entrega;Versao;Link_Download\n"
+) + "".join(
+    f"00.000.000/0001-00;CIA A;{1000 + i % 3};2024-03-{1 + i % 28:02d};Fato Relevante;;;Assunto {i};"
+    f"2024-04-{1 + i % 28:02d};AP - Apresentação;{i};1;http://x/{i}\n"
+    for i in range(50)
+)
+_CAD = (
+    "CNPJ_CIA;DENOM_SOCIAL;DT_REG;CD_CVM;SIT;SETOR_ATIV;CEP;TEL\n"
+    "00.000.000/0001-00;CIA A;2000-01-15;1000;ATIVO;Energia Elétrica;01310100;0123456\n"
+    "11.111.111/0001-11;CIA B;2010-07-01;2000;CANCELADA;Bancos;04538132;9876543\n"
+    "22.222.222/0001-22;CIA C;2015-03-20;3000;ATIVO;Bancos;;\n"
+)
+
+
+def _write_zip(path, members):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content.encode("latin1"))
+    return path
+
+
+@pytest.fixture
+def fca_zip(tmp_path):
+    return _write_zip(
+        tmp_path / "data" / UrlBuilder.zip_filename(DocType.FCA, 2024),
+        {
+            UrlBuilder.csv_filename(DocType.FCA, 2024): _INDICE,
+            UrlBuilder.csv_filename(DocType.FCA, 2024, FCATable.VALOR_MOBILIARIO): _VALOR_MOBILIARIO,
+        },
+    )
+
+
+def test_load_table_fca_usa_o_esquema(fca_zip, client):
+    df = client.load_table(2024, DocType.FCA, FCATable.VALOR_MOBILIARIO, from_zip=True)
+
+    assert df["Codigo_Negociacao"].tolist() == ["AAAA3", "AAAA4", "BBBB3"]
+    assert df["Codigo_CVM"].dtype == "Int32" and df["Versao"].dtype == "Int16"
+    assert df["Codigo_Negociacao"].dtype == "category"
+    assert pd.api.types.is_datetime64_any_dtype(df["Data_Referencia"])
+    assert df["Segmento"].isna().tolist() == [False, False, True]
+
+    indice = client.load_table(2024, DocType.FCA, from_zip=True)
+    assert indice["ID_DOC"].tolist() == [100, 101]
+    assert pd.api.types.is_datetime64_any_dtype(indice["DT_RECEB"])
+
+
+def test_load_table_filtros_e_colunas(fca_zip, client, tmp_path):
+    esperado = client.load_table(2024, DocType.FCA, FCATable.VALOR_MOBILIARIO, from_zip=True)
+    esperado = esperado.loc[esperado["Codigo_CVM"] == 1000, ["Codigo_Negociacao"]]
+
+    result = client.load_table(
+        2024, DocType.FCA, FCATable.VALOR_MOBILIARIO, from_zip=True,
+        cols=["Codigo_Negociacao"], filters={"Codigo_CVM": 1000},
+    )
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), esperado.reset_index(drop=True))
+
+    pytest.importorskip("pyarrow")
+    with CVMClient(data_dir=tmp_path / "data", columnar_dir=tmp_path / "colunar") as colunar:
+        for _ in range(2):  # grava a partição e depois lê dela
+            df = colunar.load_table(
+                2024, DocType.FCA, FCATable.VALOR_MOBILIARIO, from_zip=True,
+                cols=["Codigo_Negociacao"], filters={"Codigo_CVM": 1000},
+            )
+            assert df["Codigo_Negociacao"].astype(str).tolist() == ["AAAA3", "AAAA4"]
+
+
+def test_load_table_fre_csv_extraido(tmp_path, client):
+    # Tabelas do FRE são informadas como texto e lidas do CSV extraído
+    csv = tmp_path / "data" / UrlBuilder.csv_filename(DocType.FRE, 2024, "valor_mobiliario")
+    csv.write_bytes(_VALOR_MOBILIARIO.encode("latin1"))
+
+    df = client.load_table(2024, DocType.FRE, "valor_mobiliario")
+    assert len(df) == 3 and df["Codigo_CVM"].dtype == "Int32"
+
+    with pytest.raises(FileNotFoundError):
+        client.load_table(2024, DocType.FRE, "capital_social")
+
+
+def test_load_table_ipe_em_chunks(tmp_path, client):
+    _write_zip(tmp_path / "data" / UrlBuilder.zip_filename(DocType.IPE, 2024), {"ipe_cia_aberta_2024.csv": _IPE})
+
+    df = client.load_table(2024, DocType.IPE, from_zip=True)
+    assert len(df) == 50
+    assert df["Codigo_CVM"].dtype == "Int32"
+    assert pd.api.types.is_datetime64_any_dtype(df["Data_Entrega"])
+
+    chunks = list(client.load_table(2024, DocType.IPE, from_zip=True, chunks=True, chunksize=16))
+    assert len(chunks) == 4
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df, check_categorical=False)
+
+
+@pytest.fixture
+def cad_remoto(server, tmp_path, monkeypatch):
+    """Cadastro publicado no servidor local (o servidor é iniciado com um ZIP qualquer)."""
+    srv = server("dfp", [2024], 10, statements=("BPA",))
+    path = tmp_path / "www" / "dados" / "CIA_ABERTA" / "CAD" / "DADOS" / "cad_cia_aberta.csv"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(_CAD.encode("latin1"))
+    os.utime(path, (1_700_000_000, 1_700_000_000))
+    cad_url = srv.base_url.split("/DOC/")[0] + "/CAD/DADOS/cad_cia_aberta.csv"
+    monkeypatch.setattr(UrlBuilder, "CAD_URL", cad_url)
+    return path
+
+
+def test_get_cadastro_reaproveita_e_revalida(cad_remoto, client):
+    path = client.get_cadastro()
+    assert path.read_bytes() == cad_remoto.read_bytes()
+    # O arquivo local recebe o Last-Modified do servidor
+    assert int(path.stat().st_mtime) == 1_700_000_000
+
+    cad_remoto.write_bytes(_CAD.replace("CIA C", "CIA D").encode("latin1"))
+    assert client.get_cadastro().read_bytes() == _CAD.encode("latin1")  # sem refresh, reaproveita
+    assert b"CIA D" in client.get_cadastro(refresh=True).read_bytes()
+
+
+def test_load_cadastro(cad_remoto, client):
+    df = client.load_cadastro(cols=["CD_CVM", "SETOR_ATIV", "CEP"], filters={"SIT": "ATIVO"})
+
+    assert list(df.columns) == ["CD_CVM", "SETOR_ATIV", "CEP"]
+    assert df["CD_CVM"].tolist() == [1000, 3000]
+    assert df["CEP"].tolist()[0] == "01310100"  # texto: mantém o zero à esquerda
+
+    completo = client.load_cadastro()
+    assert pd.api.types.is_datetime64_any_dtype(completo["DT_REG"])
+    assert completo["TEL"].dtype == "string"
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from dados_cvm.client import CVMClient
+from dados_cvm.dedup import LatestVersionFilter
+from dados_cvm.endpoints import DocType, Scope, StatementType
+from dados_cvm.utils import concat_frames
+
+_HEADER = (
+    "CNPJ_CIA;DT_REFER;VERSAO;DENOM_CIA;CD_CVM;GRUPO_DFP;MOEDA;ESCALA_MOEDA;"
+    "ORDEM_EXERC;DT_FIM_EXERC;CD_CONTA;DS_CONTA;VL_CONTA;ST_CONTA_FIXA"
+)
+
+
+def _bpa(n_cias: int = 40, contas: int = 30) -> str:
+    """BPA sintético; uma em cada sete companhias tem uma reapresentação (VERSAO 2)."""
+    linhas = [_HEADER]
+    for cia in range(n_cias):
+        versoes = (1, 2) if cia % 7 == 0 else (1,)
+        for versao in versoes:
+            for ordem in ("ÚLTIMO", "PENÚLTIMO"):
+                for c in range(contas):
+                    linhas.append(
+                        f"{cia:08d}/0001-00;2024-12-31;{versao};CIA {cia};{1000 + cia};"
+                        f"DF Consolidado - Balanço Patrimonial Ativo;REAL;MIL;{ordem};2024-12-31;"
+                        f"1.{c:02d};Conta {c};{cia * 100 + c + versao * 0.5};S"
+                    )
+    return "\n".join(linhas) + "\n"
+
+
+@pytest.fixture
+def client(tmp_path):
+    client = CVMClient(data_dir=tmp_path)
+    (tmp_path / "dfp_cia_aberta_BPA_con_2024.csv").write_bytes(_bpa().encode("latin1"))
+    return client
+
+
+def _max_versao(df: pd.DataFrame) -> pd.DataFrame:
+    """Referência em pandas: linhas com a maior VERSAO da chave."""
+    keys = list(LatestVersionFilter.KEY_COLUMNS)
+    maior = df.groupby(keys, observed=True)["VERSAO"].transform("max")
+    return df[df["VERSAO"] == maior]
+
+
+@pytest.mark.parametrize("chunks", [False, True])
+def test_latest_only_igual_ao_filtro_pandas(client, chunks):
+    df = client.load_statement(2024, StatementType.BPA, Scope.CON, DocType.DFP)
+    assert df["VERSAO"].nunique() > 1
+
+    result = client.load_statement(
+        2024, StatementType.BPA, Scope.CON, DocType.DFP, latest_only=True, chunks=chunks, chunksize=500
+    )
+    if chunks:
+        result = concat_frames(list(result))
+    expected = _max_versao(df)
+
+    order = list(LatestVersionFilter.KEY_COLUMNS)
+    pd.testing.assert_frame_equal(
+        result.sort_values(order, ignore_index=True),
+        expected.sort_values(order, ignore_index=True),
+        check_categorical=False,
+    )
+
+
+def test_stream_igual_ao_apply(client):
+    df = client.load_statement(2024, StatementType.BPA, Scope.CON, DocType.DFP)
+    chunks = [df.iloc[i:i + 777] for i in range(0, len(df), 777)]
+    streamed = LatestVersionFilter().stream(chunks)
+    pd.testing.assert_frame_equal(streamed, LatestVersionFilter.apply(df).reset_index(drop=True))
+
+
+def test_chave_em_branco_nao_quebra_a_codificacao():
+    df = pd.DataFrame({
+        "CD_CVM": pd.array([1000, 1000, None], dtype="Int32"),
+        "DT_REFER": ["2024-12-31"] * 3,
+        "ORDEM_EXERC": ["ÚLTIMO"] * 3,
+        "CD_CONTA": ["1"] * 3,
+        "VERSAO": pd.array([1, None, 1], dtype="Int16"),
+        "VL_CONTA": [1.0, 2.0, 3.0],
+    })
+    result = LatestVersionFilter.apply(df)
+    assert sorted(result["VL_CONTA"]) == [1.0, 3.0]
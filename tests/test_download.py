@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+import requests
+
+from dados_cvm.client import CVMClient
+from dados_cvm.download import RateLimiter, ZipDownloader
+from dados_cvm.endpoints import DocType, UrlBuilder
+from dados_cvm.metrics import Instrumentation
+
+
+def test_limitador_por_cliente(tmp_path):
+    a, b = CVMClient(data_dir=tmp_path / "a"), CVMClient(data_dir=tmp_path / "b")
+    assert a.rate_limiter is not b.rate_limiter
+    assert a.rate_limiter is not ZipDownloader.RATE_LIMITER
+    shared = RateLimiter(rate=1.0)
+    assert CVMClient(data_dir=tmp_path / "c", rate_limiter=shared).rate_limiter is shared
+
+
+def test_retries_zero_e_rejeitado():
+    calls = []
+    with pytest.raises(ValueError, match="retries"):
+        ZipDownloader._with_retries(lambda: calls.append(1), retries=0)
+    assert not calls
+
+
+def test_limitador_separa_hosts():
+    limiter = RateLimiter(rate=1.0, burst=1)
+    assert limiter.reserve("http://a.example/x") == 0
+    assert limiter.reserve("http://b.example/x") == 0
+    assert limiter.reserve("http://a.example/y") > 0.5
+
+
+def test_download_em_partes_e_uma_reserva(tmp_path, server):
+    server("dfp", [2024], 20_000, statements=("BPA",))
+    limiter = RateLimiter(rate=0.5, burst=1)
+    client = CVMClient(data_dir=tmp_path / "data", download_parts=4, rate_limiter=limiter)
+
+    start = time.perf_counter()
+    path = client.get_zip(2024, DocType.DFP, extrair=False, streaming=True)
+    # Com uma reserva por faixa, 4 faixas a 0,5 req/s levariam mais de 6 s
+    assert time.perf_counter() - start < 2.0
+    assert path.read_bytes() == (tmp_path / "www/dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_2024.zip").read_bytes()
+
+
+def test_get_zips_falha_por_item(tmp_path, server, client):
+    server("dfp", [2024], 1_000, statements=("BPA",))
+
+    # `anos` como gerador: percorrido uma vez por tipo de documento
+    resultados = client.get_zips((ano for ano in (2023, 2024, 2025)), [DocType.DFP, DocType.ITR])
+
+    assert [(r.doc_type, r.ano) for r in resultados] == [
+        (DocType.DFP, 2023), (DocType.DFP, 2024), (DocType.DFP, 2025),
+        (DocType.ITR, 2023), (DocType.ITR, 2024), (DocType.ITR, 2025),
+    ]
+    # Os anos ausentes no servidor (404) não interrompem o lote
+    assert [r.ok for r in resultados] == [False, True, False, False, False, False]
+    for r in resultados:
+        if not r.ok:
+            assert isinstance(r.error, requests.HTTPError)
+            assert r.error.response.status_code == 404
+    assert (tmp_path / "data" / "dfp_cia_aberta_BPA_con_2024.csv").exists()
+
+
+def test_retoma_part_truncado(tmp_path, server):
+    server("dfp", [2024], 5_000, statements=("BPA",))
+    remote = tmp_path / "www/dados/CIA_ABERTA/DOC/DFP/DADOS/dfp_cia_aberta_2024.zip"
+    content = remote.read_bytes()
+    etag = requests.head(UrlBuilder.build_url(DocType.DFP, 2024)).headers["ETag"]
+
+    # Download interrompido: metade do arquivo e o validador da versão remota
+    dest = tmp_path / "data" / remote.name
+    part = ZipDownloader.part_path(dest)
+    part.parent.mkdir(parents=True)
+    part.write_bytes(content[: len(content) // 2])
+    part.with_name(f"{part.name}.meta").write_text(etag, encoding="utf-8")
+
+    medidas = []
+    with CVMClient(data_dir=tmp_path / "data", instrumentation=Instrumentation([medidas.append])) as client:
+        path = client.get_zip(2024, DocType.DFP, extrair=False, streaming=True)
+
+    assert path.read_bytes() == content
+    assert not part.exists()
+    # Só a segunda metade foi transferida
+    download = [m for m in medidas if m.stage == "download"]
+    assert sum(m.bytes for m in download) == len(content) - len(content) // 2
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from dados_cvm.extract import ZipExtractor
+
+
+def test_falha_no_meio_preserva_csv_anterior(make_data, tmp_path, monkeypatch):
+    zip_path = make_data("dfp", 2024, 2_000, statements=("BPA",))
+    csv = tmp_path / "data" / "dfp_cia_aberta_BPA_con_2024.csv"
+    original = csv.read_bytes()
+    csv.write_bytes(b"versao anterior\n")
+
+    def _falha(src, dst, length=0):
+        dst.write(src.read(100))
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(shutil, "copyfileobj", _falha)
+    with pytest.raises(OSError):
+        ZipExtractor.extract_all(zip_path, tmp_path / "data", members=[csv.name])
+
+    assert csv.read_bytes() == b"versao anterior\n"
+    assert not list((tmp_path / "data").glob("*.tmp"))
+
+    monkeypatch.undo()
+    assert ZipExtractor.extract_all(zip_path, tmp_path / "data", members=[csv.name]) == [csv.name]
+    assert csv.read_bytes() == original
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dados_cvm.endpoints import DocType, Scope, StatementType
+from dados_cvm.index import StatementIndex
+
+_BPA = (2024, StatementType.BPA, Scope.CON, DocType.DFP)
+
+
+@pytest.fixture
+def bpa(make_data, client):
+    make_data("dfp", 2024, 5_000, statements=("BPA",))
+    df = client.load_statement(*_BPA)
+    # Fora da ordem de CD_CVM, para que o índice precise reordenar
+    return df.sample(frac=1, random_state=0).reset_index(drop=True)
+
+
+def _linhas(index: StatementIndex, col: str, value) -> np.ndarray:
+    rows = index.rows(col, value)
+    return np.arange(rows.start, rows.stop) if isinstance(rows, slice) else rows
+
+
+def test_npz_ida_e_volta_igual_a_varredura(bpa, tmp_path):
+    fingerprint = {"path": "bpa.csv", "size": 1, "mtime_ns": 2}
+    ordenado, index = StatementIndex.build(bpa, fingerprint)
+    assert index.order is not None
+    pd.testing.assert_frame_equal(index.apply_order(bpa), ordenado)
+
+    loaded = StatementIndex.load(index.save(tmp_path / "bpa.idx.npz"))
+    assert loaded is not None
+    assert loaded.n_rows == len(bpa) and loaded.fingerprint == fingerprint
+    np.testing.assert_array_equal(loaded.order, index.order)
+    assert loaded.indexed_columns() == ("CD_CVM", "CNPJ_CIA", "CD_CONTA")
+
+    # Cada chave resolvida pelo índice carregado é igual à varredura completa
+    for col in ("CD_CVM", "CNPJ_CIA"):
+        for value in ordenado[col].unique():
+            rows = loaded.rows(col, value)
+            assert isinstance(rows, slice)  # companhia contígua
+            np.testing.assert_array_equal(_linhas(loaded, col, value), np.flatnonzero(ordenado[col] == value))
+    for conta in ordenado["CD_CONTA"].unique():
+        np.testing.assert_array_equal(
+            loaded.rows("CD_CONTA", conta), np.flatnonzero((ordenado["CD_CONTA"] == conta).to_numpy())
+        )
+
+    assert len(_linhas(loaded, "CD_CVM", -1)) == 0
+    assert len(loaded.rows("CD_CONTA", "9.99")) == 0
+
+
+def test_arquivo_invalido_e_ignorado(tmp_path):
+    path = tmp_path / "bpa.idx.npz"
+    assert StatementIndex.load(path) is None
+    path.write_bytes(b"corrompido")
+    assert StatementIndex.load(path) is None
+
+
+def test_load_balanco_reaproveita_o_indice(make_data, client, tmp_path, monkeypatch):
+    make_data("dfp", 2024, 5_000, statements=("BPA",))
+    builds = []
+    build = StatementIndex.build.__func__
+
+    def _build(cls, *args, **kwargs):
+        builds.append(1)
+        return build(cls, *args, **kwargs)
+
+    monkeypatch.setattr(StatementIndex, "build", classmethod(_build))
+
+    first = client.load_balanco(*_BPA).get_dataframe()
+    second = client.load_balanco(*_BPA).get_dataframe()
+    assert len(builds) == 1  # a segunda leitura usa o .npz gravado
+    pd.testing.assert_frame_equal(first, second)
+    assert (tmp_path / "data" / "dfp_cia_aberta_BPA_con_2024.idx.npz").exists()
+
+    # Origem alterada: o índice é descartado e refeito
+    csv = tmp_path / "data" / "dfp_cia_aberta_BPA_con_2024.csv"
+    st = csv.stat()
+    os.utime(csv, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    client.load_balanco(*_BPA)
+    assert len(builds) == 2
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+
+import pandas as pd
+import pytest
+
+from dados_cvm.client import CVMClient
+from dados_cvm.endpoints import DocType, Scope
+from dados_cvm.indicators import IndicatorEngine
+
+pytestmark = pytest.mark.filterwarnings("ignore:Parsing dates")
+
+
+@pytest.fixture
+def contador(monkeypatch):
+    """Conta leituras de CSV e cálculos de indicadores."""
+    calls = {"load": 0, "compute": 0}
+    load, compute = CVMClient.load_statement, IndicatorEngine.compute
+
+    def _load(self, *args, **kwargs):
+        calls["load"] += 1
+        return load(self, *args, **kwargs)
+
+    def _compute(self, *args, **kwargs):
+        calls["compute"] += 1
+        return compute(self, *args, **kwargs)
+
+    monkeypatch.setattr(CVMClient, "load_statement", _load)
+    monkeypatch.setattr(IndicatorEngine, "compute", _compute)
+    return calls
+
+
+def test_cache_hit_igual_ao_calculo(make_data, client, contador):
+    make_data("itr", 2024, 5_000, statements=("BPA", "BPP", "DRE"))
+    first = client.load_indicators([2024], Scope.CON, DocType.ITR)
+    assert contador == {"load": 3, "compute": 1}
+
+    hit = client.load_indicators([2024], Scope.CON, DocType.ITR)
+    assert contador == {"load": 3, "compute": 1}  # nenhum CSV lido
+    assert hit.equals(first)
+    assert hit.dtypes.equals(first.dtypes)
+
+
+def test_cache_origem_alterada(make_data, client, contador, tmp_path):
+    make_data("itr", 2024, 5_000, statements=("BPA", "BPP", "DRE"))
+    first = client.load_indicators([2024], Scope.CON, DocType.ITR)
+
+    # Mesmo conteúdo, origem diferente: lê de novo, mas não recalcula
+    csv = tmp_path / "data" / "itr_cia_aberta_BPA_con_2024.csv"
+    st = csv.stat()
+    os.utime(csv, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    same = client.load_indicators([2024], Scope.CON, DocType.ITR)
+    assert contador == {"load": 6, "compute": 1}
+    assert same.equals(first)
+
+    # Reapresentação de uma conta usada: recalcula
+    df = pd.read_csv(csv, sep=";", encoding="latin1", dtype=str)
+    row = df[(df.CD_CONTA == "1.01") & (df.ORDEM_EXERC == "ÚLTIMO")].iloc[[0]].copy()
+    row["VERSAO"] = "99"
+    row["VL_CONTA"] = "123456.00"
+    pd.concat([df, row]).to_csv(csv, sep=";", encoding="latin1", index=False)
+    changed = client.load_indicators([2024], Scope.CON, DocType.ITR)
+    assert contador == {"load": 9, "compute": 2}
+    assert not changed.equals(first)
+    assert changed.equals(client.load_indicators([2024], Scope.CON, DocType.ITR, refresh=True))
+
+
+def _itr_csv(path, statement: str, linhas) -> None:
+    """CSV de ITR com as colunas usadas; cada linha é (CD_CVM, ESCALA, VERSAO, ORDEM, DT_INI, CD_CONTA, VL)."""
+    df = pd.DataFrame(
+        linhas, columns=["CD_CVM", "ESCALA_MOEDA", "VERSAO", "ORDEM_EXERC", "DT_INI_EXERC", "CD_CONTA", "VL_CONTA"]
+    )
+    df.insert(0, "CNPJ_CIA", "00.000.000/0001-00")
+    df.insert(1, "DT_REFER", "2024-06-30")
+    df["DENOM_CIA"] = "COMPANHIA TESTE"
+    df["MOEDA"] = "REAL"
+    df["DT_FIM_EXERC"] = "2024-06-30"
+    df["DS_CONTA"] = "Conta"
+    df["ST_CONTA_FIXA"] = "S"
+    if statement != "DRE":
+        df = df.drop(columns="DT_INI_EXERC")
+    df.to_csv(path / f"itr_cia_aberta_{statement}_con_2024.csv", sep=";", index=False, encoding="latin1")
+
+
+def test_indicadores_calculados_a_mao(client, tmp_path):
+    data = tmp_path / "data"
+    data.mkdir(parents=True, exist_ok=True)
+    # 1000: BPA e DRE em MIL, BPP em UNIDADE; 1.01 reapresentada na VERSAO 2
+    # 2000: tudo em UNIDADE
+    _itr_csv(data, "BPA", [
+        (1000, "MIL", 1, "ÚLTIMO", None, "1", 500),
+        (1000, "MIL", 1, "ÚLTIMO", None, "1.01", 200),
+        (1000, "MIL", 2, "ÚLTIMO", None, "1.01", 300),
+        (1000, "MIL", 1, "PENÚLTIMO", None, "1.01", 9999),
+        (2000, "UNIDADE", 1, "ÚLTIMO", None, "1", 800_000),
+        (2000, "UNIDADE", 1, "ÚLTIMO", None, "1.01", 400_000),
+    ])
+    _itr_csv(data, "BPP", [
+        (1000, "UNIDADE", 1, "ÚLTIMO", None, "2.01", 150_000),
+        (1000, "UNIDADE", 1, "ÚLTIMO", None, "2.02", 100_000),
+        (1000, "UNIDADE", 1, "ÚLTIMO", None, "2.03", 250_000),
+        (2000, "UNIDADE", 1, "ÚLTIMO", None, "2.01", 100_000),
+        (2000, "UNIDADE", 1, "ÚLTIMO", None, "2.02", 300_000),
+        (2000, "UNIDADE", 1, "ÚLTIMO", None, "2.03", 400_000),
+    ])
+    # Trimestre (abr-jun) e acumulado do ano (jan-jun) na mesma DT_REFER
+    _itr_csv(data, "DRE", [
+        (1000, "MIL", 1, "ÚLTIMO", "2024-04-01", "3.01", 40),
+        (1000, "MIL", 1, "ÚLTIMO", "2024-04-01", "3.11", 4),
+        (1000, "MIL", 1, "ÚLTIMO", "2024-01-01", "3.01", 100),
+        (1000, "MIL", 1, "ÚLTIMO", "2024-01-01", "3.11", 10),
+        (2000, "UNIDADE", 1, "ÚLTIMO", "2024-04-01", "3.01", 90_000),
+        (2000, "UNIDADE", 1, "ÚLTIMO", "2024-04-01", "3.11", 9_000),
+        (2000, "UNIDADE", 1, "ÚLTIMO", "2024-01-01", "3.01", 200_000),
+        (2000, "UNIDADE", 1, "ÚLTIMO", "2024-01-01", "3.11", 20_000),
+    ])
+
+    df = client.load_indicators([2024], Scope.CON, DocType.ITR)
+
+    assert df["CD_CVM"].tolist() == [1000, 2000]
+    assert (df["DT_REFER"] == pd.Timestamp("2024-06-30")).all()
+    esperado = {
+        # 1.01 (v2) / 2.01 = 300 mil / 150.000
+        "liquidez_corrente": [300_000 / 150_000, 400_000 / 100_000],
+        # (2.01 + 2.02) / 1 = 250.000 / 500 mil
+        "endividamento": [250_000 / 500_000, 400_000 / 800_000],
+        # Acumulado do ano, não o trimestre
+        "roe": [10_000 / 250_000, 20_000 / 400_000],
+        "margem_liquida": [10 / 100, 20_000 / 200_000],
+    }
+    for nome, valores in esperado.items():
+        assert df[nome].tolist() == pytest.approx(valores), nome
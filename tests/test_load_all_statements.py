@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import zipfile
+
+import pandas as pd
+import pytest
+
+from dados_cvm.client import CVMClient
+from dados_cvm.endpoints import DocType, Scope, StatementType, UrlBuilder
+
+pytest.importorskip("pyarrow")
+
+_HEADER = (
+    "CNPJ_CIA;DT_REFER;VERSAO;DENOM_CIA;CD_CVM;GRUPO_DFP;MOEDA;ESCALA_MOEDA;"
+    "ORDEM_EXERC;DT_FIM_EXERC;CD_CONTA;DS_CONTA;VL_CONTA;ST_CONTA_FIXA"
+)
+
+
+def _bpa(n_rows: int) -> bytes:
+    """BPA sintético com `n_rows` linhas (60 contas por companhia e exercício)."""
+    linhas = [_HEADER]
+    for i in range(n_rows):
+        cia, conta = divmod(i, 120)
+        ordem = "ÚLTIMO" if conta < 60 else "PENÚLTIMO"
+        linhas.append(
+            f"{cia:08d}/0001-00;2024-12-31;1;COMPANHIA SINTÉTICA {cia};{1000 + cia};"
+            f"DF Consolidado - Balanço Patrimonial Ativo;REAL;MIL;{ordem};2024-12-31;"
+            f"1.{conta % 60:02d};Conta {conta % 60} - Descrição Sintética;{i * 1.5};S"
+        )
+    return ("\n".join(linhas) + "\n").encode("latin1")
+
+
+@pytest.fixture
+def client(tmp_path):
+    return CVMClient(data_dir=tmp_path)
+
+
+def test_load_all_statements_csv_maior_que_um_bloco(client, tmp_path):
+    # Acima de 1 MB o leitor do pyarrow gera vários blocos, cada um com o próprio dicionário
+    for scope in ("con", "ind"):
+        (tmp_path / f"dfp_cia_aberta_BPA_{scope}_2024.csv").write_bytes(_bpa(20_000))
+    assert (tmp_path / "dfp_cia_aberta_BPA_con_2024.csv").stat().st_size > 2**20
+
+    result = client.load_all_statements(2024, DocType.DFP, statements=[StatementType.BPA], max_workers=2)
+
+    assert set(result) == {(StatementType.BPA, Scope.CON), (StatementType.BPA, Scope.IND)}
+    for (statement, scope), df in result.items():
+        expected = client.load_statement(2024, statement, scope, DocType.DFP)
+        pd.testing.assert_frame_equal(df, expected, check_categorical=False)
+
+
+def test_load_all_statements_from_zip(client, tmp_path):
+    with zipfile.ZipFile(tmp_path / UrlBuilder.zip_filename(DocType.DFP, 2024), "w") as zf:
+        zf.writestr("dfp_cia_aberta_BPA_con_2024.csv", _bpa(2_000))
+    result = client.load_all_statements(2024, DocType.DFP, from_zip=True, scopes=[Scope.CON])
+    assert list(result) == [(StatementType.BPA, Scope.CON)]
+    assert len(result[(StatementType.BPA, Scope.CON)]) == 2_000
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from dados_cvm.endpoints import DocType, Scope, StatementType
+from dados_cvm.utils import build_mask, concat_frames
+
+_ANOS = [2022, 2023, 2024]
+
+
+@pytest.fixture
+def tres_anos(make_data):
+    for seed, ano in enumerate(_ANOS):
+        make_data("itr", ano, 3_000, statements=("BPA",), seed=seed)
+
+
+def _esperado(client, filters, cols=None) -> pd.DataFrame:
+    """Leitura completa de cada ano, concatenada e filtrada por máscara."""
+    df = concat_frames([client.load_statement(ano, StatementType.BPA, Scope.CON, DocType.ITR) for ano in _ANOS])
+    df = df[build_mask(df, filters)].reset_index(drop=True)
+    return df[cols] if cols is not None else df
+
+
+@pytest.mark.parametrize(
+    "filters, cols",
+    [
+        ({"ORDEM_EXERC": "ÚLTIMO"}, None),
+        ({"CD_CONTA": ["1", "1.01"], "ORDEM_EXERC": "PENÚLTIMO"}, ["CD_CVM", "DT_REFER", "VL_CONTA"]),
+    ],
+)
+def test_filtros_iguais_a_concat_e_mascara(tres_anos, client, filters, cols):
+    result = client.load_statements(
+        _ANOS, StatementType.BPA, Scope.CON, DocType.ITR, filters=filters, cols=cols, chunksize=700, max_workers=2
+    )
+    esperado = _esperado(client, filters, cols)
+
+    assert 0 < len(result) < sum(
+        len(client.load_statement(ano, StatementType.BPA, Scope.CON, DocType.ITR)) for ano in _ANOS
+    )
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), esperado, check_categorical=False)
+
+
+def test_filtro_por_companhias(tres_anos, client):
+    df = client.load_statement(2024, StatementType.BPA, Scope.CON, DocType.ITR)
+    companhias = [int(c) for c in df["CD_CVM"].drop_duplicates().iloc[[0, -1]]]
+    filters = {"CD_CVM": companhias}
+
+    result = client.load_statements(_ANOS, StatementType.BPA, Scope.CON, DocType.ITR, filters=filters)
+    assert set(result["CD_CVM"]) == set(companhias)
+    # Colunas categóricas continuam categóricas depois da união entre os anos
+    assert result["CD_CONTA"].dtype == "category"
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), _esperado(client, filters), check_categorical=False)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pytest
+
+from dados_cvm.metrics import DISABLED, Instrumentation
+
+
+def test_iterate_interrompido_nao_e_erro():
+    medidas = []
+    instr = Instrumentation([medidas.append])
+    for _ in instr.iterate(instr.stage("read_csv"), [[1, 2], [3]]):
+        break
+    assert len(medidas) == 1
+    assert medidas[0].error is None
+    assert medidas[0].rows == 2
+
+
+def test_etapa_com_excecao_registra_erro():
+    medidas = []
+    instr = Instrumentation([medidas.append])
+    with pytest.raises(KeyError):
+        with instr.stage("read_csv"):
+            raise KeyError("x")
+    assert medidas[0].error == "KeyError"
+
+
+def test_disabled_imutavel():
+    with pytest.raises(RuntimeError):
+        DISABLED.add_sink(print)
+    with pytest.raises(RuntimeError):
+        DISABLED.track_memory = True
+    assert not DISABLED.enabled and DISABLED.track_memory is False
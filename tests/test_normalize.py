@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from dados_cvm.normalize import CVM_DATE_FORMAT, standardize_dataframe
+
+
+@pytest.mark.filterwarnings("ignore:Parsing dates")
+def test_standardize_dataframe_infere_formato_por_padrao():
+    df = pd.DataFrame({"DT_REFER": ["31/12/2024", "30/06/2024"]})
+    out = standardize_dataframe(df, date_cols=["dt_refer"])
+    assert out["dt_refer"].notna().all()
+
+
+def test_standardize_dataframe_formato_cvm():
+    df = pd.DataFrame({"DT_REFER": ["2024-12-31"], "VL_CONTA": ["1.5"]})
+    out = standardize_dataframe(df, date_cols=["dt_refer"], numeric_cols=["vl_conta"], date_format=CVM_DATE_FORMAT)
+    assert out["dt_refer"].iloc[0] == pd.Timestamp("2024-12-31")
+    assert out["vl_conta"].iloc[0] == 1.5
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import zipfile
+
+import pandas as pd
+import pytest
+
+from dados_cvm.dedup import LatestVersionFilter
+from dados_cvm.endpoints import DocType, Scope, StatementType
+from dados_cvm.read import CSVReader
+
+_HEADER = "CNPJ_CIA;DT_REFER;VERSAO;DENOM_CIA;CD_CVM;ORDEM_EXERC;CD_CONTA;DS_CONTA;VL_CONTA"
+
+
+def _linha(i: int, versao: str = "1", cd_cvm: str = "1000") -> str:
+    return f"00.000.000/0001-00;2024-12-31;{versao};CIA;{cd_cvm};ÚLTIMO;1.{i:02d};Conta {i};{i}.5"
+
+
+@pytest.fixture
+def csv_em_branco(tmp_path):
+    """BPA com VERSAO e CD_CVM em branco em duas linhas."""
+    linhas = [_linha(i) for i in range(200)]
+    linhas[3] = _linha(3, versao="")
+    linhas[5] = _linha(5, cd_cvm="")
+    path = tmp_path / "dfp_cia_aberta_BPA_con_2024.csv"
+    path.write_text("\n".join([_HEADER, *linhas]) + "\n", encoding="latin1")
+    return path
+
+
+def _read(path, chunksize=None, **kwargs):
+    result = CSVReader.read_csv(path, statement=StatementType.BPA, sep=";", chunksize=chunksize, **kwargs)
+    return result if chunksize is None else pd.concat(list(result), ignore_index=True)
+
+
+@pytest.mark.parametrize("engine", ["c", "python", "pyarrow"])
+@pytest.mark.parametrize("chunksize", [None, 64])
+def test_inteiros_em_branco(csv_em_branco, engine, chunksize):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    df = _read(csv_em_branco, chunksize, engine=engine)
+
+    assert len(df) == 200
+    assert df["VERSAO"].dtype == "Int16" and df["CD_CVM"].dtype == "Int32"
+    assert df.index[df["VERSAO"].isna()].tolist() == [3]
+    assert df.index[df["CD_CVM"].isna()].tolist() == [5]
+
+
+@pytest.mark.parametrize("chunksize", [None, 64])
+def test_inteiros_em_branco_dentro_do_zip(csv_em_branco, tmp_path, chunksize):
+    zip_path = tmp_path / "dfp_cia_aberta_2024.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.write(csv_em_branco, csv_em_branco.name)
+    df = _read(zip_path, chunksize, member=csv_em_branco.name)
+    assert df["CD_CVM"].isna().sum() == 1 and df["VERSAO"].isna().sum() == 1
+
+
+def test_inteiros_sem_branco_mantem_tipo(tmp_path):
+    path = tmp_path / "dfp_cia_aberta_BPA_con_2024.csv"
+    path.write_text("\n".join([_HEADER, *(_linha(i) for i in range(10))]) + "\n", encoding="latin1")
+    df = _read(path)
+    assert df["VERSAO"].dtype == "Int16" and df["CD_CVM"].dtype == "Int32"
+    assert not df["CD_CVM"].isna().any()
+
+
+def test_tipo_numpy_explicito_continua_estrito(csv_em_branco):
+    with pytest.raises(ValueError):
+        _read(csv_em_branco, dtypes={"CD_CVM": "int32"})
+
+
+def test_consumidores_com_inteiros_em_branco(make_data, client, tmp_path):
+    make_data("dfp", 2024, 200, statements=("BPA",))
+    path = tmp_path / "data" / "dfp_cia_aberta_BPA_con_2024.csv"
+    linhas = path.read_text(encoding="latin1").splitlines()
+    campos = linhas[0].split(";")
+    for n, col in ((4, "VERSAO"), (6, "CD_CVM")):
+        valores = linhas[n].split(";")
+        valores[campos.index(col)] = ""
+        linhas[n] = ";".join(valores)
+    path.write_text("\n".join(linhas) + "\n", encoding="latin1")
+
+    df = client.load_statement(2024, StatementType.BPA, Scope.CON, DocType.DFP)
+    assert df["VERSAO"].isna().sum() == 1 and df["CD_CVM"].isna().sum() == 1
+
+    latest = client.load_statement(2024, StatementType.BPA, Scope.CON, DocType.DFP, latest_only=True)
+    pd.testing.assert_frame_equal(latest, LatestVersionFilter.apply(df).reset_index(drop=True))
+
+    cube = client.load_balanco(2024, StatementType.BPA, Scope.CON, DocType.DFP).to_cube()
+    assert len(cube.companies) == df["CD_CVM"].dropna().nunique()
@@ -0,0 +1,110 @@
+import zipfile
+
+import pandas as pd
+import pytest
+
+from dados_cvm.client import CVMClient
+from dados_cvm.endpoints import DocType
+from dados_cvm.sync import KEY_COLUMNS, SyncManifest
+
+
+@pytest.fixture
+def client(tmp_path):
+    return CVMClient(data_dir=tmp_path / "dados")
+
+
+@pytest.mark.parametrize(
+    "anos, doc_types, erro",
+    [
+        ([DocType.DFP], [2024], TypeError),  # ordem antiga: (doc_types, anos)
+        (["2024"], [DocType.DFP], TypeError),
+        ([True], [DocType.DFP], TypeError),
+        ([2024], ["xyz"], ValueError),
+        ([2024], [DocType.CAD], ValueError),  # o cadastro não é um ZIP
+    ],
+)
+def test_sync_valida_argumentos_antes_de_baixar(client, anos, doc_types, erro):
+    with pytest.raises(erro):
+        client.sync(anos, doc_types)
+    # Nada foi baixado nem gravado
+    assert not (client.path_data_dir / "sync_manifest.json").exists()
+
+
+def test_sync_max_workers_invalido(client):
+    with pytest.raises(ValueError):
+        client.sync([2024], [DocType.DFP], max_workers=0)
+
+
+def _zip_com_chaves(path, linhas):
+    csv = "CNPJ_CIA;DT_REFER;VERSAO;CD_CVM\n" + "\n".join(linhas) + "\n"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("dfp_cia_aberta_2024.csv", csv.encode("latin1"))
+    return path
+
+
+def test_chaves_em_branco_sao_descartadas(tmp_path):
+    zip_path = _zip_com_chaves(
+        tmp_path / "dfp.zip",
+        [
+            "00.000.000/0001-00;2024-12-31;1;1000",
+            "00.000.000/0001-00;;1;1000",  # sem DT_REFER
+            "00.000.000/0001-00;2024-12-31;;1001",  # sem VERSAO
+            "00.000.000/0001-00;2024-12-31;2;",  # sem CD_CVM
+        ],
+    )
+    keys = SyncManifest.read_keys(zip_path, "dfp_cia_aberta_2024.csv")
+
+    assert keys.to_dict("records") == [{"CD_CVM": 1000, "DT_REFER": "2024-12-31", "VERSAO": 1}]
+    assert "nan" not in set(keys["DT_REFER"])
+
+    # Sem chaves espúrias, a segunda leitura não reporta nada como novo
+    anteriores = SyncManifest.keys_from_record(SyncManifest.keys_to_record(keys))
+    assert SyncManifest.new_keys(SyncManifest.read_keys(zip_path, None), anteriores).empty
+
+
+def test_manifesto_com_chave_nula_e_ignorado():
+    record = {"CD_CVM": [1000, None], "DT_REFER": ["2024-12-31", None], "VERSAO": [1, 1]}
+    keys = SyncManifest.keys_from_record(record)
+    assert list(keys.columns) == list(KEY_COLUMNS)
+    assert len(keys) == 1
+    assert keys["CD_CVM"].dtype == "int64"
+
+
+def _chaves(pasta) -> pd.DataFrame:
+    """Chaves distintas do CSV de índice extraído, lidas por varredura completa."""
+    keys = pd.read_csv(pasta / "dfp_cia_aberta_2024.csv", sep=";", encoding="latin1", usecols=list(KEY_COLUMNS))
+    return _ordenar(keys.drop_duplicates().astype({"CD_CVM": "int64", "DT_REFER": str, "VERSAO": "int64"}))
+
+
+def _ordenar(keys: pd.DataFrame) -> pd.DataFrame:
+    return keys.sort_values(list(KEY_COLUMNS), ignore_index=True)[list(KEY_COLUMNS)]
+
+
+def test_sync_incremental_no_servidor_local(tmp_path, server):
+    server("dfp", [2024], 1_000, statements=("BPA",))
+    data = tmp_path / "dados"
+    with CVMClient(data_dir=data) as client:
+        first = client.sync([2024], [DocType.DFP])
+        (r,) = first.results
+        assert r.ok and r.changed
+        assert sorted(r.extracted) == [
+            "dfp_cia_aberta_2024.csv", "dfp_cia_aberta_BPA_con_2024.csv", "dfp_cia_aberta_BPA_ind_2024.csv"
+        ]
+        anteriores = _chaves(data)
+        pd.testing.assert_frame_equal(_ordenar(first.new_keys()), anteriores)
+
+        # Nada mudou no servidor: nenhum CSV extraído, nenhuma chave nova
+        (r,) = client.sync([2024], [DocType.DFP]).results
+        assert r.ok and not r.changed and r.extracted == [] and r.new_keys.empty
+
+        # Nova publicação com mais companhias: só as entregas novas são reportadas
+        server("dfp", [2024], 3_000, statements=("BPA",))
+        report = client.sync([2024], [DocType.DFP])
+        (r,) = report.results
+        assert r.ok and r.changed and len(r.extracted) == 3
+
+    atuais = _chaves(data)
+    novas = atuais.merge(anteriores, how="left", indicator=True)
+    novas = novas.loc[novas["_merge"] == "left_only", list(KEY_COLUMNS)].reset_index(drop=True)
+    assert len(novas) > 0
+    pd.testing.assert_frame_equal(_ordenar(report.new_keys()), _ordenar(novas))